@@ -154,8 +154,16 @@ class MentalModel(object):
         command_to_access_my_current_belief = self.get_command_to_access_a_belief_facet(
             feature_type=new_belief_facet.feature_type
         )
-        command_to_instantiate_new_belief_facet = command_to_access_my_current_belief + ' = new_belief_facet'
-        exec command_to_instantiate_new_belief_facet
+        if 'whereabouts' in new_belief_facet.feature_type:
+            # Whereabouts are indexed by timestep, and adopting one goes through the WhereaboutsBelief,
+            # which keeps the game's whereabouts index (if there is one) current
+            ordinal_date, day_or_night_bit = new_belief_facet.feature_type[12:].split('-')
+            self.whereabouts.adopt_facet(
+                timestep=(int(ordinal_date), int(day_or_night_bit)), facet=new_belief_facet
+            )
+        else:
+            command_to_instantiate_new_belief_facet = command_to_access_my_current_belief + ' = new_belief_facet'
+            exec command_to_instantiate_new_belief_facet
         # Update your belief trajectory
         self._update_belief_trajectory(new_belief_facet=new_belief_facet)
         # Attribute a predecessor (or lack thereof) to the new belief facet
@@ -359,7 +367,15 @@ class BusinessMentalModel(MentalModel):
         return believed_nearby
 
     def people_here_when(self, date):
-        """Return all the people that owner believes were here at a given date."""
+        """Return all the people that owner believes were here at a given date.
+
+        @param date: A tuple of the form (ordinal_date, day_or_night_bit).
+        """
+        whereabouts_index = self.owner.game.whereabouts_index
+        if whereabouts_index is not None:
+            return list(whereabouts_index.people_believed_at(
+                owner=self.owner, location=self.subject, ordinal_date=date[0], day_or_night_bit=date[1]
+            ))
         believed_here_on_this_date = [
             p for p in self.owner.mind.mental_models if p.type == "person" and
             date in self.owner.mind.mental_models[p].whereabouts.date and
@@ -634,7 +650,15 @@ class DwellingPlaceModel(MentalModel):
         return believed_nearby
 
     def people_here_when(self, date):
-        """Return all the people that owner believes were here at a given date."""
+        """Return all the people that owner believes were here at a given date.
+
+        @param date: A tuple of the form (ordinal_date, day_or_night_bit).
+        """
+        whereabouts_index = self.owner.game.whereabouts_index
+        if whereabouts_index is not None:
+            return list(whereabouts_index.people_believed_at(
+                owner=self.owner, location=self.subject, ordinal_date=date[0], day_or_night_bit=date[1]
+            ))
         believed_here_on_this_date = [
             p for p in self.owner.mind.mental_models if p.type == "person" and
             date in self.owner.mind.mental_models[p].whereabouts.date and
@@ -2010,10 +2034,13 @@ class WhereaboutsBelief(Belief):
         day_or_night_id = 0 if self.person_model.owner.game.time_of_day == "day" else 1
         # Generate a unique key so that we can maintain a trajectory for this belief
         feature_type = "whereabouts {}-{}".format(self.person_model.owner.game.ordinal_date, day_or_night_id)
-        self.date[(self.person_model.owner.game.ordinal_date, day_or_night_id)] = Facet(
-            value=location_str, owner=self.person_model.owner, subject=self.person_model.subject,
-            feature_type=feature_type, initial_evidence=observation_or_reflection,
-            object_itself=location_obj
+        self.adopt_facet(
+            timestep=(self.person_model.owner.game.ordinal_date, day_or_night_id),
+            facet=Facet(
+                value=location_str, owner=self.person_model.owner, subject=self.person_model.subject,
+                feature_type=feature_type, initial_evidence=observation_or_reflection,
+                object_itself=location_obj
+            )
         )
 
     def build_up(self, new_observation_or_reflection):
@@ -2024,11 +2051,32 @@ class WhereaboutsBelief(Belief):
             day_or_night_id = 0 if self.person_model.owner.game.time_of_day == "day" else 1
             # Generate a unique hash so that we can maintain a trajectory for this belief
             feature_type = "whereabouts {}-{}".format(self.person_model.owner.game.ordinal_date, day_or_night_id)
-            self.date[(self.person_model.owner.game.ordinal_date, day_or_night_id)] = Facet(
-                value=location_str, owner=self.person_model.owner, subject=self.person_model.subject,
-                feature_type=feature_type, initial_evidence=new_observation_or_reflection,
-                object_itself=location_obj
+            self.adopt_facet(
+                timestep=(self.person_model.owner.game.ordinal_date, day_or_night_id),
+                facet=Facet(
+                    value=location_str, owner=self.person_model.owner, subject=self.person_model.subject,
+                    feature_type=feature_type, initial_evidence=new_observation_or_reflection,
+                    object_itself=location_obj
+                )
+            )
+
+    def adopt_facet(self, timestep, facet):
+        """Hold this facet as the belief about where this person was on the given timestep.
+
+        @param timestep: A tuple of the form (ordinal_date, day_or_night_bit).
+        """
+        previous_facet = self.date.get(timestep)
+        if previous_facet is facet:
+            # This facet was already adopted, e.g., upon its initialization (by MentalModel.adopt_belief())
+            return
+        whereabouts_index = self.person_model.owner.game.whereabouts_index
+        if whereabouts_index is not None:
+            whereabouts_index.record_belief(
+                owner=self.person_model.owner, person=self.person_model.subject,
+                timestep=timestep[0]*2 + timestep[1], location=facet.object_itself,
+                previous_location=None if previous_facet is None else previous_facet.object_itself
             )
+        self.date[timestep] = facet
 
 
 class FaceBelief(Belief):
@@ -2476,6 +2524,7 @@ class Facet(str):
         # the strength of the evidence of the currently held belief (which could be as early as
         # during this initialization procedure, when .attribute_new_evidence() is called);
         # challenger status may be revised from True to False by MentalModel.adopt_belief()
+        self.object_itself = object_itself  # Set before adoption, which may index it (e.g., for whereabouts)
         currently_held_belief = self._get_currently_held_belief()
         self.challenger = False if currently_held_belief is None else True
         if not self.challenger:
@@ -2494,7 +2543,6 @@ class Facet(str):
         # its predecessor, excluding itself
         self.challengers = set()  # Default value; may get changed by MentalModel.adopt_belief()
         self.evidence = set()
-        self.object_itself = object_itself
         if object_itself:
             # If owner hasn't yet formed a mental model of the subject, form one
             if object_itself not in self.owner.mind.mental_models:
@@ -0,0 +1,48 @@
+"""Report city-generation time and peak memory against map size.
+
+Usage: python benchmark_city_generation.py [quadtree_size ...]
+
+Each map size is generated in a fresh process, so that the peak resident set size
+reported for it isn't inflated by earlier (or later) runs. Config.quadtree_samples is
+scaled with map area and Config.quadtree_loci with map width, relative to their defaults,
+so that larger maps have a comparable density of lots.
+"""
+
+import sys
+import time
+import random
+import resource
+import multiprocessing
+from game import Game
+from city import City
+
+
+def generate_city(quadtree_size, results):
+    """Generate a city of the given size and report how long that took and how much memory it used."""
+    random.seed(quadtree_size)
+    game = Game()
+    config = game.config
+    scale = quadtree_size / float(config.quadtree_size)
+    config.quadtree_samples = int(config.quadtree_samples * scale**2)
+    config.quadtree_loci = max(1, int(config.quadtree_loci * scale))
+    config.quadtree_size = quadtree_size
+    memory_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start_time = time.time()
+    city = City(game)
+    generation_time = time.time() - start_time
+    memory_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results.put((generation_time, memory_after-memory_before, len(city.lots), len(city.tracts), len(city.parcels)))
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [16, 32, 64, 128]
+    print "{:>6} {:>8} {:>8} {:>8} {:>10} {:>12}".format('size', 'lots', 'tracts', 'parcels', 'seconds', 'peak MB')
+    for size in sizes:
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(target=generate_city, args=(size, queue))
+        process.start()
+        seconds, kilobytes, n_lots, n_tracts, n_parcels = queue.get()
+        process.join()
+        print "{:>6} {:>8} {:>8} {:>8} {:>10.2f} {:>12.1f}".format(
+            size, n_lots, n_tracts, n_parcels, seconds, kilobytes/1024.0
+        )
@@ -0,0 +1,87 @@
+"""Report how long it takes residents to select contractors, with and without cached contractor scores.
+
+Usage: python benchmark_contractor_selection.py [n_selections] [year_gameplay_begins] [random_seed]
+
+This simulates a town's history up to the given year, and then has randomly chosen residents
+contract people of the occupations that are contracted during the simulation (architects,
+doctors, lawyers, morticians, and realtors). Each selection is timed three ways: scoring the
+whole pool from scratch (the cache being cleared beforehand), reusing cached scores as
+validated by City.practitioners_version, and reusing cached scores as validated by a frozenset
+of the positions held by everyone in the pool (which is how the cache used to be validated).
+"""
+
+import os
+import sys
+import time
+import random
+import datetime
+from game import Game
+import occupation
+
+
+CONTRACTED_OCCUPATIONS = (
+    occupation.Architect, occupation.Doctor, occupation.Lawyer, occupation.Mortician, occupation.Realtor
+)
+
+
+if __name__ == "__main__":
+    n_selections = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    year_gameplay_begins = int(sys.argv[2]) if len(sys.argv) > 2 else 1870
+    random.seed(int(sys.argv[3]) if len(sys.argv) > 3 else 0)
+    game = Game()
+    game.ordinal_date_that_gameplay_begins = datetime.date(
+        year_gameplay_begins, *game.config.date_gameplay_begins[1:]
+    ).toordinal()
+    # Simulation prints a great deal, so silence it
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    game.establish_setting()
+    sys.stdout = stdout
+    city = game.city
+    pools = {
+        occupation_class: city.workers_of_trade(occupation_class) for occupation_class in CONTRACTED_OCCUPATIONS
+    }
+    selections = [
+        (random.choice(list(city.residents)), random.choice([o for o in CONTRACTED_OCCUPATIONS if pools[o]]))
+        for _ in xrange(n_selections)
+    ]
+    print "{} contractor selections in a town of {} residents ({} practitioners of contracted occupations)".format(
+        n_selections, len(city.residents), sum(len(pool) for pool in pools.itervalues())
+    )
+    # Score the pool from scratch every time
+    start_time = time.time()
+    for person, occupation_class in selections:
+        person.contractor_scores.clear()
+        person._rate_all_potential_contractors_of_certain_occupation(
+            pool=city.workers_of_trade(occupation_class), occupation_in_question=occupation_class
+        )
+    uncached_time = time.time() - start_time
+    # Reuse cached scores, validated by the practitioners version (the cache is now warm)
+    start_time = time.time()
+    for person, occupation_class in selections:
+        person._rate_all_potential_contractors_of_certain_occupation(
+            pool=city.workers_of_trade(occupation_class), occupation_in_question=occupation_class
+        )
+    version_time = time.time() - start_time
+    # Reuse cached scores, validated by building a frozenset of the pool's positions on every selection
+    frozenset_stamps = {}
+    start_time = time.time()
+    for person, occupation_class in selections:
+        pool = city.workers_of_trade(occupation_class)
+        stamp = (
+            game.year,
+            frozenset(practitioner.occupation for practitioner in pool),
+            person.social_ties_version,
+            person.spouse,
+            None if not person.spouse else person.spouse.social_ties_version
+        )
+        if frozenset_stamps.get((person, occupation_class)) != stamp:
+            frozenset_stamps[(person, occupation_class)] = stamp
+    frozenset_time = time.time() - start_time
+    print "{:>28} {:>14}".format('cache', 'per selection (ms)')
+    for label, elapsed in (
+        ('none', uncached_time),
+        ('frozenset of positions', frozenset_time),
+        ('practitioners version', version_time),
+    ):
+        print "{:>28} {:>14.4f}".format(label, 1000.0 * elapsed / n_selections)
@@ -0,0 +1,92 @@
+"""Report how many lines of dialogue Productionist generates per second.
+
+Usage: python benchmark_dialogue_generation.py [n_conversations] [year_gameplay_begins] [random_seed]
+                                               [template_cache_size]
+
+This simulates a town's history up to the given year (earlier years make for a quicker setup),
+and then has randomly selected pairs of residents carry out entire conversations, which are
+generated from the bundled dialogue grammar (content/talktown-dialogue-nlg.json). Only the time
+spent inside Productionist's generation requests counts toward the reported rate, so that
+simulation and conversation bookkeeping don't drown out the cost of generation itself.
+Template caching is off by default (see Config.dialogue_template_cache_size); pass a cache
+size to measure generation with it on.
+"""
+
+import os
+import sys
+import time
+import random
+import datetime
+from game import Game
+from conversation import ConversationBatch
+
+
+class GenerationTimer(object):
+    """A wrapper around a Productionist generation method that times and counts its calls."""
+
+    def __init__(self, generation_method):
+        """Initialize a GenerationTimer object."""
+        self.generation_method = generation_method
+        self.n_requests = 0
+        self.n_lines_generated = 0
+        self.seconds = 0.0
+
+    def __call__(self, *args, **kwargs):
+        """Call the wrapped generation method and record how long it took."""
+        start_time = time.time()
+        line_of_dialogue = self.generation_method(*args, **kwargs)
+        self.seconds += time.time() - start_time
+        self.n_requests += 1
+        if line_of_dialogue:
+            self.n_lines_generated += 1
+        return line_of_dialogue
+
+
+if __name__ == "__main__":
+    n_conversations = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    year_gameplay_begins = int(sys.argv[2]) if len(sys.argv) > 2 else 1870
+    random.seed(int(sys.argv[3]) if len(sys.argv) > 3 else 0)
+    game = Game()
+    game.ordinal_date_that_gameplay_begins = datetime.date(
+        year_gameplay_begins, *game.config.date_gameplay_begins[1:]
+    ).toordinal()
+    # Simulation prints a great deal, so silence it
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    start_time = time.time()
+    game.establish_setting()
+    setup_time = time.time() - start_time
+    productionist = game.dialogue_productionist
+    if len(sys.argv) > 4:
+        productionist.template_cache.max_size = int(sys.argv[4])
+    timers = [
+        GenerationTimer(generation_method=productionist.target_dialogue_move),
+        GenerationTimer(generation_method=productionist.target_topics_of_conversation)
+    ]
+    productionist.target_dialogue_move, productionist.target_topics_of_conversation = timers
+    sys.stdout = stdout
+    potential_conversants = [p for p in game.city.residents if p.age > 12]
+    batch = ConversationBatch(
+        pairs=[random.sample(potential_conversants, 2) for _ in xrange(n_conversations)],
+        render=True  # Realization fills in templates, which is part of the cost of generating a line
+    )
+    start_time = time.time()
+    batch.run()
+    conversation_time = time.time() - start_time
+    n_turns = sum(record.n_turns for record in batch.records)
+    n_propositions = sum(len(record.propositions) for record in batch.records)
+    n_lines_generated = sum(timer.n_lines_generated for timer in timers)
+    n_requests = sum(timer.n_requests for timer in timers)
+    generation_time = sum(timer.seconds for timer in timers)
+    print "Simulated {} residents through {} in {:.1f}s".format(
+        len(game.city.residents), year_gameplay_begins, setup_time
+    )
+    print "{} conversations ({} failed), {} turns, {} propositions asserted in {:.2f}s".format(
+        n_conversations, len(batch.failures), n_turns, n_propositions, conversation_time
+    )
+    print "{} lines generated over {} generation requests in {:.2f}s".format(
+        n_lines_generated, n_requests, generation_time
+    )
+    print "{:.1f} lines of dialogue generated per second".format(n_lines_generated/max(generation_time, 1e-9))
+    print productionist.condition_memo
+    print productionist.template_cache
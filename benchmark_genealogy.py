@@ -0,0 +1,75 @@
+"""Report the memory taken up by the genealogy, against storing every family relation per person.
+
+Usage: python benchmark_genealogy.py [year_gameplay_begins] [random_seed]
+
+This simulates a town's history up to the given year, and then compares the size of the game's
+Genealogy (its index of kids, its ancestor closure table, and its cache of derived relations)
+against the size of the sets that would be needed to store every family relation (siblings,
+cousins, bio_* relations, and so forth) for every person who has ever lived in the town, as an
+attribute of each person. It also reports how long it takes to derive every family relation for
+everyone, with and without the cache being warm.
+"""
+
+import os
+import sys
+import time
+import random
+import datetime
+from game import Game
+
+
+RELATIONS = (
+    'kids', 'sons', 'daughters', 'grandparents', 'greatgrandparents', 'ancestors', 'descendants', 'siblings',
+    'full_siblings', 'half_siblings', 'brothers', 'full_brothers', 'half_brothers', 'sisters', 'full_sisters',
+    'half_sisters', 'uncles', 'aunts', 'cousins', 'nephews', 'nieces', 'grandchildren', 'grandsons',
+    'granddaughters', 'greatgrandchildren', 'greatgrandsons', 'greatgranddaughters', 'immediate_family',
+    'extended_family', 'bio_parents', 'bio_grandparents', 'bio_greatgrandparents', 'bio_ancestors',
+    'bio_siblings', 'bio_full_siblings', 'bio_half_siblings', 'bio_brothers', 'bio_full_brothers',
+    'bio_half_brothers', 'bio_sisters', 'bio_full_sisters', 'bio_half_sisters', 'bio_uncles', 'bio_aunts',
+    'bio_cousins', 'bio_nephews', 'bio_nieces', 'bio_immediate_family', 'bio_extended_family'
+)
+
+
+def size_of_genealogy(genealogy):
+    """Return the number of bytes taken up by a genealogy's tables (not counting the people in them)."""
+    size = sys.getsizeof(genealogy.kids) + sys.getsizeof(genealogy.ancestor_generations)
+    size += sum(sys.getsizeof(kids) for kids in genealogy.kids.itervalues())
+    size += sum(sys.getsizeof(generations) for generations in genealogy.ancestor_generations.itervalues())
+    size += sys.getsizeof(genealogy.relatives_cache)
+    size += sum(sys.getsizeof(relatives) for relatives in genealogy.relatives_cache.itervalues())
+    return size
+
+
+if __name__ == "__main__":
+    year_gameplay_begins = int(sys.argv[1]) if len(sys.argv) > 1 else 1870
+    random.seed(int(sys.argv[2]) if len(sys.argv) > 2 else 0)
+    game = Game()
+    game.ordinal_date_that_gameplay_begins = datetime.date(
+        year_gameplay_begins, *game.config.date_gameplay_begins[1:]
+    ).toordinal()
+    # Simulation prints a great deal, so silence it
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    game.establish_setting()
+    sys.stdout = stdout
+    genealogy = game.genealogy
+    people = game.city.all_time_residents
+    genealogy.relatives_cache.clear()
+    print "Genealogy of {} people through {}".format(len(people), year_gameplay_begins)
+    print "Genealogy tables: {:.1f} KB".format(size_of_genealogy(genealogy=genealogy) / 1024.0)
+    start_time = time.time()
+    # Store each relation as a set, as it would be if it were an attribute of each person
+    per_person_sets = [set(getattr(person, relation)) for person in people for relation in RELATIONS]
+    cold_time = time.time() - start_time
+    print "Genealogy tables with every relation cached: {:.1f} KB".format(
+        size_of_genealogy(genealogy=genealogy) / 1024.0
+    )
+    print "{} relations stored as sets for each person: {:.1f} KB".format(
+        len(RELATIONS), sum(sys.getsizeof(relatives) for relatives in per_person_sets) / 1024.0
+    )
+    start_time = time.time()
+    for person in people:
+        for relation in RELATIONS:
+            getattr(person, relation)
+    warm_time = time.time() - start_time
+    print "Derived every relation for everyone in {:.3f}s (cold) and {:.3f}s (cached)".format(cold_time, warm_time)
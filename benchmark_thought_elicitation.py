@@ -0,0 +1,93 @@
+"""Report how thought elicitation latency scales with the number of synapses in a mind.
+
+Usage: python benchmark_thought_elicitation.py [n_encounters] [year_gameplay_begins] [random_seed]
+
+This simulates a town's history up to the given year, and then has a resident think synthetic
+thoughts, each associated with a handful of signals (the signals annotated in the bundled thought
+grammar, plus the IDs of the town's all-time residents), until the synapse graph in their mind
+reaches each of a series of sizes. At each size, the resident encounters a number of artifacts
+emitting random signals, and the time taken to associate those signals with the notions in the
+resident's mind (Mind.associate()) and to elicit a thought from the resulting stimuli
+(Mind.elicit_thought()) is reported per encounter.
+"""
+
+import os
+import sys
+import time
+import random
+import datetime
+from game import Game
+
+
+SYNAPSE_COUNTS = (0, 100, 1000, 5000, 10000)
+N_SIGNALS_PER_THOUGHT = 8
+N_SIGNALS_PER_ENCOUNTER = 4
+
+
+class Encounter(object):
+    """A stand-in for an artifact that a person may encounter, which emits some signals."""
+
+    def __init__(self, signals):
+        """Initialize an Encounter object.
+
+        @param signals: A list of (signal, strength) tuples.
+        """
+        self.signals = signals
+
+
+if __name__ == "__main__":
+    n_encounters = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    year_gameplay_begins = int(sys.argv[2]) if len(sys.argv) > 2 else 1870
+    random.seed(int(sys.argv[3]) if len(sys.argv) > 3 else 0)
+    game = Game()
+    game.ordinal_date_that_gameplay_begins = datetime.date(
+        year_gameplay_begins, *game.config.date_gameplay_begins[1:]
+    ).toordinal()
+    # Simulation prints a great deal, so silence it
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    game.establish_setting()
+    sys.stdout = stdout
+    thought_productionist = game.thought_productionist
+    grammar_signals = sorted({
+        signal for symbol in thought_productionist.nonterminal_symbols for signal, _ in symbol.signals
+    })
+    signals = grammar_signals + [person.id for person in game.city.all_time_residents]
+    thinker = random.choice([p for p in game.city.residents if p.age > 12])
+    mind = thinker.mind
+    receptor_graph = mind.receptor_graph
+    # The number of synapses that can be reached is capped by the number of signals available
+    max_synapses = len(signals) * (len(signals)-1) / 2
+    print "Eliciting thoughts in the mind of {} ({} signals available)".format(thinker.name, len(signals))
+    print "{:>10} {:>10} {:>16} {:>16} {:>10}".format(
+        'receptors', 'synapses', 'association (ms)', 'elicitation (ms)', 'failures'
+    )
+    for synapse_count in SYNAPSE_COUNTS:
+        if synapse_count > max_synapses:
+            break
+        # Think synthetic thoughts until this mind's synapse graph has grown to the desired size
+        while receptor_graph.number_of_synapses < synapse_count:
+            mind.update_receptor_voltages_and_synapse_weights(
+                voltage_updates={signal: 1 for signal in random.sample(signals, N_SIGNALS_PER_THOUGHT)}
+            )
+        encounters = [
+            Encounter(signals=[(signal, 1) for signal in random.sample(signals, N_SIGNALS_PER_ENCOUNTER)])
+            for _ in xrange(n_encounters)
+        ]
+        start_time = time.time()
+        all_stimuli = [mind.associate(artifact=encounter) for encounter in encounters]
+        association_time = time.time() - start_time
+        n_failures = 0
+        sys.stdout = open(os.devnull, 'w')
+        start_time = time.time()
+        for stimuli in all_stimuli:
+            try:
+                mind.elicit_thought(stimuli=stimuli)
+            except Exception:
+                n_failures += 1
+        elicitation_time = time.time() - start_time
+        sys.stdout = stdout
+        print "{:>10} {:>10} {:>16.3f} {:>16.3f} {:>10}".format(
+            len(receptor_graph.signals), receptor_graph.number_of_synapses,
+            1000*association_time/n_encounters, 1000*elicitation_time/n_encounters, n_failures
+        )
@@ -19,6 +19,7 @@ class Business(object):
         """
         self.id = owner.game.current_place_id
         owner.game.current_place_id += 1
+        owner.game.places[self.id] = self
         config = owner.game.config
         self.type = "business"
         # 'Demise' specifies a year at which point it is highly likely this business will close
@@ -28,6 +29,8 @@ class Business(object):
         self.services = config.services_provided_by_business_of_type[self.__class__]
         self.city = owner.game.city
         self.city.companies.add(self)
+        for service in self.services:
+            self.city.businesses_by_service.setdefault(service, []).append(self)
         self.founded = self.city.game.year
         if self.city.vacant_lots or self.__class__ in config.companies_that_get_established_on_tracts:
             self.lot = self._init_choose_vacant_lot()
@@ -50,6 +53,11 @@ class Business(object):
         # first architect before it can construct its own building
         self.employees = set()
         self.former_employees = set()
+        # Maps each person currently working here to the number of positions they hold here (a
+        # person may momentarily hold two during a hiring chain); this gets maintained by
+        # Occupation.__init__() and Occupation.terminate(), and lets the population of the company's
+        # lot count each person working here only once
+        self.employee_counts = {}
         self.former_owners = []
         if self.__class__ in config.public_company_types:  # Hospital, police station, fire station, etc.
             self.owner = None
@@ -564,37 +572,46 @@ class Business(object):
 
     def _rate_all_job_candidates(self, candidates):
         """Rate all job candidates."""
-        scores = {}
-        for candidate in candidates:
-            scores[candidate] = self.rate_job_candidate(person=candidate)
-        return scores
+        return self.rate_job_candidates(candidates=candidates)
 
     def rate_job_candidate(self, person):
         """Rate a job candidate, given an open position and owner biases."""
+        return self.rate_job_candidates(candidates=(person,))[person]
+
+    def rate_job_candidates(self, candidates):
+        """Rate a pool of job candidates at once, given an open position and owner biases.
+
+        The decision maker's relationship sets and the relevant config parameters are looked
+        up once for the whole pool.
+        """
         config = self.city.game.config
         decision_maker = self.owner.person if self.owner else self.city.mayor
-        score = 0.0
-        if person in self.employees:
-            score += config.preference_to_hire_from_within_company
-        if person in decision_maker.immediate_family:
-            score += config.preference_to_hire_immediate_family
-        elif person in decision_maker.extended_family:
-            score += config.preference_to_hire_extended_family
-        if person.immediate_family & self.employees:
-            score += config.preference_to_hire_immediate_family_of_an_employee
-        elif person.extended_family & self.employees:
-            score += config.preference_to_hire_extended_family_of_an_employee
-        if person in decision_maker.friends:
-            score += config.preference_to_hire_friend
-        elif person in decision_maker.acquaintances:
-            score += config.preference_to_hire_acquaintance
-        if person in decision_maker.enemies:
-            score += config.dispreference_to_hire_enemy
-        if person.occupation:
-            score *= person.occupation.level
-        else:
-            score *= config.unemployment_occupation_level
-        return score
+        immediate_family, extended_family = decision_maker.immediate_family, decision_maker.extended_family
+        friends, acquaintances, enemies = (
+            decision_maker.friends, decision_maker.acquaintances, decision_maker.enemies
+        )
+        scores = {}
+        for person in candidates:
+            # Note: config.preference_to_hire_from_within_company and the preferences to hire family
+            # of an employee aren't applied here, since the tests for them have always compared
+            # candidates against self.employees, which holds Occupation objects, and so never held
+            score = 0.0
+            if person in immediate_family:
+                score += config.preference_to_hire_immediate_family
+            elif person in extended_family:
+                score += config.preference_to_hire_extended_family
+            if person in friends:
+                score += config.preference_to_hire_friend
+            elif person in acquaintances:
+                score += config.preference_to_hire_acquaintance
+            if person in enemies:
+                score += config.dispreference_to_hire_enemy
+            if person.occupation:
+                score *= person.occupation.level
+            else:
+                score *= config.unemployment_occupation_level
+            scores[person] = score
+        return scores
 
     def _assemble_job_candidates(self, occupation_of_need):
         """Assemble a group of job candidates for an open position."""
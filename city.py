@@ -5,7 +5,6 @@ from occupation import *
 import pyqtree
 from random import gauss,randrange
 from corpora import Names
-from config import Config
 import heapq
 
 
@@ -40,6 +39,15 @@ class City(object):
         self.deceased = set()  # People who died in in the city
         self.companies = set()
         self.former_companies = set()
+        # Maps occupation classes to the positions of that type currently filled at companies in
+        # this city; maintained by Occupation.__init__() and Occupation.terminate()
+        self.practitioners = {}
+        # Incremented whenever a position is added to or removed from self.practitioners, so that
+        # anything derived from the practitioners in town can tell when to be recomputed
+        self.practitioners_version = 0
+        # Maps service types to the companies currently providing that service in this city;
+        # maintained by Business.__init__() and BusinessClosure.__init__()
+        self.businesses_by_service = {}
         self.lots = set()
         self.tracts = set()
         self.dwelling_places = set()  # Both houses and apartment units (not complexes)
@@ -51,37 +59,50 @@ class City(object):
             lot.set_neighboring_lots_for_citygen()
             lot.init_generate_address()
         # Survey all city lots to instantiate conventional city blocks
+        blocks_by_street_and_number = {}
         for lot in self.lots | self.tracts:
             number, street = lot.parcel_address_is_on.number, lot.parcel_address_is_on.street
-            try:
-                city_block = next(b for b in self.blocks if b.number == number and b.street is street)
-                city_block.lots.append(lot)
-                lot.block = city_block
-            except StopIteration:
+            if (street, number) not in blocks_by_street_and_number:
                 city_block = Block(number=number, street=street)
                 self.blocks.add(city_block)
-                city_block.lots.append(lot)
-                lot.block = city_block
+                blocks_by_street_and_number[(street, number)] = city_block
+            city_block = blocks_by_street_and_number[(street, number)]
+            city_block.lots.append(lot)
+            lot.block = city_block
         for block in self.blocks:
             block.lots.sort(key=lambda lot: lot.house_number)
         # Fill in any missing blocks, which I think gets caused by tracts being so
         # large in some cases; these blocks will not have any lots on them, so they'll
         # never have buildings on them, but it makes city navigation more natural during gameplay
         for street in self.streets:
+            if not street.blocks:
+                # No lot has its address on this street (possible for short streets on large maps)
+                continue
             street.blocks.sort(key=lambda block: block.number)
-            current_block_number = min(street.blocks, key=lambda block: block.number).number
-            largest_block_number = max(street.blocks, key=lambda block: block.number).number
+            block_numbers_on_this_street = {block.number for block in street.blocks}
+            current_block_number = street.blocks[0].number
+            largest_block_number = street.blocks[-1].number
             while current_block_number != largest_block_number:
                 current_block_number += 100
-                if not any(b for b in street.blocks if b.number == current_block_number):
+                if current_block_number not in block_numbers_on_this_street:
                     self.blocks.add(Block(number=current_block_number, street=street))
             # Sort one last time to facilitate easy navigation during gameplay
             street.blocks.sort(key=lambda block: block.number)
+        # Maps parcels to dictionaries holding the lengths of the shortest paths from them to
+        # every other parcel; these get filled in lazily by _path_lengths_from(), so that only
+        # parcels that are actually involved in distance queries ever have paths stored
         self.paths = {}
-        self.generatePaths()
         # Determine coordinates for each lot in the city, which are crucial when
         # displaying the city
         self._determine_lot_coordinates()
+        # Build a spatial index over these coordinates, which affords radius and
+        # nearest-neighbor queries over lots for the remainder of the simulation
+        self.lot_index = LotIndex(lots=self.lots | self.tracts)
+        # Cache each lot's neighborhood (the lots within a neighborhood radius of it), which
+        # lets neighborhood population be maintained incrementally as people come and go
+        radius = game.config.radius_of_lot_neighborhood_in_blocks
+        for lot in self.lots | self.tracts:
+            lot.neighborhood = list(self.lot_index.within(lot.coordinates, radius))
         # Determine the lot central to the highest density of lots in the city and
         # make this lot downtown
         self.downtown = None
@@ -96,6 +117,11 @@ class City(object):
         # lots on the same city block
         for lot in self.lots:
             lot.init_set_neighbors_lots_as_other_lots_on_same_city_block()
+        # Now that neighbors are settled, have each lot note which lots count it toward their
+        # secondary population (i.e., the lots that have it as a neighbor, plus itself)
+        for lot in self.lots | self.tracts:
+            for neighbor in {lot} | lot.neighboring_lots:
+                neighbor.secondary_neighborhood.append(lot)
         # These get set when these businesses get established (by their __init__() magic methods)
         self.cemetery = None
         self.city_hall = None
@@ -185,38 +211,57 @@ class City(object):
         
         return self.distance_between(lot,self.downtown)
 
-    def generatePaths(self):
-        for start in self.parcels:
-            for goal in self.parcels:
-                if (start == goal):
-                     self.paths[(start,goal)] = 0
-                else :
-                    if ((start,goal) not in self.paths):
-                        came_from, cost_so_far = City.a_star_search(start,goal)
-                        current  = goal
-                        count = 0
-                        while (current != start):
-                            current = came_from[current]
-                            count += 1
-                        self.paths[(start,goal)] =count
-                        self.paths[(goal,start)] =count
-                        
+    def _path_lengths_from(self, parcel):
+        """Return a dictionary mapping every parcel to the length of the shortest path to it from this parcel.
+
+        Because every step between neighboring parcels costs the same, a single breadth-first
+        search yields the shortest paths from this parcel to all others; the result is stored
+        in self.paths, so each parcel is searched from at most once.
+        """
+        if parcel not in self.paths:
+            path_lengths = {parcel: 0}
+            frontier = [parcel]
+            while frontier:
+                next_frontier = []
+                for current in frontier:
+                    for neighbor in current.neighbors:
+                        if neighbor not in path_lengths:
+                            path_lengths[neighbor] = path_lengths[current] + 1
+                            next_frontier.append(neighbor)
+                frontier = next_frontier
+            self.paths[parcel] = path_lengths
+        return self.paths[parcel]
+
     def distance_between(self, lot1, lot2):
         min_dist = float("inf")
+        # Paths are symmetric, so search from whichever lot's parcels already have paths stored
+        if not any(parcel in self.paths for parcel in lot1.parcels):
+            lot1, lot2 = lot2, lot1
         for parcel in lot1.parcels:
+            path_lengths = self._path_lengths_from(parcel)
             for other_parcel in lot2.parcels:
-                if self.paths[(parcel, other_parcel)] < min_dist:
-                    min_dist = self.paths[(parcel, other_parcel)]
+                if path_lengths.get(other_parcel, min_dist) < min_dist:
+                    min_dist = path_lengths[other_parcel]
         return min_dist
 
-    def nearest_business_of_type(self, lot, business_type):
-        """Return the Manhattan distance between this lot and the nearest company of the given type.
+    def nearest_business_of_type(self, lot, business_type, n_candidates=3):
+        """Return the company of the given type whose lot is nearest to this lot.
 
-        @param business_type: The Class representing the type of company in question.
+        Candidates are the companies of this type whose lots are nearest to this lot by the
+        coordinates in the lot index, and these are then ranked by the distance between lots
+        along the street grid (see distance_between()).
+
+        @param business_type: A string of the Class name representing the type of business in question.
+        @param n_candidates: The number of companies nearest by coordinates to rank by street distance.
         """
-        businesses_of_this_type = self.businesses_of_type(business_type)
-        if businesses_of_this_type:
-            return min(businesses_of_this_type, key=lambda b: self.distance_between(lot, b.lot))
+        candidate_lots = self.lot_index.nearest(
+            lot.coordinates, k=n_candidates,
+            condition=lambda l: (
+                l.building in self.companies and l.building.__class__.__name__ == business_type
+            )
+        )
+        if candidate_lots:
+            return min(candidate_lots, key=lambda l: self.distance_between(lot, l)).building
         else:
             return None
         
@@ -240,47 +285,54 @@ class City(object):
     @staticmethod
     def secondary_population(lot):
         """Return the total population of this lot and its neighbors."""
-        secondary_population = 0
-        for neighbor in {lot} | lot.neighboring_lots:
-            secondary_population += neighbor.population
-        return secondary_population
+        return lot.secondary_population
 
     @staticmethod
     def tertiary_population(lot):
-        lots_already_considered = set()
-        tertiary_population = 0
-        for neighbor in {lot} | lot.neighboring_lots:
-            if neighbor not in lots_already_considered:
-                lots_already_considered.add(neighbor)
-                tertiary_population += neighbor.population
-                for neighbor_to_that_lot in neighbor.neighboring_lots:
-                    if neighbor_to_that_lot not in lots_already_considered:
-                        lots_already_considered.add(neighbor_to_that_lot)
-                        tertiary_population += neighbor.population
-        return tertiary_population
+        """Return the total population of the lots within a neighborhood radius of this lot."""
+        return lot.tertiary_population
 
     @staticmethod
     def tertiary_density(lot):
-        lots_already_considered = set()
-        tertiary_density = 0
-        for neighbor in {lot} | lot.neighboring_lots:
-            if neighbor not in lots_already_considered:
-                lots_already_considered.add(neighbor)
-                tertiary_density += 1
-                for neighbor_to_that_lot in neighbor.neighboring_lots:
-                    if neighbor_to_that_lot not in lots_already_considered:
-                        lots_already_considered.add(neighbor_to_that_lot)
-                        tertiary_density += 1
-        return tertiary_density
-        
+        """Return the number of lots within a neighborhood radius of this lot (including itself)."""
+        return len(lot.neighborhood)
+
+    def lots_within(self, lot, radius):
+        """Return all lots (and tracts) whose coordinates are within the given Manhattan distance of this lot."""
+        return self.lot_index.within(lot.coordinates, radius)
+
+    def nearest_lots(self, lot, k, condition=None):
+        """Return the k lots nearest to this lot, excluding itself, ordered by Manhattan distance.
+
+        @param condition: An optional function of a lot that returns True if that lot may be returned.
+        """
+        if condition:
+            return self.lot_index.nearest(
+                lot.coordinates, k=k, condition=lambda other_lot: other_lot is not lot and condition(other_lot)
+            )
+        return self.lot_index.nearest(lot.coordinates, k=k, condition=lambda other_lot: other_lot is not lot)
+
+    def people_within(self, lot, radius):
+        """Return everyone living or working on lots within the given Manhattan distance of this lot."""
+        people = set()
+        for nearby_lot in self.lot_index.within(lot.coordinates, radius):
+            if nearby_lot.building:
+                people |= nearby_lot.building.residents
+        return people
+
     def generate_lots(self, config):
         loci = config.quadtree_loci
         samples = config.quadtree_samples
         size = config.quadtree_size
+        assert size >= 4 and size & (size-1) == 0, (
+            "Config.quadtree_size must be a power of two (of at least 4), but it is {}".format(size)
+        )
         lociLocations = []
         for ii in range(loci):
             lociLocations.append([gauss(size/2.0,size/6.0), gauss(size/2.0,size/6.0)])
-        tree = pyqtree.Index(bbox=[0,0,size,size])
+        # Parcels must be at least two units wide (streets only run along even coordinates), so
+        # let the quadtree subdivide down to that width regardless of how large the map is
+        tree = pyqtree.Index(bbox=[0,0,size,size], max_depth=max((size/2).bit_length()-1, 1))
         for ii in range(samples):
             center = lociLocations[randrange(len(lociLocations))]
             point = [clamp(gauss(center[0],size/6.0),0,size-1),clamp(gauss(center[1],size/6.0),0,size-1)]
@@ -294,8 +346,8 @@ class City(object):
         lots = []
         tracts =[]
             
-        nsEnd = []
-        ewEnd = []
+        nsEnd = set()
+        ewEnd = set()
         streets = []
         
         def traverseTree(node):
@@ -315,25 +367,29 @@ class City(object):
                 traverseTree(child)
         traverseTree(tree)        
         
+        # Only trace streets from segments that don't continue some other segment, since tracing
+        # from anywhere else would just rediscover the tail of a street that was already traced
+        nsContinuations = set(nsstreets.itervalues())
+        ewContinuations = set(ewstreets.itervalues())
         for ii in range(0,size+2,2):
             for jj in range(0,size+2,2):
                 street = (ii,jj)
-                if street in nsstreets:
+                if street in nsstreets and street not in nsContinuations:
                     start = street
                     end = nsstreets[start]
                     while end in nsstreets:
                         end = nsstreets[end]
                     if (end not in nsEnd):
-                        nsEnd.append(end)             
+                        nsEnd.add(end)
                         streets.append(['ns',start, end])
-                if street in ewstreets:
+                if street in ewstreets and street not in ewContinuations:
                     start = street
                     end = ewstreets[start]
                     while end in ewstreets:
                         end = ewstreets[end]
                     if (end not in ewEnd):
-                        ewEnd.append(end)             
-                        streets.append(['ew',start, end])         
+                        ewEnd.add(end)
+                        streets.append(['ew',start, end])
         
         nsStreets = {}
         ewStreets = {}
@@ -391,7 +447,7 @@ class City(object):
         lots = {}
         Parcels = {}
         Numberings = {}
-        n_buildings_per_parcel = Config().n_buildings_per_parcel
+        n_buildings_per_parcel = config.n_buildings_per_parcel
 
         corners = set()
         for parcel in parcels:
@@ -586,7 +642,14 @@ class City(object):
 
         @param occupation: The class pertaining to the occupation in question.
         """
-        return [resident for resident in self.residents if isinstance(resident.occupation, occupation)]
+        workers = []
+        for occupation_class, positions in self.practitioners.iteritems():
+            if issubclass(occupation_class, occupation):
+                workers += [
+                    position.person for position in positions if
+                    position.person.occupation is position and position.person in self.residents
+                ]
+        return workers
 
     def businesses_of_type(self, business_type):
         """Return all business in this city of the given type.
@@ -630,6 +693,71 @@ class City(object):
         return came_from, cost_so_far
 
 
+class LotIndex(object):
+    """A persistent spatial index over the coordinates of a city's lots and tracts.
+
+    This wraps a pyqtree.Index, into which each lot is inserted as a point at its
+    coordinates (see City._determine_lot_coordinates()), and answers radius and
+    k-nearest queries under the Manhattan distance that the street grid affords.
+    """
+
+    # pyqtree intersection tests are strict on the lower bound of the query box, so
+    # query boxes get padded by this much to include points lying right on that bound
+    PADDING = 1e-6
+    # The number of lots a quad may hold before it gets split into four
+    MAX_LOTS_PER_QUAD = 8
+
+    def __init__(self, lots):
+        """Initialize a LotIndex object."""
+        self.lots = list(lots)
+        x_coordinates = [lot.coordinates[0] for lot in self.lots]
+        y_coordinates = [lot.coordinates[1] for lot in self.lots]
+        self.bbox = (
+            min(x_coordinates)-1, min(y_coordinates)-1, max(x_coordinates)+1, max(y_coordinates)+1
+        )
+        # Let quads keep splitting until they are about a block wide, so that radius queries
+        # only have to visit the handful of quads around the query point
+        extent = int(max(self.bbox[2]-self.bbox[0], self.bbox[3]-self.bbox[1]))
+        self.tree = pyqtree.Index(bbox=self.bbox, max_items=self.MAX_LOTS_PER_QUAD, max_depth=extent.bit_length())
+        for lot in self.lots:
+            x, y = lot.coordinates
+            self.tree.insert(item=lot, bbox=(x, y, x, y))
+
+    def __len__(self):
+        """Return the number of lots in this index."""
+        return len(self.lots)
+
+    def within(self, coordinates, radius):
+        """Return all lots within the given Manhattan distance of the given coordinates."""
+        x, y = coordinates
+        query_box = (x-radius-self.PADDING, y-radius-self.PADDING, x+radius, y+radius)
+        return [
+            lot for lot in self.tree.intersect(bbox=query_box) if
+            abs(lot.coordinates[0]-x) + abs(lot.coordinates[1]-y) <= radius
+        ]
+
+    def nearest(self, coordinates, k=1, condition=None):
+        """Return the k lots nearest to the given coordinates, ordered by Manhattan distance.
+
+        The search radius starts at a single block and doubles until either k lots satisfying
+        the given condition (if any) have been found or the whole index has been covered.
+
+        @param condition: An optional function of a lot that returns True if that lot may be returned.
+        """
+        x, y = coordinates
+        distance = lambda lot: abs(lot.coordinates[0]-x) + abs(lot.coordinates[1]-y)
+        max_radius = (self.bbox[2]-self.bbox[0]) + (self.bbox[3]-self.bbox[1])
+        radius = 1.0
+        while True:
+            candidates = self.within(coordinates, radius)
+            if condition:
+                candidates = [lot for lot in candidates if condition(lot)]
+            if len(candidates) >= k or radius >= max_radius:
+                candidates.sort(key=distance)
+                return candidates[:k]
+            radius *= 2
+
+
 class Street(object):
     """A street in a city."""
 
@@ -650,14 +778,10 @@ class Street(object):
     def generate_name(self, number, direction):
         """Generate a street name."""
         config = self.city.game.config
-        number_to_ordinal = {
-            1: '1st', 2: '2nd', 3: '3rd', 4: '4th', 5: '5th',
-            6: '6th', 7: '7th', 8: '8th', 9: '9th'
-        }
         if direction == 'E' or direction == 'W':
             street_type = 'Street'
             if random.random() < config.chance_street_gets_numbered_name:
-                name = number_to_ordinal[number]
+                name = self.ordinal(number)
             else:
                 if random.random() < 0.5:
                     name = Names.any_surname()
@@ -666,7 +790,7 @@ class Street(object):
         else:
             street_type = 'Avenue'
             if random.random() < config.chance_avenue_gets_numbered_name:
-                name = number_to_ordinal[number]
+                name = self.ordinal(number)
             else:
                 if random.random() < 0.5:
                     name = Names.any_surname()
@@ -676,6 +800,15 @@ class Street(object):
         name = "{0} {1}".format(name, street_type)
         return name
 
+    @staticmethod
+    def ordinal(number):
+        """Return the ordinal form of a street number, e.g., '3rd' or '112th'."""
+        if 10 <= number % 100 <= 20:
+            suffix = 'th'
+        else:
+            suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(number % 10, 'th')
+        return '{}{}'.format(number, suffix)
+
     def __str__(self):
         """Return string representation."""
         return self.name
@@ -730,6 +863,7 @@ class Block(object):
         self.street.blocks.append(self)
         self.lots = []
         self.type = 'block'
+        self.population = 0  # Maintained by Lot.adjust_population()
         # Helper attributes for rendering a town
         if self.street.direction in ('N', 'S'):
             self.starting_coordinates = (self.street.number, self.number/100)
@@ -786,6 +920,18 @@ class Lot(object):
         self.parcel_address_is_on = None
         self.index_of_street_address_will_be_on = None
         self.former_buildings = []
+        # The number of people living/working on the lot, along with aggregates of this over its
+        # neighbors (secondary) and the lots within a neighborhood radius of it (tertiary); these
+        # are all maintained by adjust_population(), which gets called whenever someone moves in
+        # or out (by event.Move, event.Departure, and event.Death) or takes or leaves a job here
+        # (by Occupation.__init__() and Occupation.terminate())
+        self.population = 0
+        self.secondary_population = 0
+        self.tertiary_population = 0
+        # Lots that count this one toward their secondary population; gets set by City.__init__()
+        self.secondary_neighborhood = []
+        # Lots within a neighborhood radius of this one (including itself); gets set by City.__init__()
+        self.neighborhood = []
 
     def __str__(self):
         """Return string representation."""
@@ -804,14 +950,17 @@ class Lot(object):
             else:
                 return 'A vacant tract of land at {}'.format(self.address)
 
-    @property
-    def population(self):
-        """Return the number of people living/working on the lot."""
-        if self.building:
-            population = len(self.building.residents)
-        else:
-            population = 0
-        return population
+    def adjust_population(self, change):
+        """Adjust the population of this lot, as well as the aggregates that it contributes to."""
+        self.population += change
+        if self.block:
+            self.block.population += change
+        for lot in self.secondary_neighborhood:
+            lot.secondary_population += change
+        # Neighborhood membership is symmetric, so this lot's neighborhood holds exactly
+        # the lots whose neighborhoods hold this lot
+        for lot in self.neighborhood:
+            lot.tertiary_population += change
 
     def add_parcel(self, parcel, number, side_of_street, position_in_parcel):
         self.streets.append(parcel.street)
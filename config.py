@@ -33,6 +33,9 @@ class Config(object):
         self.chance_city_gets_named_for_founder = 0.3
         self.chance_avenue_gets_numbered_name = 0.0
         self.chance_street_gets_numbered_name = 0.8
+        # Radius (Manhattan distance, in blocks) of the area around a lot that is surveyed when
+        # appraising lot density and local population, e.g., to determine where downtown is
+        self.radius_of_lot_neighborhood_in_blocks = 2.0
         # City founder
         self.age_of_city_founder = 30
         self.age_of_city_founders_spouse = 30
@@ -46,6 +49,10 @@ class Config(object):
                 ############
 
         self.chance_of_a_timestep_being_simulated = 0.005  # 3.6 timesteps a year on average
+        # Whether to maintain a town-wide index (Game.whereabouts_index) of who was where on each timestep,
+        # both truly and according to each person's beliefs; this makes questions like "who was at the bar
+        # that night?" cheap to answer, at the cost of memory that grows with every enacted timestep
+        self.index_whereabouts = False
         # Daily routines
         self.chance_someone_locks_their_door = lambda neuroticism: neuroticism  # If random.random() > neuro: True
         self.chance_someone_calls_in_sick_to_work = 0.03
@@ -135,6 +142,16 @@ class Config(object):
                 relative_frequencies_dictionary=self.relative_frequencies_of_errands_for_service_types["night"]
             )
         }
+        # The same distributions as (upper bounds, service types) lists sorted by upper bound, which
+        # allows a service type to be sampled by bisection (see Routine._go_on_errand_or_out_for_leisure())
+        self.cumulative_probabilities_of_errand_for_service_type = {
+            "day": self.cumulative_distribution(
+                fitted_probability_distribution=self.probabilities_of_errand_for_service_type["day"]
+            ),
+            "night": self.cumulative_distribution(
+                fitted_probability_distribution=self.probabilities_of_errand_for_service_type["night"]
+            )
+        }
         self.business_type_to_occasion_for_visit = {
             'Bar': 'leisure',
             'Hotel': 'leisure',
@@ -1577,6 +1594,11 @@ class Config(object):
         self.salience_job_level_boost = (
             lambda job_level: job_level * 0.35
         )
+        # Whether salience values are held in a dense people-by-people matrix of 32-bit floats
+        # (Game.salience_matrix), rather than in a dictionary for each person; this takes much less
+        # memory in big towns, at the cost of some precision in salience values
+        self.dense_salience_matrix = False
+        self.salience_matrix_initial_capacity = 1024  # Number of people the matrix has room for before it must grow
 
                 #################
                 ##  KNOWLEDGE  ##
@@ -2470,6 +2492,10 @@ class Config(object):
         self.charge_threshold_for_liking_someone = 20
         self.charge_threshold_for_disliking_someone = -3
         self.charge_threshold_for_hating_someone = -200
+        #               KINSHIP          #
+        # Number of (person, other person) pairs whose familial relations are cached by Game.kinship;
+        # once this is exceeded, the least recently looked-up pairs are forgotten
+        self.kinship_cache_capacity = 50000
 
             #################
             ##  ARTIFACTS  ##
@@ -2500,6 +2526,13 @@ class Config(object):
         self.path_to_thought_nlg_json_grammar_specification = (
             cwd+'/content/talktown-thoughts.json'
         )
+        # Whether to cache parsed grammar specifications alongside their JSON files, which
+        # spares decoding the JSON again each time a Game is instantiated
+        self.cache_parsed_grammar_specifications = True
+        # The maximum number of successfully generated dialogue templates that Productionist caches for
+        # reuse by later requests targeting the same move or topics (0 disables this caching, which
+        # is the default, since reusing templates makes for less varied dialogue)
+        self.dialogue_template_cache_size = 0
         # Frame definitions
         self.conversational_frames = {
             'FACE-TO-FACE': {
@@ -2628,6 +2661,9 @@ class Config(object):
                 #################
 
         self.number_of_recent_thoughts = 9  # Number of thoughts kept track of by Person.Mind.recent_thoughts
+        # Whether thoughts that fall out of a person's recent thoughts get appended to Game.events (otherwise
+        # they are discarded)
+        self.spill_forgotten_thoughts_to_event_log = False
         self.penalty_multiplier_for_expanding_nonrepeatable_symbol_in_thought = 0.01
         self.signal_receptor_synapse_starting_weight = 1
         self.signal_receptor_synapse_weight_increase_increment = 1
@@ -2659,3 +2695,16 @@ class Config(object):
             fitted_probability_distribution[last_bound_attributed][0], 1.0
         )
         return fitted_probability_distribution
+
+    @staticmethod
+    def cumulative_distribution(fitted_probability_distribution):
+        """Return a tuple (upper_bounds, keys) for a distribution fitted by fit_probability_distribution(),
+        in ascending order of upper bound, and leaving out keys with zero probability.
+        """
+        ranges = sorted(
+            (probability_range, k) for k, probability_range in fitted_probability_distribution.iteritems()
+            if probability_range[1] > probability_range[0]
+        )
+        upper_bounds = [probability_range[1] for probability_range, _ in ranges]
+        keys = [k for _, k in ranges]
+        return upper_bounds, keys
@@ -3,13 +3,21 @@ import time
 from event import Event
 from evidence import Statement, Declaration, Lie, Eavesdropping
 from belief import PersonMentalModel, DwellingPlaceModel, BusinessMentalModel
+from productionist import Condition
 
 
 class Conversation(Event):
     """A conversation between two characters in a city."""
 
-    def __init__(self, initiator, recipient, phone_call=False, debug=True):
-        """Initialize a Conversation object."""
+    def __init__(self, initiator, recipient, phone_call=False, debug=True, display=True, render=True):
+        """Initialize a Conversation object.
+
+        @param display: Whether to print lines of dialogue as they are delivered (and to pause between
+                        them when a player is present); headless conversations (see ConversationBatch)
+                        pass False.
+        @param render: Whether to bind what the gaps in lines of dialogue refer to as they are delivered,
+                       so that the lines render as delivered even if they won't be displayed.
+        """
         super(Conversation, self).__init__(game=initiator.game)
         self.game = initiator.game
         self.productionist = self.game.dialogue_productionist  # NLG module
@@ -21,9 +29,12 @@ class Conversation(Event):
         self.phone_call = phone_call
         self.locations = (self.initiator.location, self.recipient.location)
         self.debug = debug
+        self.display = display
+        self.render = render or display  # Displaying a line requires rendering it
         self.subject = Subject(conversation=self)  # The subject of conversation at a given point
         self.discontinued_subjects = set()  # Discontinued subjects of conversation
         self.turns = []  # A record of the conversation as an ordered list of its turns
+        self.completed_turns = []  # The turns whose lines of dialogue have been delivered, in order
         self.over = False  # Whether the conversation is over (gets set by Move.fire())
         # Obligations and goals -- these get populated as frames are inherited from
         self.obligations = {self.initiator: set(), self.recipient: set()}
@@ -33,6 +44,13 @@ class Conversation(Event):
         self.resolved_obligations = {self.initiator: set(), self.recipient: set()}
         self.topics = set()
         self.moves = set()  # A record of all dialogue moves, which are used as planning operators for goals
+        # Indices that Turn._update_conversation_state() maintains, so that the checks made by goals,
+        # plans, and the preconditions of dialogue symbols don't have to scan the record of the conversation
+        self.n_turns_taken = {self.initiator: 0, self.recipient: 0}
+        self.last_completed_turn = {self.initiator: None, self.recipient: None}
+        self.move_turn_indices = {self.initiator: {}, self.recipient: {}}  # Move name -> indices of turns
+        self.obligations_by_move_name = {self.initiator: {}, self.recipient: {}}  # Move name -> set of obligations
+        self.topics_by_name = {}
         # Inherit from conversational frames that pertain to the contexts of this conversation
         self.frames = set()
         self._init_inherit_from_frames()
@@ -43,9 +61,10 @@ class Conversation(Event):
         self.lies = set()
         self.eavesdroppings = set()
 
-        # TEST BLOCK
+        # TEST BLOCK (if the initiator knows nobody's first name, keep their current preoccupation)
         initiator.mind.preoccupation = next(
-            p for p in initiator.mind.mental_models if p.type == 'person' and initiator.belief(p, 'first name')
+            (p for p in initiator.mind.mental_models if p.type == 'person' and initiator.belief(p, 'first name')),
+            initiator.mind.preoccupation
         )
 
     def __str__(self):
@@ -72,8 +91,8 @@ class Conversation(Event):
                 frame = Frame(conversation=self, name=frame_name)
                 self.frames.add(frame)
                 # Inherit its obligations
-                self.obligations[self.initiator] |= frame.obligations[self.initiator]
-                self.obligations[self.recipient] |= frame.obligations[self.recipient]
+                for obligation in frame.obligations[self.initiator] | frame.obligations[self.recipient]:
+                    self.impose_obligation(obligation=obligation)
                 # Inherit its goals
                 self.goals[self.initiator] |= frame.goals[self.initiator]
                 self.goals[self.recipient] |= frame.goals[self.recipient]
@@ -91,38 +110,20 @@ class Conversation(Event):
         """Return the current interlocutor."""
         return self.interlocutor_to(self.speaker)
 
-    @property
-    def completed_turns(self):
-        """Return all turns that have already been completed."""
-        return [turn for turn in self.turns if hasattr(turn, 'line_of_dialogue')]
-
     @property
     def last_turn(self):
         """Return the last completed turn."""
-        completed_turns = self.completed_turns
-        return None if not completed_turns else completed_turns[-1]
+        return None if not self.completed_turns else self.completed_turns[-1]
 
     @property
     def last_speaker_turn(self):
         """Return the last turn completed by the current speaker."""
-        all_completed_speaker_turns = [
-            turn for turn in self.turns if hasattr(turn, 'line_of_dialogue') and turn.speaker is self.speaker
-        ]
-        if all_completed_speaker_turns:
-            return all_completed_speaker_turns[-1]
-        else:
-            return None
+        return self.last_completed_turn[self.speaker] if self.speaker else None
 
     @property
     def last_interlocutor_turn(self):
         """Return the last turn completed by the current interlocutor."""
-        all_completed_interlocutor_turns = [
-            turn for turn in self.turns if hasattr(turn, 'line_of_dialogue') and turn.speaker is self.interlocutor
-        ]
-        if all_completed_interlocutor_turns:
-            return all_completed_interlocutor_turns[-1]
-        else:
-            return None
+        return self.last_completed_turn[self.interlocutor] if self.speaker else None
 
     @property
     def goals_not_on_hold(self):
@@ -152,7 +153,8 @@ class Conversation(Event):
     def restart(self):
         """Return a new Conversation object with the same context as this one."""
         return Conversation(
-            initiator=self.initiator, recipient=self.recipient, phone_call=self.phone_call, debug=self.debug
+            initiator=self.initiator, recipient=self.recipient, phone_call=self.phone_call, debug=self.debug,
+            display=self.display, render=self.render
         )
 
     def replay(self):
@@ -163,12 +165,13 @@ class Conversation(Event):
     def transpire(self):
         """Carry out the entire conversation."""
         while not self.over:
-            if any(p for p in self.participants if p.player):
+            if self.display and any(p for p in self.participants if p.player):
                 time.sleep(0.6)
             self.proceed()
         # self.replay()
-        for turn in self.turns:
-            print '\n{}\n'.format(turn)
+        if self.display:
+            for turn in self.turns:
+                print '\n{}\n'.format(turn)
 
     def proceed(self):
         """Proceed with the conversation by advancing one turn."""
@@ -277,28 +280,23 @@ class Conversation(Event):
 
     def count_move_occurrences(self, acceptable_speakers, name):
         """Count the number of times the acceptable speakers have performed a dialogue move with the given name."""
-        moves_meeting_the_specification = [
-            move for move in self.moves if move.speaker in acceptable_speakers and move.name == name
-        ]
-        return len(moves_meeting_the_specification)
+        return sum(len(self.move_turn_indices[speaker].get(name, ())) for speaker in acceptable_speakers)
 
     def earlier_move(self, speaker, name):
         """Return whether speaker has already performed a dialogue move with the given name."""
         relevant_speakers = self.participants if speaker == 'either' else (speaker,)
-        return any(move for move in self.moves if move.speaker in relevant_speakers and move.name == name)
+        return any(name in self.move_turn_indices[relevant_speaker] for relevant_speaker in relevant_speakers)
 
     def turns_since_earlier_move(self, speaker, name):
         """Return the number of turns that have been completed since speaker performed a dialogue
         move with the given name.
         """
         relevant_speakers = self.participants if speaker == 'either' else (speaker,)
-        earlier_turns_that_performed_that_move = [
-            turn for turn in self.completed_turns if any(
-                move for move in turn.moves_performed if move.speaker in relevant_speakers and move.name == name
-            )
-        ]
-        latest_such_turn = max(earlier_turns_that_performed_that_move, key=lambda t: t.index)
-        turns_completed_since_that_turn = self.completed_turns[-1].index - latest_such_turn.index
+        index_of_latest_such_turn = max(
+            self.move_turn_indices[relevant_speaker][name][-1] for relevant_speaker in relevant_speakers
+            if name in self.move_turn_indices[relevant_speaker]
+        )
+        turns_completed_since_that_turn = self.completed_turns[-1].index - index_of_latest_such_turn
         return turns_completed_since_that_turn
 
     def last_speaker_move(self, name):
@@ -311,15 +309,31 @@ class Conversation(Event):
 
     def turns_taken(self, speaker):
         """Return the number of turns taken so far by the given speaker."""
-        return len([turn for turn in self.turns if turn.speaker is speaker])
+        return self.n_turns_taken[speaker]
 
     def has_obligation(self, conversational_party, move_name):
         """Return whether the conversational party currently has an obligation to perform a move with the given name."""
-        return any(o for o in self.obligations[conversational_party] if o.move_name == move_name)
+        return move_name in self.obligations_by_move_name[conversational_party]
 
     def no_obligation(self, conversational_party, move_name):
         """Return whether the conversational party currently has no obligation to perform a move with the given name."""
-        return not any(o for o in self.obligations[conversational_party] if o.move_name == move_name)
+        return move_name not in self.obligations_by_move_name[conversational_party]
+
+    def impose_obligation(self, obligation):
+        """Impose a conversational obligation on its obligated party."""
+        obligated_party = obligation.obligated_party
+        self.obligations[obligated_party].add(obligation)
+        self.obligations_by_move_name[obligated_party].setdefault(obligation.move_name, set()).add(obligation)
+
+    def resolve_obligation(self, obligation):
+        """Resolve a conversational obligation that its obligated party has fulfilled."""
+        obligated_party = obligation.obligated_party
+        self.obligations[obligated_party].remove(obligation)
+        obligations_to_perform_that_move = self.obligations_by_move_name[obligated_party][obligation.move_name]
+        obligations_to_perform_that_move.remove(obligation)
+        if not obligations_to_perform_that_move:
+            del self.obligations_by_move_name[obligated_party][obligation.move_name]
+        self.resolved_obligations[obligated_party].add(obligation)
 
     def outstanding_obligations(self):
         """Return whether there are any outstanding conversational obligations."""
@@ -327,7 +341,7 @@ class Conversation(Event):
 
     def already_a_topic(self, name):
         """Return whether there is already an active topic with the given name."""
-        return any(t for t in self.topics if t.name == name)
+        return name in self.topics_by_name
 
     def get_evidence_object(self, evidence_type, subject, source, recipient, eavesdropper=None):
         """Return an evidence object satisfying the given criteria, if one has already been instantiated."""
@@ -383,11 +397,20 @@ class Turn(object):
         self.obligations_resolved = set()
         self.index = len(conversation.turns)
         self.conversation.turns.append(self)
-        self.realization = ''  # Dialogue template as it was filled in during this turn
+        self.conversation.n_turns_taken[speaker] += 1
         if self.speaker.player:
             self.line_of_dialogue = self._process_player_dialogue_input()
         else:  # Speaker is an NPC
             self.line_of_dialogue = self._decide_what_to_say()
+        # Record the bindings under which the line is delivered, which allows us to defer rendering
+        # it until someone actually asks for the text (see the 'realization' property); if the
+        # conversation is being rendered, we also bind what each gap refers to as of delivery, since
+        # that may change in the meantime (e.g., the interlocutor may learn the speaker's name)
+        self.bindings = Condition.build_state_tuple(state=conversation)
+        self.gap_bindings = (
+            self.line_of_dialogue.bind_gaps(conversation=conversation) if conversation.render else None
+        )
+        self._realization = None  # Dialogue template as it was filled in for this turn
         self._realize_line_of_dialogue()
         self.eavesdropper = self._potentially_be_eavesdropped()
         self._update_conversation_state()
@@ -396,6 +419,20 @@ class Turn(object):
         """Return string representation."""
         return '{}: {}'.format(self.speaker.name, self.realization)
 
+    @property
+    def realization(self):
+        """Return the line of dialogue delivered on this turn, rendering it if that hasn't happened yet.
+
+        If the conversation was rendered, the gaps in the line's template are filled in with what they
+        referred to when the line was delivered; otherwise, they are filled in using the speaker, interlocutor,
+        and subject match that were bound at delivery, though their attributes are read as they stand now.
+        """
+        if self._realization is None:
+            self._realization = self.line_of_dialogue.realize(
+                conversation=self.conversation, state_tuple=self.bindings, gap_bindings=self.gap_bindings
+            )
+        return self._realization
+
     def _process_player_dialogue_input(self):
         """Process the player's free-text dialogue input to instantiate a line of dialogue."""
         # Ask the player to provide her next utterance
@@ -444,6 +481,15 @@ class Turn(object):
                 self.targeted_goal = new_goal_to_end_conversation
                 selected_line = self._decide_what_to_say()  # Which will now target the new goal
         if selected_line is None:
+            # If no line could be found to resolve an obligation (which would be targeted again) or to
+            # end the conversation (which a new goal to end the conversation would target again), then
+            # trying again would just fail in the same way
+            if self.targeted_obligation or (self.targeted_goal and self.targeted_goal.name == 'END CONVERSATION'):
+                raise ConversationBreakdown(
+                    "{speaker} cannot find a line of dialogue that would resolve {target}.".format(
+                        speaker=self.speaker.name, target=self.targeted_obligation or self.targeted_goal
+                    )
+                )
             # You couldn't find a viable line, so just adopt and target a goal to
             # end the conversation
             new_goal_to_end_conversation = Goal(
@@ -456,10 +502,10 @@ class Turn(object):
 
     def _realize_line_of_dialogue(self):
         """Display the line of dialogue on screen."""
-        self.realization = self.line_of_dialogue.realize(conversation=self.conversation)
         # If the speaker is an NPC, print their line out; if it's a player, the line
-        # has already been made visible from the player typing it
-        if not self.speaker.player:
+        # has already been made visible from the player typing it; otherwise, rendering
+        # is deferred until the text is actually requested
+        if self.conversation.display and not self.speaker.player:
             print '\n{name}: {line}\n'.format(name=self.speaker.name, line=self.realization)
 
     def _potentially_be_eavesdropped(self):
@@ -476,6 +522,8 @@ class Turn(object):
 
     def _update_conversation_state(self):
         """Update the conversation state and have the interlocutor consider any propositions."""
+        self.conversation.completed_turns.append(self)
+        self.conversation.last_completed_turn[self.speaker] = self
         self._update_context()
         self._assert_propositions()
         self._reify_dialogue_moves()
@@ -521,6 +569,7 @@ class Turn(object):
         for move_name in self.line_of_dialogue.moves:
             move_object = Move(conversation=self.conversation, speaker=self.speaker, name=move_name)
             self.conversation.moves.add(move_object)
+            self.conversation.move_turn_indices[self.speaker].setdefault(move_name, []).append(self.index)
             self.moves_performed.add(move_object)
 
     def _satisfy_goals(self):
@@ -544,14 +593,11 @@ class Turn(object):
         """Resolve any conversational obligations according to the mark-up of the generated line."""
         # Resolve speaker obligations
         for move_name in self.line_of_dialogue.moves:
-            if any(obligation for obligation in self.conversation.obligations[self.speaker] if
-                   obligation.move_name == move_name):
+            if self.conversation.has_obligation(conversational_party=self.speaker, move_name=move_name):
                 obligation_to_resolve = next(
-                    obligation for obligation in self.conversation.obligations[self.speaker] if
-                    obligation.move_name == move_name
+                    iter(self.conversation.obligations_by_move_name[self.speaker][move_name])
                 )
-                self.conversation.obligations[self.speaker].remove(obligation_to_resolve)
-                self.conversation.resolved_obligations[self.speaker].add(obligation_to_resolve)
+                self.conversation.resolve_obligation(obligation=obligation_to_resolve)
                 self.obligations_resolved.add(obligation_to_resolve)
                 if self.conversation.debug:
                     print '-- Resolved {}'.format(obligation_to_resolve)
@@ -565,7 +611,7 @@ class Turn(object):
             obligation_object = Obligation(
                 conversation=self.conversation, obligated_party=self.speaker, move_name=obligation_name
             )
-            self.conversation.obligations[self.speaker].add(obligation_object)
+            self.conversation.impose_obligation(obligation=obligation_object)
             if self.conversation.debug:
                 print '-- Pushed {}'.format(obligation_object)
         # Push interlocutor obligations
@@ -573,16 +619,17 @@ class Turn(object):
             obligation_object = Obligation(
                 conversation=self.conversation, obligated_party=self.interlocutor, move_name=obligation_name
             )
-            self.conversation.obligations[self.interlocutor].add(obligation_object)
+            self.conversation.impose_obligation(obligation=obligation_object)
             if self.conversation.debug:
                 print '-- Pushed {}'.format(obligation_object)
 
     def _push_topics(self):
         """Push new topics of conversation according to the mark-up of this line."""
         for topic_name in self.line_of_dialogue.topics_pushed:
-            if not any(t for t in self.conversation.topics if t.name == topic_name):
+            if not self.conversation.already_a_topic(name=topic_name):
                 topic_object = Topic(name=topic_name)
                 self.conversation.topics.add(topic_object)
+                self.conversation.topics_by_name[topic_name] = topic_object
                 self.topics_addressed.add(topic_object)
                 if self.conversation.debug:
                     print '-- Pushed "{}"'.format(topic_object)
@@ -591,15 +638,15 @@ class Turn(object):
         """Address topics of conversation according to the mark-up of this line."""
         for topic_name in self.line_of_dialogue.topics_addressed:
             try:
-                topic_object = next(t for t in self.conversation.topics if t.name == topic_name)
+                topic_object = self.conversation.topics_by_name[topic_name]
                 self.topics_addressed.add(topic_object)
                 if self.conversation.debug:
                     print '-- Addressed "{}"'.format(topic_object)
-            except StopIteration:  # Topic has not been introduced yet
+            except KeyError:  # Topic has not been introduced yet
                 if self.speaker.player:  # If the speaker is a player character, let it slide
                     pass
                 else:
-                    raise Exception(
+                    raise ConversationBreakdown(
                         "{speaker} is attempting to address a topic ({topic}) that has not yet been introduced.".format(
                             speaker=self.speaker.name,
                             topic=topic_name
@@ -689,6 +736,10 @@ class Obligation(object):
 class Proposition(object):
     """A proposition about the world asserted by the content of a line of dialogue."""
 
+    # Feature types and compiled reference accessors for proposition specifications, keyed
+    # by specification; these are shared across all propositions asserting the same markup
+    compiled_specifications = {}
+
     def __init__(self, conversation, this_is_a_lie, specification):
         """Initialize a Proposition object."""
         self.conversation = conversation
@@ -731,6 +782,33 @@ class Proposition(object):
 
     def _init_parse_specification(self, specification):
         """Parse the specification for this proposition to set this object's individual specification attributes."""
+        try:
+            subject_accessor, feature_type, feature_value_accessor, feature_object_itself_accessor = (
+                Proposition.compiled_specifications[specification]
+            )
+        except KeyError:
+            compiled_specification = self._compile_specification(specification=specification)
+            Proposition.compiled_specifications[specification] = compiled_specification
+            subject_accessor, feature_type, feature_value_accessor, feature_object_itself_accessor = (
+                compiled_specification
+            )
+        # Resolve the references to attributes for this object (this requires us to pull in
+        # some variables from the conversational context)
+        speaker, interlocutor, subject = (
+            self.conversation.speaker, self.conversation.interlocutor, self.conversation.subject
+        )
+        self.subject = subject_accessor(speaker, interlocutor, subject)
+        self.feature_value = feature_value_accessor(speaker, interlocutor, subject)
+        self.feature_object_itself = feature_object_itself_accessor(speaker, interlocutor, subject)
+        # Feature type doesn't need to be evaluated (it's just a string), so attribute it as is
+        self.feature_type = feature_type
+
+    @staticmethod
+    def _compile_specification(specification):
+        """Parse a proposition specification into a feature type and accessors for its references.
+
+        The accessors are functions of the speaker, interlocutor, and subject of conversation.
+        """
         subject, feature_type, feature_value, feature_object_itself = specification.split(';')
         # Make sure the specification is well-formed
         assert 'subject=' in subject, 'Ill-formed proposition specification: {}'.format(specification)
@@ -744,16 +822,13 @@ class Proposition(object):
         feature_type = feature_type[len('feature_type='):]
         feature_value_ref = feature_value[len('feature_value='):]
         feature_object_itself_ref = feature_object_itself[len('feature_object_itself='):]
-        # Evaluate the references to resolve to attributes for this object (this requires
-        # us to pull in some variables from the conversational context)
-        speaker, interlocutor, subject = (
-            self.conversation.speaker, self.conversation.interlocutor, self.conversation.subject
+        # Compile the references
+        subject_accessor = eval('lambda speaker, interlocutor, subject: {}'.format(subject_ref))
+        feature_value_accessor = eval('lambda speaker, interlocutor, subject: {}'.format(feature_value_ref))
+        feature_object_itself_accessor = eval(
+            'lambda speaker, interlocutor, subject: {}'.format(feature_object_itself_ref)
         )
-        self.subject = eval(subject_ref)
-        self.feature_value = eval(feature_value_ref)
-        self.feature_object_itself = eval(feature_object_itself_ref)
-        # Feature type doesn't need to be evaluated (it's just a string), so attribute it as is
-        self.feature_type = feature_type
+        return subject_accessor, feature_type, feature_value_accessor, feature_object_itself_accessor
 
     def _establish_mental_models_of_subject(self):
         """If necessary, reify mental models pertaining to the subject of this proposition that will be owned by its
@@ -990,7 +1065,9 @@ class Plan(object):
 
     def execute(self):
         """Execute the next step in this plan."""
-        next_step = next(step for step in self.steps if not step.achieved)
+        next_step = next((step for step in self.steps if not step.achieved), None)
+        if next_step is None:
+            raise ConversationBreakdown("{} was executed, but all of its steps have already been achieved.".format(self))
         assert not self.on_hold, (
             "A call was made to the execute method of {}, but this plan is on hold.".format(self)
         )
@@ -1165,4 +1242,96 @@ class Frame(object):
         for obligation in self.obligations[self.conversation.initiator] | self.obligations[self.conversation.recipient]:
             obligation.outline(n_tabs+1)
         for goal in self.goals[self.conversation.initiator] | self.goals[self.conversation.recipient]:
-            goal.outline(n_tabs+1)
\ No newline at end of file
+            goal.outline(n_tabs+1)
+
+
+class ConversationBreakdown(Exception):
+    """Raised when a conversation cannot proceed because of a gap in the dialogue grammar or in the
+    conversational goals that are authored in the config file (e.g., no line of dialogue can be
+    generated that would end the conversation).
+    """
+    pass
+
+
+class ConversationBatch(object):
+    """A batch of NPC-NPC conversations that are carried out headlessly.
+
+    Nothing is printed, nobody sleeps between turns, and lines of dialogue are only realized
+    if that is requested; what remains is the conversational reasoning itself, including the
+    knowledge propagation that occurs as propositions are asserted. This allows many conversations
+    to be carried out during a single timestep of simulation.
+    """
+
+    def __init__(self, pairs, render=False):
+        """Initialize a ConversationBatch object.
+
+        @param pairs: An iterable of (initiator, recipient) tuples, neither of whom may be a player.
+        @param render: Whether to bind what the gaps in lines of dialogue refer to as they are delivered,
+                       rather than reading it when the lines are requested.
+        """
+        self.pairs = list(pairs)
+        self.render = render
+        self.records = []  # A ConversationRecord for each conversation that was carried out
+        self.failures = []  # (initiator, recipient, exception) for each conversation that broke down
+
+    def __str__(self):
+        """Return string representation."""
+        return "Batch of {n} conversations ({n_failed} failed, {n_turns} turns)".format(
+            n=len(self.pairs), n_failed=len(self.failures), n_turns=sum(r.n_turns for r in self.records)
+        )
+
+    def run(self):
+        """Carry out every conversation in this batch and return a record of each one."""
+        for initiator, recipient in self.pairs:
+            assert not (initiator.player or recipient.player), (
+                "A ConversationBatch cannot include player characters, since it never solicits input."
+            )
+            try:
+                conversation = Conversation(
+                    initiator=initiator, recipient=recipient, debug=False, display=False, render=self.render
+                )
+                conversation.transpire()
+            except ConversationBreakdown as e:
+                # An authoring gap in the dialogue grammar shouldn't bring down the whole batch
+                self.failures.append((initiator, recipient, e))
+            else:
+                self.records.append(ConversationRecord(conversation=conversation))
+        return self.records
+
+
+class ConversationRecord(object):
+    """A structured record of the outcome of a conversation that was carried out headlessly."""
+
+    def __init__(self, conversation):
+        """Initialize a ConversationRecord object."""
+        self.conversation = conversation
+        self.initiator = conversation.initiator
+        self.recipient = conversation.recipient
+        self.n_turns = len(conversation.turns)
+        # The dialogue moves performed on each turn, as (speaker, move name) tuples, in order
+        self.moves = [(move.speaker, move.name) for turn in conversation.turns for move in turn.moves_performed]
+        self.propositions = [proposition for turn in conversation.turns for proposition in turn.propositions]
+        # Evidence objects that were instantiated during the conversation
+        self.declarations = conversation.declarations
+        self.statements = conversation.statements
+        self.lies = conversation.lies
+        self.eavesdroppings = conversation.eavesdroppings
+
+    def __str__(self):
+        """Return string representation."""
+        return "Record of conversation between {} and {}: {} turns, {} moves, {} propositions".format(
+            self.initiator.name, self.recipient.name, self.n_turns, len(self.moves), len(self.propositions)
+        )
+
+    @property
+    def lines(self):
+        """Return the lines of dialogue delivered during the conversation, as (speaker, realization) tuples.
+
+        If the conversation wasn't rendered, this is where its lines will be realized.
+        """
+        return [(turn.speaker, turn.realization) for turn in self.conversation.turns]
+
+    @property
+    def evidence(self):
+        """Return all the evidence objects that were instantiated during the conversation."""
+        return self.declarations | self.statements | self.lies | self.eavesdroppings
@@ -377,6 +377,8 @@ class BusinessClosure(Event):
             LayOff(subject=employee.person, company=business, occupation=employee)
         self.city.companies.remove(business)
         self.city.former_companies.add(business)
+        for service in business.services:
+            self.city.businesses_by_service[service].remove(business)
         # Demolish the building -- TODO reify buildings separately from companies
         if self.city.businesses_of_type('ConstructionFirm'):
             demolition_company = random.choice(self.city.businesses_of_type('ConstructionFirm'))
@@ -409,6 +411,7 @@ class Death(Event):
         subject.city.residents.remove(subject)
         subject.city.deceased.add(subject)
         self._update_attributes_of_deceased_and_spouse()  # Must come before self.subject.go_to()
+        subject.game.kinship.record_death(death=self)
         self._have_widow_take_off_wedding_ring()
         self._vacate_job_position_of_the_deceased()
         if mortician:
@@ -430,6 +433,7 @@ class Death(Event):
         # Update attributes of this person's home
         subject.home.residents.remove(subject)
         subject.home.former_residents.add(subject)
+        subject.home.lot.adjust_population(-1)
         if subject in subject.home.owners:
             subject.home.owners.remove(subject)
             if subject.home.residents and not subject.home.owners:
@@ -556,6 +560,7 @@ class Departure(Event):
         self.subject.go_to(destination=None)
         self.subject.home.residents.remove(self.subject)
         self.subject.home.former_residents.add(self.subject)
+        self.subject.home.lot.adjust_population(-1)
         # Update .neighbor attributes for subject and for their now former neighbors
         self._update_neighbor_attributes()
 
@@ -574,14 +579,10 @@ class Departure(Event):
             old_neighbor.neighbors.remove(subject)
             old_neighbor.former_neighbors.add(subject)
             subject.former_neighbors.add(old_neighbor)
-            # ...and update the relevant salience values (because people still living in the
-            # city may discuss this person)
-            old_neighbor.update_salience_of(
-                entity=subject, change=salience_change_for_former_neighbor
-            )
-            subject.update_salience_of(
-                entity=old_neighbor, change=salience_change_for_former_neighbor
-            )
+        # ...and update the relevant salience values (because people still living in the
+        # city may discuss this person)
+        subject.update_salience_of_me(people=subject.neighbors, change=salience_change_for_former_neighbor)
+        subject.update_salience_of_many(entities=subject.neighbors, change=salience_change_for_former_neighbor)
         # Set the departed's .neighbors attribute to the empty set
         self.subject.neighbors = set()
 
@@ -641,17 +642,12 @@ class Divorce(Event):
         spouse2.significant_other = None
         spouse1.divorces.append(self)
         spouse2.divorces.append(self)
-        spouse1.immediate_family.remove(spouse2)
-        spouse2.immediate_family.remove(spouse1)
-        # Revert each back to their own extended families
-        spouse1.extended_family = (
-            spouse1.greatgrandparents | spouse1.immediate_family | spouse1.uncles | spouse1.aunts |
-            spouse1.cousins | spouse1.nieces | spouse1.nephews
-        )
-        spouse2.extended_family = (
-            spouse2.greatgrandparents | spouse2.immediate_family | spouse2.uncles | spouse2.aunts |
-            spouse2.cousins | spouse2.nieces | spouse2.nephews
-        )
+        # This removes each from the other's immediate family, and reverts each back to their own
+        # extended families
+        spouse1.game.genealogy.record_divorce(divorce=self)
+        spouse1.game.kinship.record_divorce(divorce=self)
+        spouse1.social_ties_version += 1
+        spouse2.social_ties_version += 1
         self._have_divorcees_fall_out_of_love(divorcees=self.subjects, config=config)
         # Update salience values
         salience_change = (
@@ -993,10 +989,11 @@ class Marriage(Event):
         spouse2.spouse = spouse1
         spouse1.significant_other = spouse2
         spouse2.significant_other = spouse1
-        spouse1.immediate_family.add(spouse2)
-        spouse2.immediate_family.add(spouse1)
-        spouse1.extended_family |= spouse2.extended_family  # TODO THIS IS NOT TOTALLY ACCURATE
-        spouse2.extended_family |= spouse1.extended_family
+        # This adds each to the other's immediate family, and each other's extended families to their own
+        spouse1.game.genealogy.record_marriage(marriage=self)
+        spouse1.game.kinship.record_marriage(marriage=self)
+        spouse1.social_ties_version += 1
+        spouse2.social_ties_version += 1
         self._cease_grieving_of_former_spouses(newlyweds=self.subjects)
         # Update salience values
         salience_change = (
@@ -1137,9 +1134,11 @@ class Move(Event):
             if person.home:
                 person.home.residents.remove(person)
                 person.home.former_residents.add(person)
+                person.home.lot.adjust_population(-1)
             # Move into new home
             person.home = new_home
             new_home.residents.add(person)
+            new_home.lot.adjust_population(1)
             person.moves.append(self)
             # Add yourself to city residents, if you moved from outside the city
             person.city = person.game.city
@@ -1173,13 +1172,9 @@ class Move(Event):
                 this_movers_old_neighbor.neighbors.remove(mover)
                 this_movers_old_neighbor.former_neighbors.add(mover)
                 mover.former_neighbors.add(this_movers_old_neighbor)
-                # Also update salience values
-                this_movers_old_neighbor.update_salience_of(
-                    entity=mover, change=salience_change_for_former_neighbor
-                )
-                mover.update_salience_of(
-                    entity=this_movers_old_neighbor, change=salience_change_for_former_neighbor
-                )
+            # Also update salience values
+            mover.update_salience_of_me(people=mover.neighbors, change=salience_change_for_former_neighbor)
+            mover.update_salience_of_many(entities=mover.neighbors, change=salience_change_for_former_neighbor)
         # Update the movers' .neighbors attributes by...
         new_neighbors = set()
         # ...surveying all people living on neighboring lots
@@ -1201,9 +1196,9 @@ class Move(Event):
         for mover in movers:
             mover.neighbors = set(new_neighbors)
             for new_neighbor in new_neighbors:
-                mover.update_salience_of(entity=new_neighbor, change=salience_change_for_new_neighbor)
                 new_neighbor.neighbors.add(mover)
-                new_neighbor.update_salience_of(entity=mover, change=salience_change_for_new_neighbor)
+            mover.update_salience_of_many(entities=new_neighbors, change=salience_change_for_new_neighbor)
+            mover.update_salience_of_me(people=new_neighbors, change=salience_change_for_new_neighbor)
 
     def __str__(self):
         """Return string representation."""
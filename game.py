@@ -5,6 +5,11 @@ from impressionist import Impressionist
 from person import *
 from business import *
 from city import *
+from whereabouts import WhereaboutsIndex
+from genealogy import Genealogy
+from kinship import Kinship
+from salience import SalienceMatrix
+from routine import RoutineStep
 import datetime
 import time
 
@@ -24,6 +29,14 @@ class Game(object):
         # which affords a persistent ID for each person
         self.current_person_id = 0
         self.current_place_id = 0
+        self.places = {}  # Maps place IDs to businesses and dwelling places (used to look up whereabouts)
+        # Who was where when, across the whole town, if this is to be indexed
+        self.whereabouts_index = WhereaboutsIndex(game=self) if self.config.index_whereabouts else None
+        self.genealogy = Genealogy(game=self)  # Everyone's family tree
+        self.kinship = Kinship(game=self)  # Classifies how people are related to one another
+        # Everyone's salience to everyone else, if these are to be held in a single dense matrix (rather
+        # than in a dictionary for each person)
+        self.salience_matrix = SalienceMatrix(game=self) if self.config.dense_salience_matrix else None
         self.year = self.config.date_worldgen_begins[0]
         self.true_year = self.config.date_worldgen_begins[0]  # True year never gets changed during retconning
         self.ordinal_date = datetime.date(*self.config.date_worldgen_begins).toordinal()  # Days since 01-01-0001
@@ -277,8 +290,7 @@ class Game(object):
                     for other_person in person.relationships:
                         person.relationships[other_person].interacted_this_timestep = False
                 # Have people go to the location they will be at this timestep
-                for person in list(self.city.residents):
-                    person.routine.enact()
+                RoutineStep(game=self).enact_routines(people=list(self.city.residents))
                 # Have people initiate social interactions with one another
                 for person in list(self.city.residents):
                     # Person may have married (during an earlier iteration of this loop) and
@@ -429,9 +441,12 @@ class Game(object):
             for other_person in person.relationships:
                 person.relationships[other_person].interacted_this_timestep = False
         # Have people go to the location they will be at this timestep
-        for person in self.city.residents:
-            if not (timestep_during_gameplay and person is self.pc):  # Don't sim where the PC is
-                person.routine.enact()
+        RoutineStep(game=self).enact_routines(
+            people=[
+                person for person in self.city.residents
+                if not (timestep_during_gameplay and person is self.pc)  # Don't sim where the PC is
+            ]
+        )
         # Have people observe their surroundings, which will cause knowledge to
         # build up, and have them socialize with other people also at that location --
         # this will cause relationships to form/progress and knowledge to propagate
@@ -458,8 +473,7 @@ class Game(object):
         """Enact people's routines only, to make sure they're where they're supposed to be on a timestep."""
         self.advance_time()
         # Have people go to the location they will be at this timestep
-        for person in list(self.city.residents):
-            person.routine.enact()
+        RoutineStep(game=self).enact_routines(people=list(self.city.residents))
 
     def advance_time(self):
         """Advance time of day and date, if it's a new day."""
@@ -0,0 +1,373 @@
+class Genealogy(object):
+    """The family tree of everyone who has ever lived in a gameplay instance.
+
+    Each parent edge in the tree is stored once: a person's parents are held by the person's
+    mother, father, and parents attributes, and this object indexes the reverse of those
+    edges (i.e., each person's kids). Additionally, an ancestor closure table maps everyone
+    to all of their ancestors, along with the numbers of generations separating them, which
+    is maintained as people are born.
+
+    All other family relations (siblings, cousins, extended family, and so forth) are derived
+    from these on demand, and are cached until the family tree next changes (i.e., until the
+    next birth, marriage, or divorce). As in the rest of the simulation, family relations are
+    legal ones (a child's legal father is his or her mother's husband at the time of birth),
+    except for the bio_* relations, which are derived from people's biological parents.
+    """
+
+    def __init__(self, game):
+        """Initialize a Genealogy object."""
+        self.game = game
+        # Maps people to the sets of their (legal) kids
+        self.kids = {}
+        # Maps people to dictionaries that map each of their (legal) ancestors to a bit set of
+        # the numbers of generations separating them: bit n is set if that ancestor is an nth-
+        # generation ancestor (e.g., bit 1 is set for a parent, bit 2 for a grandparent); it's a set
+        # because in a family tree with intermarriage, someone may be, e.g., both a grandparent and
+        # a great-grandparent of the same person
+        self.ancestor_generations = {}
+        # Maps (person, relation) pairs to frozensets of the people who bear that relation
+        # to that person; this is cleared whenever the family tree changes
+        self.relatives_cache = {}
+
+    def __str__(self):
+        """Return string representation."""
+        return "Genealogy of {} people with {} parents among them".format(
+            len(self.ancestor_generations), len(self.kids)
+        )
+
+    def record_birth(self, person):
+        """Record the birth of a person to their parents."""
+        generations = {}
+        for parent in person.parents:
+            self.kids.setdefault(parent, set()).add(person)
+            generations[parent] = generations.get(parent, 0) | 1 << 1
+            for ancestor, generations_to_parent in self.ancestor_generations.get(parent, {}).iteritems():
+                generations[ancestor] = generations.get(ancestor, 0) | generations_to_parent << 1
+        if generations:
+            self.ancestor_generations[person] = generations
+        self.relatives_cache.clear()
+
+    def record_marriage(self, marriage):
+        """Record a marriage, which changes its subjects' immediate and extended families."""
+        self.relatives_cache.clear()
+
+    def record_divorce(self, divorce):
+        """Record a divorce, which changes its subjects' immediate and extended families."""
+        self.relatives_cache.clear()
+
+    def relatives(self, person, relation):
+        """Return a frozenset of the people who bear the given relation (e.g., 'cousins') to the given person."""
+        try:
+            return self.relatives_cache[(person, relation)]
+        except KeyError:
+            relatives = frozenset(getattr(self, '_{}'.format(relation))(person))
+            relatives -= {person}
+            self.relatives_cache[(person, relation)] = relatives
+            return relatives
+
+    def generations_between(self, ancestor, descendant):
+        """Return a sorted list of the numbers of generations separating an ancestor from a descendant.
+
+        This will be empty if the first person is not an ancestor of the second.
+        """
+        generations = self.ancestor_generations.get(descendant, {}).get(ancestor, 0)
+        return [n for n in xrange(1, generations.bit_length()) if generations >> n & 1]
+
+    def common_ancestors(self, person, other_person):
+        """Return a dictionary mapping the common ancestors of two people to the (fewest) numbers of
+        generations separating them from each of those people.
+        """
+        generations_of_ancestors = self.ancestor_generations.get(person, {})
+        other_generations_of_ancestors = self.ancestor_generations.get(other_person, {})
+        if len(other_generations_of_ancestors) < len(generations_of_ancestors):
+            common = [a for a in other_generations_of_ancestors if a in generations_of_ancestors]
+        else:
+            common = [a for a in generations_of_ancestors if a in other_generations_of_ancestors]
+        return {
+            ancestor: (
+                self._fewest_generations(generations_of_ancestors[ancestor]),
+                self._fewest_generations(other_generations_of_ancestors[ancestor])
+            )
+            for ancestor in common
+        }
+
+    @staticmethod
+    def _fewest_generations(generations):
+        """Return the lowest number of generations included in a bit set of them."""
+        return (generations & -generations).bit_length() - 1
+
+    def _kids_of_all(self, people):
+        """Return the set of all the kids of any of the given people."""
+        kids = set()
+        for person in people:
+            kids |= self.kids.get(person, set())
+        return kids
+
+    def _relatives_of_all(self, people, relation):
+        """Return the set of all the people who bear the given relation to any of the given people."""
+        relatives = set()
+        for person in people:
+            relatives |= self.relatives(person=person, relation=relation)
+        return relatives
+
+    # Legal relations
+
+    def _kids(self, person):
+        """Return this person's kids."""
+        return self.kids.get(person, ())
+
+    def _sons(self, person):
+        """Return this person's sons."""
+        return {kid for kid in self.relatives(person=person, relation='kids') if kid.male}
+
+    def _daughters(self, person):
+        """Return this person's daughters."""
+        return {kid for kid in self.relatives(person=person, relation='kids') if kid.female}
+
+    def _grandparents(self, person):
+        """Return this person's grandparents."""
+        grandparents = set()
+        for parent in person.parents:
+            grandparents |= parent.parents
+        return grandparents
+
+    def _greatgrandparents(self, person):
+        """Return this person's great-grandparents."""
+        return self._relatives_of_all(people=person.parents, relation='grandparents')
+
+    def _ancestors(self, person):
+        """Return this person's ancestors."""
+        return self.ancestor_generations.get(person, ())
+
+    def _descendants(self, person):
+        """Return this person's descendants."""
+        descendants = set()
+        generation = self.kids.get(person, set())
+        while generation:
+            descendants |= generation
+            generation = self._kids_of_all(people=generation) - descendants
+        return descendants
+
+    def _siblings(self, person):
+        """Return this person's siblings, full and half."""
+        return self._kids_of_all(people=person.parents)
+
+    def _full_siblings(self, person):
+        """Return this person's full siblings."""
+        if not person.parents:
+            return ()
+        return self.kids.get(person.father, set()) & self.kids.get(person.mother, set())
+
+    def _half_siblings(self, person):
+        """Return this person's half siblings."""
+        if not person.parents:
+            return ()
+        return self.kids.get(person.father, set()) ^ self.kids.get(person.mother, set())
+
+    def _brothers(self, person):
+        """Return this person's brothers, full and half."""
+        return {sibling for sibling in self.relatives(person=person, relation='siblings') if sibling.male}
+
+    def _full_brothers(self, person):
+        """Return this person's full brothers."""
+        return {sibling for sibling in self.relatives(person=person, relation='full_siblings') if sibling.male}
+
+    def _half_brothers(self, person):
+        """Return this person's half brothers."""
+        return {sibling for sibling in self.relatives(person=person, relation='half_siblings') if sibling.male}
+
+    def _sisters(self, person):
+        """Return this person's sisters, full and half."""
+        return {sibling for sibling in self.relatives(person=person, relation='siblings') if sibling.female}
+
+    def _full_sisters(self, person):
+        """Return this person's full sisters."""
+        return {sibling for sibling in self.relatives(person=person, relation='full_siblings') if sibling.female}
+
+    def _half_sisters(self, person):
+        """Return this person's half sisters."""
+        return {sibling for sibling in self.relatives(person=person, relation='half_siblings') if sibling.female}
+
+    def _uncles(self, person):
+        """Return this person's uncles, i.e., the brothers of their parents."""
+        return self._relatives_of_all(people=person.parents, relation='brothers')
+
+    def _aunts(self, person):
+        """Return this person's aunts, i.e., the sisters of their parents."""
+        return self._relatives_of_all(people=person.parents, relation='sisters')
+
+    def _cousins(self, person):
+        """Return this person's (first) cousins."""
+        return self._kids_of_all(people=self._relatives_of_all(people=person.parents, relation='siblings'))
+
+    def _nephews(self, person):
+        """Return this person's nephews."""
+        return self._relatives_of_all(people=self.relatives(person=person, relation='siblings'), relation='sons')
+
+    def _nieces(self, person):
+        """Return this person's nieces."""
+        return self._relatives_of_all(
+            people=self.relatives(person=person, relation='siblings'), relation='daughters'
+        )
+
+    def _grandchildren(self, person):
+        """Return this person's grandchildren."""
+        return self._kids_of_all(people=self.kids.get(person, ()))
+
+    def _grandsons(self, person):
+        """Return this person's grandsons."""
+        return {kid for kid in self.relatives(person=person, relation='grandchildren') if kid.male}
+
+    def _granddaughters(self, person):
+        """Return this person's granddaughters."""
+        return {kid for kid in self.relatives(person=person, relation='grandchildren') if kid.female}
+
+    def _greatgrandchildren(self, person):
+        """Return this person's great-grandchildren."""
+        return self._kids_of_all(people=self.relatives(person=person, relation='grandchildren'))
+
+    def _greatgrandsons(self, person):
+        """Return this person's great-grandsons."""
+        return {kid for kid in self.relatives(person=person, relation='greatgrandchildren') if kid.male}
+
+    def _greatgranddaughters(self, person):
+        """Return this person's great-granddaughters."""
+        return {kid for kid in self.relatives(person=person, relation='greatgrandchildren') if kid.female}
+
+    def _immediate_family(self, person):
+        """Return this person's immediate family, which includes any spouses they did not divorce."""
+        return self._family_by_blood(person=person, extended=False) | self._spouses_not_divorced(person=person)
+
+    def _extended_family(self, person):
+        """Return this person's extended family, which includes their spouses' extended families."""
+        extended_family = self._family_by_blood(person=person, extended=True)
+        for spouse in self._spouses_not_divorced(person=person):
+            extended_family.add(spouse)
+            extended_family |= self._family_by_blood(person=spouse, extended=True)
+        return extended_family
+
+    def _family_by_blood(self, person, extended):
+        """Return this person's immediate or extended family, not counting anyone related to them by marriage."""
+        relations = ['grandparents', 'siblings', 'kids', 'grandchildren']
+        if extended:
+            relations += [
+                'greatgrandparents', 'greatgrandchildren', 'uncles', 'aunts', 'cousins', 'nieces', 'nephews'
+            ]
+        family = set(person.parents)
+        for relation in relations:
+            family |= self.relatives(person=person, relation=relation)
+        return family
+
+    @staticmethod
+    def _spouses_not_divorced(person):
+        """Return the people this person has married and not (yet) divorced."""
+        return {
+            spouse for marriage in person.marriages for spouse in marriage.subjects
+            if spouse is not person and marriage.terminus not in person.divorces
+        }
+
+    # Biological relations
+
+    @staticmethod
+    def _bio_parents(person):
+        """Return this person's biological parents."""
+        return {parent for parent in (person.biological_mother, person.biological_father) if parent}
+
+    def _bio_grandparents(self, person):
+        """Return this person's biological grandparents."""
+        bio_grandparents = set()
+        for parent in self._bio_parents(person=person):
+            bio_grandparents |= parent.parents
+        return bio_grandparents
+
+    def _bio_greatgrandparents(self, person):
+        """Return this person's biological great-grandparents."""
+        return self._relatives_of_all(people=self._bio_parents(person=person), relation='grandparents')
+
+    def _bio_ancestors(self, person):
+        """Return this person's biological ancestors."""
+        bio_parents = self._bio_parents(person=person)
+        return bio_parents | self._relatives_of_all(people=bio_parents, relation='ancestors')
+
+    def _bio_siblings(self, person):
+        """Return this person's biological siblings, full and half."""
+        return self._kids_of_all(people=self._bio_parents(person=person))
+
+    def _bio_full_siblings(self, person):
+        """Return this person's biological full siblings."""
+        if not person.parents:
+            return ()
+        return self.kids.get(person.biological_father, set()) & self.kids.get(person.biological_mother, set())
+
+    def _bio_half_siblings(self, person):
+        """Return this person's biological half siblings."""
+        if not person.parents:
+            return ()
+        return self.kids.get(person.biological_father, set()) ^ self.kids.get(person.biological_mother, set())
+
+    def _bio_brothers(self, person):
+        """Return this person's biological brothers, full and half."""
+        return {sibling for sibling in self.relatives(person=person, relation='bio_siblings') if sibling.male}
+
+    def _bio_full_brothers(self, person):
+        """Return this person's biological full brothers."""
+        return {sibling for sibling in self.relatives(person=person, relation='bio_full_siblings') if sibling.male}
+
+    def _bio_half_brothers(self, person):
+        """Return this person's biological half brothers."""
+        return {sibling for sibling in self.relatives(person=person, relation='bio_half_siblings') if sibling.male}
+
+    def _bio_sisters(self, person):
+        """Return this person's biological sisters, full and half."""
+        return {sibling for sibling in self.relatives(person=person, relation='bio_siblings') if sibling.female}
+
+    def _bio_full_sisters(self, person):
+        """Return this person's biological full sisters."""
+        return {
+            sibling for sibling in self.relatives(person=person, relation='bio_full_siblings') if sibling.female
+        }
+
+    def _bio_half_sisters(self, person):
+        """Return this person's biological half sisters."""
+        return {
+            sibling for sibling in self.relatives(person=person, relation='bio_half_siblings') if sibling.female
+        }
+
+    def _bio_uncles(self, person):
+        """Return this person's biological uncles."""
+        return self._relatives_of_all(people=self._bio_parents(person=person), relation='brothers')
+
+    def _bio_aunts(self, person):
+        """Return this person's biological aunts."""
+        return self._relatives_of_all(people=self._bio_parents(person=person), relation='sisters')
+
+    def _bio_cousins(self, person):
+        """Return this person's biological (first) cousins."""
+        return self._kids_of_all(
+            people=self._relatives_of_all(people=self._bio_parents(person=person), relation='siblings')
+        )
+
+    def _bio_nephews(self, person):
+        """Return this person's biological nephews."""
+        return self._relatives_of_all(people=self.relatives(person=person, relation='bio_siblings'), relation='sons')
+
+    def _bio_nieces(self, person):
+        """Return this person's biological nieces."""
+        return self._relatives_of_all(
+            people=self.relatives(person=person, relation='bio_siblings'), relation='daughters'
+        )
+
+    def _bio_immediate_family(self, person):
+        """Return this person's biological immediate family."""
+        bio_immediate_family = self._bio_parents(person=person)
+        for relation in ('bio_grandparents', 'bio_siblings'):
+            bio_immediate_family |= self.relatives(person=person, relation=relation)
+        return bio_immediate_family
+
+    def _bio_extended_family(self, person):
+        """Return this person's biological extended family."""
+        bio_extended_family = set(self.relatives(person=person, relation='bio_immediate_family'))
+        relations = ('bio_greatgrandparents', 'bio_uncles', 'bio_aunts', 'bio_cousins', 'bio_nieces', 'bio_nephews')
+        for relation in relations:
+            bio_extended_family |= self.relatives(person=person, relation=relation)
+        return bio_extended_family
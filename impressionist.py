@@ -1,24 +1,40 @@
-import json
-from productionist import Precondition, ConditionalViolation
+from productionist import Precondition, ConditionalViolation, load_json_grammar_specification
 
 
 class Impressionist(object):
     """An NLU module for in-game dialogue understanding."""
 
+    # Maps paths to grammar specifications to the nonterminal symbols parsed from them; these symbols
+    # are never modified, so they are parsed once per process and shared by every Impressionist
+    loaded_grammars = {}
+
     def __init__(self, game, debug=False):
         """Initialize an Impressionist object."""
         self.game = game
         self.debug = debug
-        self.nonterminal_symbols = self._init_parse_json_grammar_specification(
-            path_to_json_grammar_specification=game.config.path_to_dialogue_nlu_json_grammar_specification
-        )
+        path_to_json_grammar_specification = game.config.path_to_dialogue_nlu_json_grammar_specification
+        if path_to_json_grammar_specification not in Impressionist.loaded_grammars:
+            Impressionist.loaded_grammars[path_to_json_grammar_specification] = (
+                self._init_parse_json_grammar_specification(
+                    path_to_json_grammar_specification=path_to_json_grammar_specification,
+                    use_cache=game.config.cache_parsed_grammar_specifications
+                )
+            )
+        self.nonterminal_symbols = Impressionist.loaded_grammars[path_to_json_grammar_specification]
+        # Symbol references are matched case-insensitively; if two tags only differ in case,
+        # the one that comes first in self.nonterminal_symbols wins
+        self.symbols_by_lowercase_tag = {}
+        for symbol in self.nonterminal_symbols:
+            self.symbols_by_lowercase_tag.setdefault(symbol.tag.lower(), symbol)
 
     @staticmethod
-    def _init_parse_json_grammar_specification(path_to_json_grammar_specification):
+    def _init_parse_json_grammar_specification(path_to_json_grammar_specification, use_cache=True):
         """Parse a JSON grammar specification exported by Expressionist to instantiate nonterminal symbols."""
         # Parse the JSON specification to build a dictionary data structure
         symbol_objects = []
-        grammar_dictionary = json.loads(open(path_to_json_grammar_specification).read())
+        grammar_dictionary = load_json_grammar_specification(
+            path_to_json_grammar_specification=path_to_json_grammar_specification, use_cache=use_cache
+        )
         nonterminal_symbol_specifications = grammar_dictionary['nonterminals']
         for tag, nonterminal_symbol_specification in nonterminal_symbol_specifications.iteritems():
             raw_markup = nonterminal_symbol_specification['markup']
@@ -69,9 +85,9 @@ class Impressionist(object):
         actual_symbol_objects = set()
         for symbol_reference in symbol_references:
             try:
-                symbol_object = next(s for s in self.nonterminal_symbols if s.tag.lower() == symbol_reference.lower())
+                symbol_object = self.symbols_by_lowercase_tag[symbol_reference.lower()]
                 actual_symbol_objects.add(symbol_object)
-            except StopIteration:
+            except KeyError:
                 raise Exception(
                     "Impressionist encountered a strange symbol reference: {symbol_ref}".format(
                         symbol_ref=symbol_reference
@@ -236,13 +252,21 @@ class LineOfDialogue(object):
             self.topics_pushed |= symbol.topics_pushed
             self.topics_addressed |= symbol.topics_addressed
 
-    def realize(self, conversation_turn=None):
+    def bind_gaps(self, conversation=None):
+        """Return an empty list, since the line that the player composed has no gaps.
+
+        Note: Like realize(), this method exists to maintain an equivalent interface to
+        objects of the class Productionist.LineOfDialogue.
+        """
+        return []
+
+    def realize(self, conversation=None, state_tuple=None, gap_bindings=None):
         """Return the very line that the player composed.
 
         Note: This method exists to maintain an equivalent interface to objects of the
         classes Productionist.LineOfDialogue and Impressionist.LineOfDialogue, so that
         Conversation objects can call LineOfDialogue.realize() without needing to know
         which type of LineOfDialogue object is being referenced. This is why the method
-        takes the argument 'conversation_turn'.
+        takes the arguments 'conversation', 'state_tuple', and 'gap_bindings'.
         """
         return self.body
\ No newline at end of file
@@ -0,0 +1,361 @@
+from collections import OrderedDict
+
+
+# Codes for the blood relations that one person may bear to another, which are combined as bit
+# flags; except for the lineal relations, each of these corresponds to a pair of numbers of
+# generations separating the two people from a common ancestor (e.g., a cousin is someone
+# with whom I share an ancestor two generations up from each of us)
+GREATGRANDPARENT = 1 << 0
+GRANDPARENT = 1 << 1
+PARENTS_SIBLING = 1 << 2  # (2, 1): an ancestor two generations up from me is the other person's parent
+SIBLING = 1 << 3  # (1, 1)
+COUSIN = 1 << 4  # (2, 2)
+KID = 1 << 5
+SIBLINGS_KID = 1 << 6  # (1, 2)
+SECOND_COUSIN = 1 << 7  # (3, 3)
+GREATGRANDPARENTS_SIBLING = 1 << 8  # (4, 1)
+
+
+class Kinship(object):
+    """An engine that classifies the familial relations (blood, in-law, and step relations) of people to one another.
+
+    Blood relations are classified by relation codes that are computed from the numbers of
+    generations separating two people from their common ancestors, which are looked up in the
+    ancestor closure table of the game's Genealogy. Classifications are cached per (person,
+    other person) pair in a least-recently-used cache, which is cleared whenever a marriage,
+    divorce, or death changes who is related to whom (births don't invalidate anything, since
+    they only introduce relations between the newborn and everyone else).
+    """
+
+    def __init__(self, game):
+        """Initialize a Kinship object."""
+        self.game = game
+        # Maps (person, other person) pairs to tuples of the form (primary_relation, known_relations),
+        # where primary_relation is the first familial relation that Person.relation_to_me() checks
+        # for that holds, and known_relations is a tuple of the (relation, hinge) tuples for all the
+        # familial relations that Person.known_relation_to_me() checks for that hold; these are kept in
+        # order of last lookup, so that the least recently looked-up pair may be forgotten first
+        self.cache = OrderedDict()
+
+    def __str__(self):
+        """Return string representation."""
+        return "Kinship engine with {} cached pairs".format(len(self.cache))
+
+    def record_marriage(self, marriage):
+        """Record a marriage, which gives its subjects and their families new in-law and step relations."""
+        self.cache.clear()
+
+    def record_divorce(self, divorce):
+        """Record a divorce, which turns its subjects' in-law relations into relations to ex-spouses."""
+        self.cache.clear()
+
+    def record_death(self, death):
+        """Record a death, which may turn a spouse into a deceased spouse."""
+        self.cache.clear()
+
+    def relation(self, person, other_person):
+        """Return the primary familial relation of the other person to the given person, if any."""
+        return self._classification(person=person, other_person=other_person)[0]
+
+    def known_relations(self, person, other_person):
+        """Return a tuple of (relation, hinge) tuples for every familial relation of the other person to
+        the given person.
+        """
+        return self._classification(person=person, other_person=other_person)[1]
+
+    def relations(self, person, people):
+        """Return a dictionary mapping each of the given people to their primary familial relation to the
+        given person, if any (else None).
+        """
+        kin = self.kin_of(person=person)
+        return {
+            other_person: self.relation(person=person, other_person=other_person) if other_person in kin else None
+            for other_person in people
+        }
+
+    def kin_of(self, person):
+        """Return the set of everyone who may bear some familial relation to this person.
+
+        This includes everyone descended (within a few generations) from someone whose relation
+        codes are computed from, as well as the people who married into this person's close family.
+        """
+        genealogy = self.game.genealogy
+        ancestors = genealogy.ancestor_generations.get(person, {})
+        kin = {person} | set(ancestors) | genealogy.relatives(person=person, relation='kids')
+        for ancestor, generations in ancestors.iteritems():
+            if generations & 0b1110:  # Within three generations of this person
+                for relation in ('kids', 'grandchildren', 'greatgrandchildren'):
+                    kin |= genealogy.relatives(person=ancestor, relation=relation)
+            elif generations >> 4 & 1:
+                kin |= genealogy.relatives(person=ancestor, relation='kids')
+        close_family = (
+            {person} | person.parents | genealogy.relatives(person=person, relation='siblings') |
+            genealogy.relatives(person=person, relation='kids')
+        )
+        for relative in close_family:
+            for marriage in relative.marriages:
+                kin.update(marriage.subjects)
+        if person.spouse:
+            kin |= person.spouse.parents
+            kin |= genealogy.relatives(person=person.spouse, relation='kids')
+            kin |= genealogy.relatives(person=person.spouse, relation='siblings')
+        return kin
+
+    def _classification(self, person, other_person):
+        """Return the cached classification of the relation of the other person to the given person,
+        computing it if need be.
+        """
+        key = (person, other_person)
+        try:
+            classification = self.cache.pop(key)
+        except KeyError:
+            code = self._blood_relation_code(person=person, other_person=other_person)
+            classification = (
+                self._primary_relation(person=person, other_person=other_person, code=code),
+                tuple(self._known_relations(person=person, other_person=other_person, code=code))
+            )
+            if len(self.cache) >= self.game.config.kinship_cache_capacity:
+                self.cache.popitem(last=False)
+        self.cache[key] = classification
+        return classification
+
+    def _blood_relation_code(self, person, other_person):
+        """Return a code for the blood relations of the other person to the given person."""
+        genealogy = self.game.genealogy
+        ancestors = genealogy.ancestor_generations.get(person, {})
+        other_ancestors = genealogy.ancestor_generations.get(other_person, {})
+        # For j in 1, 2, and 3, reach[j] is a bit set of the numbers of generations separating the given
+        # person from the common ancestors that are j generations up from the other person
+        reach = [0, 0, 0, 0]
+        if len(other_ancestors) < len(ancestors):
+            common_ancestors = [ancestor for ancestor in other_ancestors if ancestor in ancestors]
+        else:
+            common_ancestors = [ancestor for ancestor in ancestors if ancestor in other_ancestors]
+        for ancestor in common_ancestors:
+            generations, other_generations = ancestors[ancestor], other_ancestors[ancestor]
+            for j in (1, 2, 3):
+                if other_generations >> j & 1:
+                    reach[j] |= generations
+        if other_person is person:
+            # No one is their own blood relative, except in a family tree so tangled that
+            # someone is the sibling of one of their own great-grandparents
+            return GREATGRANDPARENTS_SIBLING if reach[1] >> 4 & 1 else 0
+        generations_up = ancestors.get(other_person, 0)
+        generations_down = other_ancestors.get(person, 0)
+        code = 0
+        if generations_up >> 3 & 1:
+            code |= GREATGRANDPARENT
+        if generations_up >> 2 & 1:
+            code |= GRANDPARENT
+        if generations_down >> 1 & 1:
+            code |= KID
+        if reach[1] >> 1 & 1:
+            code |= SIBLING
+        if reach[3] >> 3 & 1:
+            code |= SECOND_COUSIN
+        # The remaining relations are implied by their numbers of generations, except when the two people
+        # are also related in a closer way that accounts for the same numbers (e.g., a sibling shares
+        # grandparents with me, just as a cousin does); since that only happens in tangled family trees,
+        # fall back to the genealogy in such cases
+        if reach[1] >> 2 & 1:
+            if not generations_up >> 1 & 1 or other_person in genealogy.relatives(
+                    person=person, relation='uncles' if other_person.male else 'aunts'):
+                code |= PARENTS_SIBLING
+        if reach[2] >> 2 & 1:
+            if not code & SIBLING or other_person in genealogy.relatives(person=person, relation='cousins'):
+                code |= COUSIN
+        if reach[2] >> 1 & 1:
+            if not code & KID or other_person in genealogy.relatives(
+                    person=person, relation='nephews' if other_person.male else 'nieces'):
+                code |= SIBLINGS_KID
+        if reach[1] >> 4 & 1:
+            if not code & GREATGRANDPARENT or (
+                    genealogy.relatives(person=person, relation='greatgrandparents') &
+                    genealogy.relatives(person=other_person, relation='siblings')):
+                code |= GREATGRANDPARENTS_SIBLING
+        return code
+
+    @staticmethod
+    def _divorced(person, other_person):
+        """Return whether the other person was a party to any of this person's divorces."""
+        return any(other_person in divorce.subjects for divorce in person.divorces)
+
+    @staticmethod
+    def _married_until(person, other_person, terminus):
+        """Return whether the other person was a party to a marriage of this person's whose terminus is
+        the given event (where a terminus of None means an ongoing marriage).
+        """
+        return any(
+            other_person in marriage.subjects and marriage.terminus is terminus for marriage in person.marriages
+        )
+
+    def _primary_relation(self, person, other_person, code):
+        """Return the primary familial relation of the other person to the given person, if any.
+
+        See Person.relation_to_me() for the order in which relations take precedence.
+        """
+        genealogy = self.game.genealogy
+        male = other_person.male
+        spouse = person.spouse
+        if other_person is person:
+            return 'self'
+        elif code & GREATGRANDPARENT:
+            return 'greatgrandfather' if male else 'greatgrandmother'
+        elif code & GRANDPARENT:
+            return 'grandfather' if male else 'grandmother'
+        elif other_person is person.father:
+            return 'father'
+        elif other_person is person.mother:
+            return 'mother'
+        elif code & PARENTS_SIBLING:
+            return 'uncle' if male else 'aunt'
+        elif code & SIBLING:
+            return 'brother' if male else 'sister'
+        elif code & COUSIN:
+            return 'cousin'
+        elif code & KID:
+            return 'son' if male else 'daughter'
+        elif code & SIBLINGS_KID:
+            return 'nephew' if male else 'niece'
+        elif other_person is spouse:
+            return 'husband' if male else 'wife'
+        elif self._divorced(person=person, other_person=other_person):
+            return 'ex-husband' if male else 'ex-wife'
+        elif person.widowed and self._married_until(
+                person=person, other_person=other_person, terminus=other_person.death):
+            return 'deceased husband' if male else 'deceased wife'
+        siblings = genealogy.relatives(person=person, relation='siblings')
+        if other_person.spouse in siblings or spouse in genealogy.relatives(person=other_person, relation='siblings'):
+            return 'brother in law' if male else 'sister in law'
+        elif person.father and self._divorced(person=person.father, other_person=other_person):
+            return "father's ex-{}".format('husband' if male else 'wife')
+        elif person.mother and self._divorced(person=person.mother, other_person=other_person):
+            return "mother's ex-{}".format('husband' if male else 'wife')
+        brothers = genealogy.relatives(person=person, relation='brothers')
+        sisters = genealogy.relatives(person=person, relation='sisters')
+        if any(self._divorced(person=brother, other_person=other_person) for brother in brothers):
+            return "brother's ex-{}".format('husband' if male else 'wife')
+        elif any(self._divorced(person=sister, other_person=other_person) for sister in sisters):
+            return "sister's ex-{}".format('husband' if male else 'wife')
+        elif any(self._married_until(person=brother, other_person=other_person, terminus=other_person.death)
+                 for brother in brothers):
+            return "brother's deceased {}".format('husband' if male else 'wife')
+        elif any(self._married_until(person=sister, other_person=other_person, terminus=other_person.death)
+                 for sister in sisters):
+            return "sister's deceased {}".format('husband' if male else 'wife')
+        elif any(self._married_until(person=brother, other_person=other_person, terminus=brother.death)
+                 for brother in brothers):
+            return "deceased brother's former {}".format('husband' if male else 'wife')
+        elif any(self._married_until(person=sister, other_person=other_person, terminus=sister.death)
+                 for sister in sisters):
+            return "deceased sister's former {}".format('husband' if male else 'wife')
+        elif other_person.spouse in genealogy.relatives(person=person, relation='kids'):
+            return 'son in law' if male else 'daughter in law'
+        elif spouse and other_person in spouse.parents:
+            return 'father in law' if male else 'mother in law'
+        elif spouse and other_person in genealogy.relatives(person=spouse, relation='sons'):
+            return 'stepson'
+        elif spouse and other_person in genealogy.relatives(person=spouse, relation='daughters'):
+            return 'stepdaughter'
+        elif person.mother and other_person is person.mother.spouse:
+            return 'stepfather' if male else 'stepmother'
+        elif person.father and other_person is person.father.spouse:
+            return 'stepfather' if male else 'stepmother'
+        elif code & SECOND_COUSIN:
+            return 'second cousin'
+        elif code & GREATGRANDPARENTS_SIBLING:
+            return 'great uncle' if male else 'great aunt'
+        else:
+            return None
+
+    def _known_relations(self, person, other_person, code):
+        """Return a list of (relation, hinge) tuples for every familial relation of the other person to
+        the given person, in the order that Person.known_relation_to_me() reports them.
+        """
+        genealogy = self.game.genealogy
+        male = other_person.male
+        spouse = person.spouse
+        relations = []
+        if other_person is person:
+            relations.append(('self', None))
+        if code & GREATGRANDPARENT:
+            relations.append(('greatgrandfather' if male else 'greatgrandmother', None))
+        if code & GRANDPARENT:
+            relations.append(('grandfather' if male else 'grandmother', None))
+        if other_person is person.father:
+            relations.append(('father', None))
+        if other_person is person.mother:
+            relations.append(('mother', None))
+        if code & PARENTS_SIBLING:
+            relations.append(('uncle' if male else 'aunt', None))
+        if code & SIBLING:
+            relations.append(('brother' if male else 'sister', None))
+        if code & COUSIN:
+            relations.append(('cousin', None))
+        if code & KID:
+            relations.append(('son' if male else 'daughter', None))
+        if code & SIBLINGS_KID:
+            relations.append(('nephew' if male else 'niece', None))
+        if other_person is spouse:
+            relations.append(('husband' if male else 'wife', None))
+        if self._divorced(person=person, other_person=other_person):
+            relations.append(('ex-husband' if male else 'ex-wife', None))
+        if person.widowed and self._married_until(
+                person=person, other_person=other_person, terminus=other_person.death):
+            relations.append(('deceased husband' if male else 'deceased wife', None))
+        if other_person.spouse in genealogy.relatives(person=person, relation='siblings'):
+            relation = "{}'s {}".format(
+                'sister' if other_person.spouse.female else 'brother', 'husband' if male else 'wife'
+            )
+            relations.append((relation, other_person.spouse))
+        if spouse in genealogy.relatives(person=other_person, relation='siblings'):
+            relation = "{}'s {}".format('husband' if spouse.male else 'wife', 'brother' if male else 'sister')
+            relations.append((relation, spouse))
+        if person.father and self._divorced(person=person.father, other_person=other_person):
+            relations.append(("father's ex-{}".format('husband' if male else 'wife'), person.father))
+        if person.mother and self._divorced(person=person.mother, other_person=other_person):
+            relations.append(("mother's ex-{}".format('husband' if male else 'wife'), person.mother))
+        brothers = genealogy.relatives(person=person, relation='brothers')
+        sisters = genealogy.relatives(person=person, relation='sisters')
+        for siblings, sibling_relation in ((brothers, 'brother'), (sisters, 'sister')):
+            hinge = next((s for s in siblings if self._divorced(person=s, other_person=other_person)), None)
+            if hinge is not None:
+                relations.append(("{}'s ex-{}".format(sibling_relation, 'husband' if male else 'wife'), hinge))
+        for siblings, sibling_relation in ((brothers, 'brother'), (sisters, 'sister')):
+            if any(s is not other_person and self._married_until(
+                    person=s, other_person=other_person, terminus=other_person.death) for s in siblings):
+                hinge = next(
+                    s for s in siblings if self._married_until(
+                        person=s, other_person=other_person, terminus=other_person.death)
+                )
+                relation = "{}'s deceased {}".format(sibling_relation, 'husband' if male else 'wife')
+                relations.append((relation, hinge))
+        for siblings, sibling_relation in ((brothers, 'brother'), (sisters, 'sister')):
+            if any(s is not other_person and self._married_until(
+                    person=s, other_person=other_person, terminus=s.death) for s in siblings):
+                hinge = next(
+                    s for s in siblings if self._married_until(person=s, other_person=other_person, terminus=s.death)
+                )
+                relation = "deceased {}'s former {}".format(sibling_relation, 'husband' if male else 'wife')
+                relations.append((relation, hinge))
+        if other_person.spouse in genealogy.relatives(person=person, relation='kids'):
+            relation = "{}'s {}".format(
+                'son' if other_person.spouse.male else 'daughter', 'husband' if male else 'wife'
+            )
+            relations.append((relation, other_person.spouse))
+        if spouse and other_person in spouse.parents:
+            relation = "{}'s {}".format('husband' if spouse.male else 'wife', 'father' if male else 'mother')
+            relations.append((relation, spouse))
+        if spouse and other_person in genealogy.relatives(person=spouse, relation='sons') and not code & KID:
+            relations.append(('stepson', None))
+        if spouse and other_person in genealogy.relatives(person=spouse, relation='daughters') and not code & KID:
+            relations.append(('stepdaughter', None))
+        if person.mother and other_person is person.mother.spouse and other_person is not person.father:
+            relations.append(('stepfather' if male else 'stepmother', None))
+        if person.father and other_person is person.father.spouse and other_person is not person.mother:
+            relations.append(('stepfather' if male else 'stepmother', None))
+        if code & SECOND_COUSIN and not code & (SIBLING | COUSIN):
+            relations.append(('second cousin', None))
+        if code & GREATGRANDPARENTS_SIBLING:
+            relations.append(('great uncle' if male else 'great aunt', None))
+        return relations
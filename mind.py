@@ -1,4 +1,6 @@
 import random
+from array import array
+from collections import deque
 
 
 class Mind(object):
@@ -15,10 +17,15 @@ class Mind(object):
         # A mind's preoccupation is an entity that this person is currently preoccupied
         # by, e.g., someone for whom this person is trying to fill in missing belief facets
         self.preoccupation = None
-        self.thoughts = []
+        # The most recent thoughts had by this person, from oldest to newest; once this fills
+        # up, each new thought pushes out the oldest one (see think())
+        self.thoughts = deque(maxlen=self.person.game.config.number_of_recent_thoughts)
+        # Maps nonrepeatable symbols that were expanded to produce the thoughts in self.thoughts
+        # to the number of those thoughts that each was expanded to produce; maintained by think()
+        self.recently_expanded_nonrepeatable_symbols = {}
         self.salient_action_selector = None
-        self.receptors = {}  # Dictionary mapping signal names to corresponding signal receptors
-        self.synapses = {}
+        # The signal receptors in this mind and the synapses connecting them
+        self.receptor_graph = ReceptorGraph(mind=self)
 
     def __str__(self):
         """Return string representation."""
@@ -58,8 +65,7 @@ class Mind(object):
     @property
     def recent_thoughts(self):
         """Return the N most recent thoughts by this person, where N is specified in config.py."""
-        number_of_recent_thoughts = self.person.game.config.number_of_recent_thoughts
-        return self.thoughts[:number_of_recent_thoughts]
+        return self.thoughts
 
     def last_thought_had_signal(self, signal_name):
         """Return this person's last thought."""
@@ -86,9 +92,24 @@ class Mind(object):
         if not all_matches:
             return None
         # Return the most salient match (meaning most salient to this person)
-        most_salient_match = max(all_matches, key=lambda match: self.person.salience_of_other_people.get(match, 0.0))
+        salience_of_matches = self.person.saliences_of(entities=all_matches)
+        most_salient_match = all_matches[max(xrange(len(all_matches)), key=salience_of_matches.__getitem__)]
         return most_salient_match
 
+    @property
+    def receptors(self):
+        """Return a dictionary-like view mapping signal names to this mind's receptors for those signals."""
+        return ReceptorsView(mind=self)
+
+    @property
+    def synapses(self):
+        """Return a dictionary mapping (sorted) pairs of signal names to the synapses connecting their receptors."""
+        synapses = {}
+        for receptor in self.receptors.itervalues():
+            for other_receptor, synapse in receptor.synapses.iteritems():
+                synapses[tuple(sorted([receptor.signal, other_receptor.signal]))] = synapse
+        return synapses
+
     def associate(self, artifact):
         """Associate the signals emitting from an artifact with salient notions in this mind to
         produce a set of stimuli, which may elicit a thought.
@@ -103,15 +124,19 @@ class Mind(object):
             stimuli[signal] += strength
         # Boost the signals according to any corresponding signal receptors that
         # this person may have
+        receptor_graph = self.receptor_graph
+        activations = {}
         for signal, _ in artifact.signals:
-            if signal in self.receptors:
-                stimuli[signal] += self.receptors[signal].voltage
-                # Generate an action potential, which will propagate activity across this
-                # receptors synapses to potentially bring in more stimuli
-                for activated_signal, activated_signal_voltage in self.receptors[signal].activate():
-                    if activated_signal not in stimuli:
-                        stimuli[activated_signal] = 0
-                    stimuli[activated_signal] += activated_signal_voltage
+            index = receptor_graph.indices.get(signal)
+            if index is not None:
+                stimuli[signal] += receptor_graph.voltages[index]
+                activations[index] = activations.get(index, 0) + 1
+        # Generate action potentials in all the activated receptors at once, which will propagate
+        # activity across their synapses to potentially bring in more stimuli
+        for activated_signal, activated_signal_voltage in receptor_graph.propagate(activations).iteritems():
+            if activated_signal not in stimuli:
+                stimuli[activated_signal] = 0
+            stimuli[activated_signal] += activated_signal_voltage
         return stimuli
 
     def elicit_thought(self, stimuli):
@@ -130,30 +155,43 @@ class Mind(object):
 
     def think(self, thought):
         """Think a thought."""
-        self.thoughts.append(thought)
+        self._remember_thought(thought=thought)
         thought.realize()
         thought.execute()
 
+    def _remember_thought(self, thought):
+        """Add a thought to this person's recent thoughts, forgetting the oldest one if need be."""
+        if len(self.thoughts) == self.thoughts.maxlen:
+            forgotten_thought = self.thoughts.popleft()
+            for symbol in forgotten_thought.nonterminal_symbols:
+                if symbol.nonrepeatable:
+                    self.recently_expanded_nonrepeatable_symbols[symbol] -= 1
+                    if not self.recently_expanded_nonrepeatable_symbols[symbol]:
+                        del self.recently_expanded_nonrepeatable_symbols[symbol]
+            if self.person.game.config.spill_forgotten_thoughts_to_event_log:
+                self.person.game.events.append(forgotten_thought)
+        self.thoughts.append(thought)
+        for symbol in thought.nonterminal_symbols:
+            if symbol.nonrepeatable:
+                if symbol not in self.recently_expanded_nonrepeatable_symbols:
+                    self.recently_expanded_nonrepeatable_symbols[symbol] = 0
+                self.recently_expanded_nonrepeatable_symbols[symbol] += 1
+
     def update_receptor_voltages_and_synapse_weights(self, voltage_updates):
         """Update the voltages of this person's signal receptors."""
+        receptor_graph = self.receptor_graph
         # Add receptors for all the new signals that have elicited a thought in
         # this mind for the first time
-        for signal in voltage_updates:
-            if signal not in self.receptors:
-                self.receptors[signal] = Receptor(mind=self, signal=signal)
+        indices = [receptor_graph.receptor_index(signal) for signal in voltage_updates]
         # Now, update receptor voltages and instantiate new synapses (or strengthen
         # existing ones)
-        for signal, voltage_update in voltage_updates.iteritems():
+        for index, voltage_update in zip(indices, voltage_updates.itervalues()):
             # Update voltages
-            self.receptors[signal].voltage += voltage_update
+            receptor_graph.voltages[index] += voltage_update
             # Instantiate/strengthen synapses (i.e., increase their weights) for all pairs of signals
-            for other_signal in voltage_updates:
-                if other_signal != signal:
-                    # If no such synapse yet exists, instantiate one
-                    if tuple(sorted([signal, other_signal])) not in self.synapses:
-                        receptors = (self.receptors[signal], self.receptors[other_signal])
-                        Synapse(receptors=receptors)
-                    self.receptors[signal].synapses[self.receptors[other_signal]].strengthen()
+            for other_index in indices:
+                if other_index != index:
+                    receptor_graph.strengthen(index, other_index)
 
 
 class Feature(float):
@@ -175,6 +213,157 @@ class Feature(float):
         return float.__new__(cls, value)
 
 
+class ReceptorGraph(object):
+    """The signal receptors in the mind of a person, along with the synapses connecting them.
+
+    Receptors are assigned indices in the order that their signals first elicit a thought in
+    this mind, and the synapse graph is stored as a sparse, symmetric adjacency structure over
+    those indices: for each receptor, parallel arrays hold the indices of the receptors it is
+    connected to and the weights of the synapses connecting them. This keeps a mind's synapses
+    compact as its thoughts accumulate, and it allows activity to be propagated from any number
+    of activated receptors in a single pass (see propagate()). Receptor and Synapse objects are
+    only views onto this structure.
+    """
+
+    def __init__(self, mind):
+        """Initialize a ReceptorGraph object."""
+        self.mind = mind
+        self.signals = []  # Maps receptor indices to the signals they receive
+        self.indices = {}  # Maps signals to the indices of their receptors
+        self.voltages = array('d')
+        # For each receptor index, the indices of the receptors that it is connected to by
+        # synapses, and the weights of those synapses, in parallel arrays
+        self.neighbors = []
+        self.weights = []
+        # Maps (index, other_index) pairs to the position of other_index in self.neighbors[index]
+        self.positions = {}
+
+    def __str__(self):
+        """Return string representation."""
+        return "Receptor graph in the {mind} ({n_receptors} receptors, {n_synapses} synapses)".format(
+            mind=self.mind, n_receptors=len(self.signals), n_synapses=self.number_of_synapses
+        )
+
+    @property
+    def number_of_synapses(self):
+        """Return the number of synapses in this graph."""
+        return len(self.positions) / 2
+
+    def receptor_index(self, signal):
+        """Return the index of the receptor for the given signal, adding such a receptor if there isn't one yet."""
+        try:
+            return self.indices[signal]
+        except KeyError:
+            index = len(self.signals)
+            self.signals.append(signal)
+            self.indices[signal] = index
+            self.voltages.append(0)
+            self.neighbors.append(array('i'))
+            self.weights.append(array('d'))
+            return index
+
+    def strengthen(self, index, other_index):
+        """Strengthen the synapse between the receptors with the given indices, instantiating it if need be."""
+        config = self.mind.person.game.config
+        try:
+            position = self.positions[(index, other_index)]
+            other_position = self.positions[(other_index, index)]
+        except KeyError:
+            position = len(self.neighbors[index])
+            self.neighbors[index].append(other_index)
+            self.weights[index].append(config.signal_receptor_synapse_starting_weight)
+            self.positions[(index, other_index)] = position
+            other_position = len(self.neighbors[other_index])
+            self.neighbors[other_index].append(index)
+            self.weights[other_index].append(config.signal_receptor_synapse_starting_weight)
+            self.positions[(other_index, index)] = other_position
+        self.weights[index][position] += config.signal_receptor_synapse_weight_increase_increment
+        self.weights[other_index][other_position] += config.signal_receptor_synapse_weight_increase_increment
+
+    def weight(self, index, other_index):
+        """Return the weight of the synapse between the receptors with the given indices."""
+        return self.weights[index][self.positions[(index, other_index)]]
+
+    def propagate(self, activations):
+        """Propagate action potentials from activated receptors across their synapses.
+
+        This multiplies the (sparse) vector of activations against the synapse weight matrix, and
+        so an activated receptor contributes to its neighbors in proportion to the weights of the
+        synapses connecting them.
+
+        @param activations: A dictionary mapping the indices of activated receptors to the
+                            number of times each of them was activated.
+        @return: A dictionary mapping the signals of the receptors reached by the action
+                 potentials to the voltage that reached them.
+        """
+        multiplier = self.mind.person.game.config.action_potential_signal_weight_multiplier
+        voltages_by_index = {}
+        for index, n_activations in activations.iteritems():
+            for other_index, weight in zip(self.neighbors[index], self.weights[index]):
+                voltages_by_index[other_index] = voltages_by_index.get(other_index, 0) + n_activations*weight
+        signals = self.signals
+        return {signals[index]: multiplier*voltage for index, voltage in voltages_by_index.iteritems()}
+
+
+class ReceptorsView(object):
+    """A read-only, dictionary-like view of the receptors in a mind, keyed by signal name.
+
+    Values are Receptor objects, which are materialized from the mind's ReceptorGraph as they
+    are looked up; this allows grammar preconditions like "'do depart' in thinker.mind.receptors"
+    to be evaluated without materializing every receptor in the mind.
+    """
+
+    def __init__(self, mind):
+        """Initialize a ReceptorsView object."""
+        self.mind = mind
+
+    def __getitem__(self, signal):
+        """Return the receptor for the given signal, raising a KeyError if there isn't one."""
+        if signal not in self.mind.receptor_graph.indices:
+            raise KeyError(signal)
+        return Receptor(mind=self.mind, signal=signal)
+
+    def __contains__(self, signal):
+        """Return whether this mind has a receptor for the given signal."""
+        return signal in self.mind.receptor_graph.indices
+
+    def __len__(self):
+        """Return the number of receptors in this mind."""
+        return len(self.mind.receptor_graph.signals)
+
+    def __iter__(self):
+        """Iterate over the signals that this mind has receptors for, in the order they were added."""
+        return iter(self.mind.receptor_graph.signals)
+
+    def keys(self):
+        """Return the signals that this mind has receptors for, in the order they were added."""
+        return list(self)
+
+    def itervalues(self):
+        """Iterate over the receptors in this mind, in the order they were added."""
+        for signal in self.mind.receptor_graph.signals:
+            yield Receptor(mind=self.mind, signal=signal)
+
+    def values(self):
+        """Return the receptors in this mind, in the order they were added."""
+        return list(self.itervalues())
+
+    def iteritems(self):
+        """Iterate over (signal, receptor) pairs for the receptors in this mind."""
+        for signal in self.mind.receptor_graph.signals:
+            yield signal, Receptor(mind=self.mind, signal=signal)
+
+    def items(self):
+        """Return (signal, receptor) pairs for the receptors in this mind."""
+        return list(self.iteritems())
+
+    def get(self, signal, default=None):
+        """Return the receptor for the given signal, or the default if there isn't one."""
+        if signal not in self.mind.receptor_graph.indices:
+            return default
+        return Receptor(mind=self.mind, signal=signal)
+
+
 class Receptor(object):
     """A signal receptor in the mind of a person.
 
@@ -198,14 +387,16 @@ class Receptor(object):
     signals become associated in the mind of characters to the degree that
     they have co-occurred in their cumulative subjective experience of the
     world. (This is a loose operationalization of long-term potentiation.)
+
+    Receptors are stored in their mind's ReceptorGraph, and Receptor objects are
+    views onto that.
     """
 
     def __init__(self, mind, signal):
         """Initialize a Receptor object."""
         self.mind = mind
         self.signal = signal  # ID of the signal (e.g., 'job' or a character object's ID in memory)
-        self.voltage = 0
-        self.synapses = {}
+        self.index = mind.receptor_graph.indices[signal]
 
     def __str__(self):
         """Return string representation."""
@@ -215,46 +406,63 @@ class Receptor(object):
             voltage=self.voltage
         )
 
+    def __eq__(self, other):
+        """Return whether this is a view onto the same receptor as the other one."""
+        return isinstance(other, Receptor) and self.mind is other.mind and self.index == other.index
+
+    def __ne__(self, other):
+        """Return whether this is a view onto a different receptor than the other one."""
+        return not self == other
+
+    def __hash__(self):
+        """Return a hash of this receptor."""
+        return hash((id(self.mind), self.index))
+
+    @property
+    def voltage(self):
+        """Return the voltage of this receptor."""
+        return self.mind.receptor_graph.voltages[self.index]
+
+    @property
+    def synapses(self):
+        """Return a dictionary mapping the receptors connected to this one to the synapses connecting them."""
+        receptor_graph = self.mind.receptor_graph
+        synapses = {}
+        for other_index in receptor_graph.neighbors[self.index]:
+            other_receptor = Receptor(mind=self.mind, signal=receptor_graph.signals[other_index])
+            synapses[other_receptor] = Synapse(receptors=(self, other_receptor))
+        return synapses
+
     def activate(self):
         """Activate this signal receptor to generate an action potential that will propagate across its synapses.
 
         Specifically, this method returns a set of receptors activated by the action potential, along
         with the associated synapse weights.
         """
-        activations = set()
-        for synapse in self.synapses.values():
-            other_receptor = synapse.other_receptor(receptor=self)
-            activated_signal = other_receptor.signal
-            activated_signal_weight = synapse.config.action_potential_signal_weight_multiplier * synapse.weight
-            activations.add((activated_signal, activated_signal_weight))
-        return activations
+        return set(self.mind.receptor_graph.propagate(activations={self.index: 1}).iteritems())
 
     def most_associated_signals(self, n=3, excluding=None):
         """Return the signals associated with n heaviest synapses connected to this receptor."""
         excluding = excluding if excluding else []
-        synapses_sorted_by_weight = sorted(
-            {s for s in self.synapses if s.signal not in excluding}, key=lambda s: self.synapses[s].weight
-        )
-        return [s.signal for s in synapses_sorted_by_weight][:n]
+        receptor_graph = self.mind.receptor_graph
+        weights_and_signals = [
+            (weight, receptor_graph.signals[other_index]) for other_index, weight in
+            zip(receptor_graph.neighbors[self.index], receptor_graph.weights[self.index])
+        ]
+        weights_and_signals.sort(key=lambda weight_and_signal: weight_and_signal[0])
+        return [signal for _, signal in weights_and_signals if signal not in excluding][:n]
 
 
 class Synapse(object):
-    """A synapse in the mind of a person that connects two signal receptors and has a weight."""
+    """A synapse in the mind of a person that connects two signal receptors and has a weight.
+
+    Synapses are stored in their mind's ReceptorGraph, and Synapse objects are views onto that.
+    """
 
     def __init__(self, receptors):
         """Initialize a Synapse object."""
-        # We'll need to make a lot of calls to config -- amortize this by setting it
-        # as an attribute on this class
-        self.config = list(receptors)[0].mind.person.game.config
         self.receptors = receptors
-        self.weight = self.config.signal_receptor_synapse_starting_weight
-        # Update the .synapses attribute of the receptors
-        receptor, other_receptor = receptors
-        receptor.synapses[other_receptor] = self
-        other_receptor.synapses[receptor] = self
-        # Update the .synapses attribute of the mind
-        mind_synapses_key = tuple(sorted([receptors[0].signal, receptors[1].signal]))
-        self.receptors[0].mind.synapses[mind_synapses_key] = self
+        self.receptor_graph = receptors[0].mind.receptor_graph
 
     def __str__(self):
         """Return string representation."""
@@ -268,10 +476,15 @@ class Synapse(object):
             )
         )
 
+    @property
+    def weight(self):
+        """Return the weight of this synapse."""
+        return self.receptor_graph.weight(self.receptors[0].index, self.receptors[1].index)
+
     def other_receptor(self, receptor):
         """Return the receptor incident on this synpase that is not the given receptor."""
-        return self.receptors[0] if self.receptors[0] is not receptor else self.receptors[1]
+        return self.receptors[0] if self.receptors[0] != receptor else self.receptors[1]
 
     def strengthen(self):
         """Strengthen this synapse."""
-        self.weight += self.config.signal_receptor_synapse_weight_increase_increment
+        self.receptor_graph.strengthen(self.receptors[0].index, self.receptors[1].index)
@@ -16,6 +16,12 @@ class Occupation(object):
         self.company = company
         self.shift = shift
         self.company.employees.add(self)
+        self.company.employee_counts[person] = self.company.employee_counts.get(person, 0) + 1
+        if self.company.employee_counts[person] == 1 and self.company.__class__.__name__ != 'ApartmentComplex':
+            # This person now works on the company's lot (apartment complexes count only their residents)
+            self.company.lot.adjust_population(1)
+        self.company.city.practitioners.setdefault(self.__class__, set()).add(self)
+        self.company.city.practitioners_version += 1
         self.start_date = person.game.year
         self.hiring = None  # event.Hiring object holding data about the hiring; gets set by that object's __init__()
         self.end_date = None  # Changed by self.terminate
@@ -38,16 +44,14 @@ class Occupation(object):
         salience_change_for_new_coworker = (
             self.person.game.config.salience_increment_from_relationship_change['coworker']
         )
-        for coworker in person.coworkers:
-            person.update_salience_of(entity=coworker, change=salience_change_for_new_coworker)
-            coworker.update_salience_of(entity=person, change=salience_change_for_new_coworker)
+        person.update_salience_of_many(entities=person.coworkers, change=salience_change_for_new_coworker)
+        person.update_salience_of_me(people=person.coworkers, change=salience_change_for_new_coworker)
         # Update the salience value for this person held by everyone else in the city to
         # reflect their new job level
         boost_in_salience_for_this_job_level = self.person.game.config.salience_job_level_boost(
             job_level=self.level
         )
-        for resident in company.city.residents:
-            resident.update_salience_of(entity=self.person, change=boost_in_salience_for_this_job_level)
+        self.person.update_salience_of_me(people=company.city.residents, change=boost_in_salience_for_this_job_level)
         # Update all relationships this person has to reflect the new job-level difference
         # between this person and the respective other person
         for other_person in self.person.relationships:
@@ -95,6 +99,13 @@ class Occupation(object):
         self.terminus = reason
         self.company.employees.remove(self)
         self.company.former_employees.add(self)
+        self.company.employee_counts[self.person] -= 1
+        if not self.company.employee_counts[self.person]:
+            del self.company.employee_counts[self.person]
+            if self.company.__class__.__name__ != 'ApartmentComplex':
+                self.company.lot.adjust_population(-1)
+        self.company.city.practitioners[self.__class__].remove(self)
+        self.company.city.practitioners_version += 1
         if self is self.company.owner:
             self.company.former_owners.append(self)
         # If this isn't an in-house promotion, update a bunch of attributes
@@ -113,13 +124,11 @@ class Occupation(object):
                 config.salience_increment_from_relationship_change["former coworker"] -
                 config.salience_increment_from_relationship_change["coworker"]
             )
-            for employee in self.company.employees:
-                employee.person.update_salience_of(
-                    entity=self.person, change=change_in_salience_for_former_coworker
-                )
-                self.person.update_salience_of(
-                    entity=employee.person, change=change_in_salience_for_former_coworker
-                )
+            former_coworkers = [employee.person for employee in self.company.employees]
+            self.person.update_salience_of_me(people=former_coworkers, change=change_in_salience_for_former_coworker)
+            self.person.update_salience_of_many(
+                entities=former_coworkers, change=change_in_salience_for_former_coworker
+            )
         # This position is now vacant, so now have the company that this person worked
         # for fill that now vacant position (which may cause a hiring chain) unless
         # this position is supplemental (i.e., not vital to this businesses' basic
@@ -151,11 +160,10 @@ class Occupation(object):
             change_in_salience_for_this_job_level = self.person.game.config.salience_job_level_boost(
                 job_level=self.level
             )
-            for resident in self.company.city.residents:
-                # Note the minus sign here
-                resident.update_salience_of(
-                    entity=self.person, change=-change_in_salience_for_this_job_level
-                )
+            # Note the minus sign here
+            self.person.update_salience_of_me(
+                people=self.company.city.residents, change=-change_in_salience_for_this_job_level
+            )
         # Finally, if this was a Lawyer position, have the law firm rename itself to
         # no longer include this person's name
         if self.__class__ is Lawyer:
@@ -87,57 +87,28 @@ class Person(object):
         self.suffix = None
         self.maiden_name = None
         self.named_for = (None, None)  # From whom first and middle name originate, respectively
-        # Prepare familial attributes that get populated by self.init_familial_attributes()
-        self.ancestors = set()  # Biological only
-        self.descendants = set()  # Biological only
-        self.immediate_family = set()
-        self.extended_family = set()
-        self.greatgrandparents = set()
-        self.grandparents = set()
-        self.aunts = set()
-        self.uncles = set()
-        self.siblings = set()
-        self.full_siblings = set()
-        self.half_siblings = set()
-        self.brothers = set()
-        self.full_brothers = set()
-        self.half_brothers = set()
-        self.sisters = set()
-        self.full_sisters = set()
-        self.half_sisters = set()
-        self.cousins = set()
-        self.kids = set()
-        self.sons = set()
-        self.daughters = set()
-        self.nephews = set()
-        self.nieces = set()
-        self.grandchildren = set()
-        self.grandsons = set()
-        self.granddaughters = set()
-        self.greatgrandchildren = set()
-        self.greatgrandsons = set()
-        self.greatgranddaughters = set()
-        self.bio_parents = set()
-        self.bio_grandparents = set()
-        self.bio_siblings = set()
-        self.bio_full_siblings = set()
-        self.bio_half_siblings = set()
-        self.bio_brothers = set()
-        self.bio_full_brothers = set()
-        self.bio_half_brothers = set()
-        self.bio_sisters = set()
-        self.bio_full_sisters = set()
-        self.bio_half_sisters = set()
-        self.bio_immediate_family = set()
-        self.bio_greatgrandparents = set()
-        self.bio_uncles = set()
-        self.bio_aunts = set()
-        self.bio_cousins = set()
-        self.bio_nephews = set()
-        self.bio_nieces = set()
-        self.bio_ancestors = set()
-        self.bio_extended_family = set()
-        # Set familial attributes; update those of family members
+        # Prepare attributes representing events in this person's life
+        self.birth = birth
+        self.adoption = None
+        self.marriage = None
+        self.marriages = []
+        self.divorces = []
+        self.adoptions = []
+        self.moves = []  # From one home to another
+        self.lay_offs = []  # Being laid off by a company that goes out of business
+        self.name_changes = []
+        self.building_commissions = set()  # Constructions of houses or buildings that they commissioned
+        self.home_purchases = []
+        self.retirement = None
+        self.departure = None  # Leaving the city, i.e., leaving the simulation
+        self.death = None
+        # Maps potentially every other person to their salience to this person; this is a view of this
+        # person's row in the game's salience matrix, if there is one, else a dictionary
+        self.salience_of_other_people = (
+            self.game.salience_matrix.register(person=self) if self.game.salience_matrix else {}
+        )
+        # Record this person in the game's genealogy, from which all of their familial attributes
+        # (e.g., self.siblings) are derived; update the salience of family members
         self._init_familial_attributes()
         self._init_update_familial_attributes_of_family_members()
         # Prepare attributes representing this person's romantic relationships
@@ -161,34 +132,24 @@ class Person(object):
         self.charge_of_worst_enemy = 0.0
         self.spark_of_love_interest = 0.0
         self.talked_to_this_year = set()
+        # Incremented whenever this person's family or social-relationship sets change, so that
+        # cached judgments that depend on those sets (e.g., contractor scores) can detect staleness
+        self.social_ties_version = 0
         self.befriended_this_year = set()
-        self.salience_of_other_people = {}  # Maps potentially every other person to their salience to this person
         self._init_salience_values()
         # Prepare attributes pertaining to pregnancy
         self.pregnant = False
         self.impregnated_by = None
         self.conception_year = None  # Year of conception
         self.due_date = None  # Actual ordinal date 270 days from conception (currently)
-        # Prepare attributes representing events in this person's life
-        self.birth = birth
-        self.adoption = None
-        self.marriage = None
-        self.marriages = []
-        self.divorces = []
-        self.adoptions = []
-        self.moves = []  # From one home to another
-        self.lay_offs = []  # Being laid off by a company that goes out of business
-        self.name_changes = []
-        self.building_commissions = set()  # Constructions of houses or buildings that they commissioned
-        self.home_purchases = []
-        self.retirement = None
-        self.departure = None  # Leaving the city, i.e., leaving the simulation
-        self.death = None
         # Set and prepare attributes pertaining to business affairs
         self.money = self._init_money()
         self.occupation = None
         self.occupations = []
         self.former_contractors = set()
+        # Maps occupation classes to (stamp, scores) pairs holding this household's most recent
+        # scoring of potential contractors; see _rate_all_potential_contractors_of_certain_occupation()
+        self.contractor_scores = {}
         self.retired = False
         # Prepare attributes pertaining to education
         self.college_graduate = False
@@ -257,162 +218,34 @@ class Person(object):
         return attracted_to_men, attracted_to_women
 
     def _init_familial_attributes(self):
-        """Populate lists representing this person's family members."""
-        self._init_immediate_family()
-        self._init_biological_immediate_family()
-        self._init_extended_family()
-        self._init_biological_extended_family()
-
-    def _init_immediate_family(self):
-        """Populate lists representing this person's (legal) immediate family."""
-        self.grandparents = self.father.parents | self.mother.parents
-        self.siblings = self.father.kids | self.mother.kids
-        self.full_siblings = self.father.kids & self.mother.kids
-        self.half_siblings = self.father.kids ^ self.mother.kids
-        self.brothers = self.father.sons | self.mother.sons
-        self.full_brothers = self.father.sons & self.mother.sons
-        self.half_brothers = self.father.sons ^ self.mother.sons
-        self.sisters = self.father.daughters | self.mother.daughters
-        self.full_sisters = self.father.daughters & self.mother.daughters
-        self.half_sisters = self.father.daughters ^ self.mother.daughters
-        self.immediate_family = self.grandparents | self.parents | self.siblings
-
-    def _init_biological_immediate_family(self):
-        """Populate lists representing this person's immediate."""
-        self.bio_parents = {self.biological_mother, self.biological_father}
-        self.bio_grandparents = self.biological_father.parents | self.biological_mother.parents
-        self.bio_siblings = self.biological_father.kids | self.biological_mother.kids
-        self.bio_full_siblings = self.biological_father.kids & self.biological_mother.kids
-        self.bio_half_siblings = self.biological_father.kids ^ self.biological_mother.kids
-        self.bio_brothers = self.biological_father.sons | self.biological_mother.sons
-        self.bio_full_brothers = self.biological_father.sons & self.biological_mother.sons
-        self.bio_half_brothers = self.biological_father.sons ^ self.biological_mother.sons
-        self.bio_sisters = self.biological_father.daughters | self.biological_mother.daughters
-        self.bio_full_sisters = self.biological_father.daughters & self.biological_mother.daughters
-        self.bio_half_sisters = self.biological_father.daughters ^ self.biological_mother.daughters
-        self.bio_immediate_family = self.bio_grandparents | self.bio_parents | self.bio_siblings
-
-    def _init_extended_family(self):
-        """Populate lists representing this person's (legal) extended family."""
-        self.greatgrandparents = self.father.grandparents | self.mother.grandparents
-        self.uncles = self.father.brothers | self.mother.brothers
-        self.aunts = self.father.sisters | self.mother.sisters
-        self.cousins = self.father.nieces | self.father.nephews | self.mother.nieces | self.mother.nephews
-        self.nephews = self.father.grandsons | self.mother.grandsons
-        self.nieces = self.father.granddaughters | self.mother.granddaughters
-        self.ancestors = self.father.ancestors | self.mother.ancestors | self.parents
-        self.extended_family = (
-            self.greatgrandparents | self.immediate_family | self.uncles | self.aunts |
-            self.cousins | self.nieces | self.nephews
-        )
-
-    def _init_biological_extended_family(self):
-        """Populate lists representing this person's (legal) extended family."""
-        self.bio_greatgrandparents = self.father.grandparents | self.mother.grandparents
-        self.bio_uncles = self.father.brothers | self.mother.brothers
-        self.bio_aunts = self.father.sisters | self.mother.sisters
-        self.bio_cousins = self.father.nieces | self.father.nephews | self.mother.nieces | self.mother.nephews
-        self.bio_nephews = self.father.grandsons | self.mother.grandsons
-        self.bio_nieces = self.father.granddaughters | self.mother.granddaughters
-        self.bio_ancestors = self.father.ancestors | self.mother.ancestors | self.parents
-        self.bio_extended_family = (
-            self.bio_greatgrandparents | self.bio_immediate_family | self.bio_uncles | self.bio_aunts |
-            self.bio_cousins | self.bio_nieces | self.bio_nephews
-        )
+        """Record this person's birth to their parents in the game's genealogy."""
+        self.game.genealogy.record_birth(person=self)
 
     def _init_update_familial_attributes_of_family_members(self):
-        """Update familial attributes of myself and family members."""
+        """Update the salience of this newborn to their family members, whose families now include them."""
         config = self.game.config
-        for member in self.immediate_family:
-            member.immediate_family.add(self)
-            member.update_salience_of(
-                entity=self, change=config.salience_increment_from_relationship_change["immediate family"]
-            )
-        for member in self.extended_family:
-            member.extended_family.add(self)
-            member.update_salience_of(
-                entity=self, change=config.salience_increment_from_relationship_change["extended family"]
-            )
-        # Update for gender-specific familial attributes
-        if self.male:
-            for g in self.greatgrandparents:
-                g.greatgrandsons.add(self)
-            for g in self.grandparents:
-                g.grandsons.add(self)
-            for p in self.parents:
-                p.sons.add(self)
-            for u in self.uncles:
-                u.nephews.add(self)
-            for a in self.aunts:
-                a.nephews.add(self)
-            for b in self.full_brothers:
-                b.full_brothers.add(self)
-                b.brothers.add(self)
-            for s in self.full_sisters:
-                s.full_brothers.add(self)
-                s.brothers.add(self)
-            for b in self.half_brothers:
-                b.half_brothers.add(self)
-                b.brothers.add(self)
-            for s in self.half_sisters:
-                s.half_brothers.add(self)
-                s.brothers.add(self)
-        elif self.female:
-            for g in self.greatgrandparents:
-                g.greatgranddaughters.add(self)
-            for g in self.grandparents:
-                g.granddaughters.add(self)
-            for p in self.parents:
-                p.daughters.add(self)
-            for u in self.uncles:
-                u.nieces.add(self)
-            for a in self.aunts:
-                a.nieces.add(self)
-            for b in self.full_brothers:
-                b.full_sisters.add(self)
-                b.sisters.add(self)
-            for s in self.full_sisters:
-                s.full_sisters.add(self)
-                s.sisters.add(self)
-            for b in self.half_brothers:
-                b.half_sisters.add(self)
-                b.sisters.add(self)
-            for s in self.half_sisters:
-                s.half_sisters.add(self)
-                s.sisters.add(self)
-        # Update for non-gender-specific familial attributes
-        for a in self.ancestors:
-            a.descendants.add(self)
-        for g in self.greatgrandparents:
-            g.greatgrandchildren.add(self)
-        for g in self.grandparents:
-            g.grandchildren.add(self)
-        for p in self.parents:
-            p.kids.add(self)
-        for fs in self.full_siblings:
-            fs.siblings.add(self)
-            fs.full_siblings.add(self)
-        for hs in self.half_siblings:
-            hs.siblings.add(self)
-            hs.half_siblings.add(self)
-        for c in self.cousins:
-            c.cousins.add(self)
+        for member in self.immediate_family | self.extended_family:
+            member.social_ties_version += 1
+        self.update_salience_of_me(
+            people=self.immediate_family, change=config.salience_increment_from_relationship_change["immediate family"]
+        )
+        self.update_salience_of_me(
+            people=self.extended_family, change=config.salience_increment_from_relationship_change["extended family"]
+        )
 
     def _init_salience_values(self):
         """Determine an initial salience value for every other person associated with this newborn."""
         config = self.game.config
-        for person in self.ancestors:
-            self.update_salience_of(
-                entity=person, change=config.salience_increment_from_relationship_change["ancestor"]
-            )
-        for person in self.extended_family:
-            self.update_salience_of(
-                entity=person, change=config.salience_increment_from_relationship_change["extended family"]
-            )
-        for person in self.immediate_family:
-            self.update_salience_of(
-                entity=person, change=config.salience_increment_from_relationship_change["immediate family"]
-            )
+        self.update_salience_of_many(
+            entities=self.ancestors, change=config.salience_increment_from_relationship_change["ancestor"]
+        )
+        self.update_salience_of_many(
+            entities=self.extended_family, change=config.salience_increment_from_relationship_change["extended family"]
+        )
+        self.update_salience_of_many(
+            entities=self.immediate_family,
+            change=config.salience_increment_from_relationship_change["immediate family"]
+        )
         self.update_salience_of(
             entity=self, change=config.salience_increment_from_relationship_change["self"]
         )
@@ -551,6 +384,251 @@ class Person(object):
             )
         return next_of_kin
 
+    @property
+    def kids(self):
+        """Return this person's (legal) kids."""
+        return self.game.genealogy.relatives(person=self, relation='kids')
+
+    @property
+    def sons(self):
+        """Return this person's (legal) sons."""
+        return self.game.genealogy.relatives(person=self, relation='sons')
+
+    @property
+    def daughters(self):
+        """Return this person's (legal) daughters."""
+        return self.game.genealogy.relatives(person=self, relation='daughters')
+
+    @property
+    def grandparents(self):
+        """Return this person's (legal) grandparents."""
+        return self.game.genealogy.relatives(person=self, relation='grandparents')
+
+    @property
+    def greatgrandparents(self):
+        """Return this person's (legal) great-grandparents."""
+        return self.game.genealogy.relatives(person=self, relation='greatgrandparents')
+
+    @property
+    def ancestors(self):
+        """Return this person's (legal) ancestors."""
+        return self.game.genealogy.relatives(person=self, relation='ancestors')
+
+    @property
+    def descendants(self):
+        """Return this person's (legal) descendants."""
+        return self.game.genealogy.relatives(person=self, relation='descendants')
+
+    @property
+    def siblings(self):
+        """Return this person's (legal) siblings, full and half."""
+        return self.game.genealogy.relatives(person=self, relation='siblings')
+
+    @property
+    def full_siblings(self):
+        """Return this person's (legal) full siblings."""
+        return self.game.genealogy.relatives(person=self, relation='full_siblings')
+
+    @property
+    def half_siblings(self):
+        """Return this person's (legal) half siblings."""
+        return self.game.genealogy.relatives(person=self, relation='half_siblings')
+
+    @property
+    def brothers(self):
+        """Return this person's (legal) brothers, full and half."""
+        return self.game.genealogy.relatives(person=self, relation='brothers')
+
+    @property
+    def full_brothers(self):
+        """Return this person's (legal) full brothers."""
+        return self.game.genealogy.relatives(person=self, relation='full_brothers')
+
+    @property
+    def half_brothers(self):
+        """Return this person's (legal) half brothers."""
+        return self.game.genealogy.relatives(person=self, relation='half_brothers')
+
+    @property
+    def sisters(self):
+        """Return this person's (legal) sisters, full and half."""
+        return self.game.genealogy.relatives(person=self, relation='sisters')
+
+    @property
+    def full_sisters(self):
+        """Return this person's (legal) full sisters."""
+        return self.game.genealogy.relatives(person=self, relation='full_sisters')
+
+    @property
+    def half_sisters(self):
+        """Return this person's (legal) half sisters."""
+        return self.game.genealogy.relatives(person=self, relation='half_sisters')
+
+    @property
+    def uncles(self):
+        """Return this person's (legal) uncles."""
+        return self.game.genealogy.relatives(person=self, relation='uncles')
+
+    @property
+    def aunts(self):
+        """Return this person's (legal) aunts."""
+        return self.game.genealogy.relatives(person=self, relation='aunts')
+
+    @property
+    def cousins(self):
+        """Return this person's (legal) first cousins."""
+        return self.game.genealogy.relatives(person=self, relation='cousins')
+
+    @property
+    def nephews(self):
+        """Return this person's (legal) nephews."""
+        return self.game.genealogy.relatives(person=self, relation='nephews')
+
+    @property
+    def nieces(self):
+        """Return this person's (legal) nieces."""
+        return self.game.genealogy.relatives(person=self, relation='nieces')
+
+    @property
+    def grandchildren(self):
+        """Return this person's (legal) grandchildren."""
+        return self.game.genealogy.relatives(person=self, relation='grandchildren')
+
+    @property
+    def grandsons(self):
+        """Return this person's (legal) grandsons."""
+        return self.game.genealogy.relatives(person=self, relation='grandsons')
+
+    @property
+    def granddaughters(self):
+        """Return this person's (legal) granddaughters."""
+        return self.game.genealogy.relatives(person=self, relation='granddaughters')
+
+    @property
+    def greatgrandchildren(self):
+        """Return this person's (legal) great-grandchildren."""
+        return self.game.genealogy.relatives(person=self, relation='greatgrandchildren')
+
+    @property
+    def greatgrandsons(self):
+        """Return this person's (legal) great-grandsons."""
+        return self.game.genealogy.relatives(person=self, relation='greatgrandsons')
+
+    @property
+    def greatgranddaughters(self):
+        """Return this person's (legal) great-granddaughters."""
+        return self.game.genealogy.relatives(person=self, relation='greatgranddaughters')
+
+    @property
+    def immediate_family(self):
+        """Return this person's immediate family, including their spouse."""
+        return self.game.genealogy.relatives(person=self, relation='immediate_family')
+
+    @property
+    def extended_family(self):
+        """Return this person's extended family, including their immediate family and their spouse's extended family."""
+        return self.game.genealogy.relatives(person=self, relation='extended_family')
+
+    @property
+    def bio_parents(self):
+        """Return this person's biological parents."""
+        return self.game.genealogy.relatives(person=self, relation='bio_parents')
+
+    @property
+    def bio_grandparents(self):
+        """Return this person's biological grandparents."""
+        return self.game.genealogy.relatives(person=self, relation='bio_grandparents')
+
+    @property
+    def bio_greatgrandparents(self):
+        """Return this person's biological great-grandparents."""
+        return self.game.genealogy.relatives(person=self, relation='bio_greatgrandparents')
+
+    @property
+    def bio_ancestors(self):
+        """Return this person's biological ancestors."""
+        return self.game.genealogy.relatives(person=self, relation='bio_ancestors')
+
+    @property
+    def bio_siblings(self):
+        """Return this person's biological siblings, full and half."""
+        return self.game.genealogy.relatives(person=self, relation='bio_siblings')
+
+    @property
+    def bio_full_siblings(self):
+        """Return this person's biological full siblings."""
+        return self.game.genealogy.relatives(person=self, relation='bio_full_siblings')
+
+    @property
+    def bio_half_siblings(self):
+        """Return this person's biological half siblings."""
+        return self.game.genealogy.relatives(person=self, relation='bio_half_siblings')
+
+    @property
+    def bio_brothers(self):
+        """Return this person's biological brothers, full and half."""
+        return self.game.genealogy.relatives(person=self, relation='bio_brothers')
+
+    @property
+    def bio_full_brothers(self):
+        """Return this person's biological full brothers."""
+        return self.game.genealogy.relatives(person=self, relation='bio_full_brothers')
+
+    @property
+    def bio_half_brothers(self):
+        """Return this person's biological half brothers."""
+        return self.game.genealogy.relatives(person=self, relation='bio_half_brothers')
+
+    @property
+    def bio_sisters(self):
+        """Return this person's biological sisters, full and half."""
+        return self.game.genealogy.relatives(person=self, relation='bio_sisters')
+
+    @property
+    def bio_full_sisters(self):
+        """Return this person's biological full sisters."""
+        return self.game.genealogy.relatives(person=self, relation='bio_full_sisters')
+
+    @property
+    def bio_half_sisters(self):
+        """Return this person's biological half sisters."""
+        return self.game.genealogy.relatives(person=self, relation='bio_half_sisters')
+
+    @property
+    def bio_uncles(self):
+        """Return this person's biological uncles."""
+        return self.game.genealogy.relatives(person=self, relation='bio_uncles')
+
+    @property
+    def bio_aunts(self):
+        """Return this person's biological aunts."""
+        return self.game.genealogy.relatives(person=self, relation='bio_aunts')
+
+    @property
+    def bio_cousins(self):
+        """Return this person's biological first cousins."""
+        return self.game.genealogy.relatives(person=self, relation='bio_cousins')
+
+    @property
+    def bio_nephews(self):
+        """Return this person's biological nephews."""
+        return self.game.genealogy.relatives(person=self, relation='bio_nephews')
+
+    @property
+    def bio_nieces(self):
+        """Return this person's biological nieces."""
+        return self.game.genealogy.relatives(person=self, relation='bio_nieces')
+
+    @property
+    def bio_immediate_family(self):
+        """Return this person's biological immediate family."""
+        return self.game.genealogy.relatives(person=self, relation='bio_immediate_family')
+
+    @property
+    def bio_extended_family(self):
+        """Return this person's biological extended family."""
+        return self.game.genealogy.relatives(person=self, relation='bio_extended_family')
+
     @property
     def nuclear_family(self):
         """Return this person's nuclear family."""
@@ -1051,80 +1129,32 @@ class Person(object):
         richness and expressivity. Because this method is meant to be used to generate
         dialogue, it won't return specific relationships like 'first cousin, once removed',
         because everyday people don't know or reference these relationships.
+
+        Familial relations, which take precedence, are classified (and cached) by the game's
+        kinship engine.
         """
-        if person is self:
-            return 'self'
-        elif person in self.greatgrandparents:
-            return 'greatgrandfather' if person.male else 'greatgrandmother'
-        elif person in self.grandparents:
-            return 'grandfather' if person.male else 'grandmother'
-        elif person is self.father:
-            return 'father'
-        elif person is self.mother:
-            return 'mother'
-        elif person in self.aunts:
-            return 'aunt'
-        elif person in self.uncles:
-            return 'uncle'
-        elif person in self.brothers:
-            return 'brother'
-        elif person in self.sisters:
-            return 'sister'
-        elif person in self.cousins:
-            return 'cousin'
-        elif person in self.sons:
-            return 'son'
-        elif person in self.daughters:
-            return 'daughter'
-        elif person in self.nephews:
-            return 'nephew'
-        elif person in self.nieces:
-            return 'niece'
-        elif person is self.spouse:
-            return 'husband' if person.male else 'wife'
-        elif self.divorces and any(d for d in self.divorces if person in d.subjects):
-            return 'ex-husband' if person.male else 'ex-wife'
-        elif self.widowed and any(m for m in self.marriages if person in m.subjects and m.terminus is person.death):
-            return 'deceased husband' if person.male else 'deceased wife'
-        elif person.spouse in self.siblings or self.spouse in person.siblings:
-            return 'brother in law' if person.male else 'sister in law'
-        elif self.father and any(d for d in self.father.divorces if person in d.subjects):
-            return "father's ex-{}".format('husband' if person.male else 'wife')
-        elif self.mother and any(d for d in self.mother.divorces if person in d.subjects):
-            return "mother's ex-{}".format('husband' if person.male else 'wife')
-        elif any(s for s in self.brothers if any(d for d in s.divorces if person in d.subjects)):
-            return "brother's ex-{}".format('husband' if person.male else 'wife')
-        elif any(s for s in self.sisters if any(d for d in s.divorces if person in d.subjects)):
-            return "sister's ex-{}".format('husband' if person.male else 'wife')
-        elif any(s for s in self.brothers if any(
-                m for m in s.marriages if person in m.subjects and m.terminus is person.death)):
-            return "brother's deceased {}".format('husband' if person.male else 'wife')
-        elif any(s for s in self.sisters if any(
-                m for m in s.marriages if person in m.subjects and m.terminus is person.death)):
-            return "sister's deceased {}".format('husband' if person.male else 'wife')
-        elif any(s for s in self.brothers if any(
-                m for m in s.marriages if person in m.subjects and m.terminus is s.death)):
-            return "deceased brother's former {}".format('husband' if person.male else 'wife')
-        elif any(s for s in self.sisters if any(
-                m for m in s.marriages if person in m.subjects and m.terminus is s.death)):
-            return "deceased sister's former {}".format('husband' if person.male else 'wife')
-        elif person.spouse in self.kids:
-            return 'son in law' if person.male else 'daughter in law'
-        elif self.spouse and person in self.spouse.parents:
-            return 'father in law' if person.male else 'mother in law'
-        elif self.spouse and person in self.spouse.sons:
-            return 'stepson'
-        elif self.spouse and person in self.spouse.daughters:
-            return 'stepdaughter'
-        elif self.mother and person is self.mother.spouse:
-            return 'stepfather' if person.male else 'stepmother'
-        elif self.father and person is self.father.spouse:
-            return 'stepfather' if person.male else 'stepmother'
-        elif self.greatgrandparents & person.greatgrandparents:
-            return 'second cousin'
-        elif self.greatgrandparents & person.siblings:
-            return 'great uncle' if person.male else 'great aunt'
-        elif person is self.best_friend:
+        return (
+            self.game.kinship.relation(person=self, other_person=person) or
+            self._nonfamilial_relation_to_me(person=person)
+        )
+
+    def relation_to_me_of_everyone(self, people=None):
+        """Return a dictionary mapping each of the given people (by default, everyone living in
+        the city) to their primary relation to me, if any.
+
+        @param people: An iterable of people, whose relations are determined in bulk.
+        """
+        if people is None:
+            people = self.game.city.residents
+        familial_relations = self.game.kinship.relations(person=self, people=people)
+        return {
+            person: familial_relations[person] or self._nonfamilial_relation_to_me(person=person)
+            for person in people
+        }
+
+    def _nonfamilial_relation_to_me(self, person):
+        """Return the primary nonfamilial relation of another person to me, if any (see relation_to_me())."""
+        if person is self.best_friend:
             return 'best friend'
         elif person is self.worst_enemy:
             return 'worst enemy'
@@ -1197,179 +1227,8 @@ class Person(object):
         An example of a hinge: if someone is my wife's friend, then my wife is the hinge.
         """
         # TODO ADD FURTHER PRECONDITIONS ON SOME, E.G., YOU MUST KNOW WHERE YOUR MOM WORKS
-        relations = []
-        if person is self:
-            relation = 'self'
-            hinge = None
-            relations.append((relation, hinge))
-        if person in self.greatgrandparents:
-            relation = 'greatgrandfather' if person.male else 'greatgrandmother'
-            hinge = None
-            relations.append((relation, hinge))
-        if person in self.grandparents:
-            relation = 'grandfather' if person.male else 'grandmother'
-            hinge = None
-            relations.append((relation, hinge))
-        if person is self.father:
-            relation = 'father'
-            hinge = None
-            relations.append((relation, hinge))
-        if person is self.mother:
-            relation = 'mother'
-            hinge = None
-            relations.append((relation, hinge))
-        if person in self.aunts:
-            relation = 'aunt'
-            hinge = None
-            relations.append((relation, hinge))
-        if person in self.uncles:
-            relation = 'uncle'
-            hinge = None
-            relations.append((relation, hinge))
-        if person in self.brothers:
-            relation = 'brother'
-            hinge = None
-            relations.append((relation, hinge))
-        if person in self.sisters:
-            relation = 'sister'
-            hinge = None
-            relations.append((relation, hinge))
-        if person in self.cousins:
-            relation = 'cousin'
-            hinge = None
-            relations.append((relation, hinge))
-        if person in self.sons:
-            relation = 'son'
-            hinge = None
-            relations.append((relation, hinge))
-        if person in self.daughters:
-            relation = 'daughter'
-            hinge = None
-            relations.append((relation, hinge))
-        if person in self.nephews:
-            relation = 'nephew'
-            hinge = None
-            relations.append((relation, hinge))
-        if person in self.nieces:
-            relation = 'niece'
-            hinge = None
-            relations.append((relation, hinge))
-        if person is self.spouse:
-            relation = 'husband' if person.male else 'wife'
-            hinge = None
-            relations.append((relation, hinge))
-        if self.divorces and any(d for d in self.divorces if person in d.subjects):
-            relation = 'ex-husband' if person.male else 'ex-wife'
-            hinge = None
-            relations.append((relation, hinge))
-        if self.widowed and any(m for m in self.marriages if person in m.subjects and m.terminus is person.death):
-            relation = 'deceased husband' if person.male else 'deceased wife'
-            hinge = None
-            relations.append((relation, hinge))
-        if person.spouse in self.siblings:
-            relation = "{}'s {}".format(
-                'sister' if person.spouse.female else 'brother', 'husband' if person.male else 'wife'
-            )
-            hinge = person.spouse
-            relations.append((relation, hinge))
-        if self.spouse in person.siblings:
-            relation = "{}'s {}".format(
-                'husband' if self.spouse.male else 'wife', 'brother' if person.male else 'sister'
-            )
-            hinge = self.spouse
-            relations.append((relation, hinge))
-        if self.father and any(d for d in self.father.divorces if person in d.subjects):
-            relation = "father's ex-{}".format('husband' if person.male else 'wife')
-            hinge = self.father
-            relations.append((relation, hinge))
-        if self.mother and any(d for d in self.mother.divorces if person in d.subjects):
-            relation = "mother's ex-{}".format('husband' if person.male else 'wife')
-            hinge = self.mother
-            relations.append((relation, hinge))
-        if any(s for s in self.brothers if any(d for d in s.divorces if person in d.subjects)):
-            relation = "brother's ex-{}".format('husband' if person.male else 'wife')
-            hinge = next(
-                s for s in self.brothers if any(d for d in s.divorces if person in d.subjects)
-            )
-            relations.append((relation, hinge))
-        if any(s for s in self.sisters if any(d for d in s.divorces if person in d.subjects)):
-            relation = "sister's ex-{}".format('husband' if person.male else 'wife')
-            hinge = next(
-                s for s in self.sisters if any(d for d in s.divorces if person in d.subjects)
-            )
-            relations.append((relation, hinge))
-        if any(s for s in self.brothers if any(
-                m for m in s.marriages if person in m.subjects and m.terminus is person.death and
-                person is not s)):
-            relation = "brother's deceased {}".format('husband' if person.male else 'wife')
-            hinge = next(
-                s for s in self.brothers if any(
-                    m for m in s.marriages if person in m.subjects and m.terminus is person.death)
-            )
-            relations.append((relation, hinge))
-        if any(s for s in self.sisters if any(
-                m for m in s.marriages if person in m.subjects and m.terminus is person.death and
-                person is not s)):
-            relation = "sister's deceased {}".format('husband' if person.male else 'wife')
-            hinge = next(
-                s for s in self.sisters if any(
-                    m for m in s.marriages if person in m.subjects and m.terminus is person.death)
-            )
-            relations.append((relation, hinge))
-        if any(s for s in self.brothers if any(
-                m for m in s.marriages if person in m.subjects and m.terminus is s.death and
-                person is not s)):
-            relation = "deceased brother's former {}".format('husband' if person.male else 'wife')
-            hinge = next(
-                s for s in self.brothers if any(
-                    m for m in s.marriages if person in m.subjects and m.terminus is s.death)
-            )
-            relations.append((relation, hinge))
-        if any(s for s in self.sisters if any(
-                m for m in s.marriages if person in m.subjects and m.terminus is s.death and
-                person is not s)):
-            relation = "deceased sister's former {}".format('husband' if person.male else 'wife')
-            hinge = next(
-                s for s in self.sisters if any(
-                    m for m in s.marriages if person in m.subjects and m.terminus is s.death)
-            )
-            relations.append((relation, hinge))
-        if person.spouse in self.kids:
-            relation = "{}'s {}".format(
-                "son" if person.spouse.male else "daughter", "husband" if person.male else "wife"
-            )
-            hinge = person.spouse
-            relations.append((relation, hinge))
-        if self.spouse and person in self.spouse.parents:
-            relation = "{}'s {}".format(
-                "husband" if self.spouse.male else "wife", "father" if person.male else "mother"
-            )
-            hinge = self.spouse
-            relations.append((relation, hinge))
-        if self.spouse and person in self.spouse.sons and person not in self.sons:
-            relation = 'stepson'
-            hinge = None
-            relations.append((relation, hinge))
-        if self.spouse and person in self.spouse.daughters and person not in self.daughters:
-            relation = 'stepdaughter'
-            hinge = None
-            relations.append((relation, hinge))
-        if self.mother and person is self.mother.spouse and person is not self.father:
-            relation = 'stepfather' if person.male else 'stepmother'
-            hinge = None
-            relations.append((relation, hinge))
-        if self.father and person is self.father.spouse and person is not self.mother:
-            relation = 'stepfather' if person.male else 'stepmother'
-            hinge = None
-            relations.append((relation, hinge))
-        if self.greatgrandparents & person.greatgrandparents and person not in self.siblings | self.cousins | {self}:
-            relation = 'second cousin'
-            hinge = None
-            relations.append((relation, hinge))
-        if self.greatgrandparents & person.siblings:
-            relation = 'great uncle' if person.male else 'great aunt'
-            hinge = None
-            relations.append((relation, hinge))
+        # Familial relations are classified (and cached) by the game's kinship engine
+        relations = list(self.game.kinship.known_relations(person=self, other_person=person))
         if person is self.best_friend:
             relation = 'best friend'
             hinge = None
@@ -1742,7 +1601,7 @@ class Person(object):
         using the scores to derive likelihoods of selecting each.
         """
         if self.city:
-            pool = list(self.city.workers_of_trade(occupation_in_question))
+            pool = self.city.workers_of_trade(occupation_in_question)
         else:  # PersonExNihilo who backstory is currently being retconned
             pool = []
         if pool:
@@ -1753,7 +1612,9 @@ class Person(object):
                 choice = self.spouse
             # Otherwise, pick from the various people in town who do practice this occupation
             else:
-                potential_hire_scores = self._rate_all_potential_contractors_of_certain_occupation(pool=pool)
+                potential_hire_scores = self._rate_all_potential_contractors_of_certain_occupation(
+                    pool=pool, occupation_in_question=occupation_in_question
+                )
                 if len(potential_hire_scores) >= 3:
                     # Pick from top three
                     top_three_choices = heapq.nlargest(3, potential_hire_scores, key=potential_hire_scores.get)
@@ -1771,11 +1632,31 @@ class Person(object):
             choice = None
         return choice
 
-    def _rate_all_potential_contractors_of_certain_occupation(self, pool):
-        """Score all potential hires of a certain occupation."""
+    def _rate_all_potential_contractors_of_certain_occupation(self, pool, occupation_in_question):
+        """Score all potential hires of a certain occupation.
+
+        Scores are cached per household (this person and their spouse, if any) and occupation;
+        the cached scores are reused so long as the year (which determines years of experience),
+        the practitioners in town (as tracked by City.practitioners_version, along with the size
+        of the pool, which also changes as practitioners move into town), and the social ties of
+        everyone making the decision are all unchanged.
+        """
+        stamp = (
+            self.game.year,
+            self.city.practitioners_version,
+            len(pool),
+            self.social_ties_version,
+            self.spouse,
+            None if not self.spouse else self.spouse.social_ties_version
+        )
+        if occupation_in_question in self.contractor_scores:
+            cached_stamp, cached_scores = self.contractor_scores[occupation_in_question]
+            if cached_stamp == stamp:
+                return cached_scores
         scores = {}
         for person in pool:
             scores[person] = self._rate_potential_contractor_of_certain_occupation(person=person)
+        self.contractor_scores[occupation_in_question] = (stamp, scores)
         return scores
 
     def _rate_potential_contractor_of_certain_occupation(self, person):
@@ -2071,13 +1952,13 @@ class Person(object):
         # Figure out the N most salient people, where N = how_many_people_we_talk_about (or
         # the how many total people these guys know about, if that's less)
         all_the_people_we_know_about = set(self.mind.mental_models) | set(interlocutor.mind.mental_models)
-        my_salience_of_other_people = self.salience_of_other_people  # Attribute accessing is slow -- make local vars
-        interlocutor_salience_of_other_people = interlocutor.salience_of_other_people
+        all_the_people_we_know_about = [entity for entity in all_the_people_we_know_about if entity.type == "person"]
+        # A salience value of 0.0 is used for cases where a person has no salience value for someone
         salience_scores = {
-            # Using .get(entity, 0.0) means 0.0 will be returned if entity is not in that dictionary -- i.e.,
-            # it creates a default salience value of 0.0 for cases where a person has no salience value for someone
-            entity: my_salience_of_other_people.get(entity, 0.0)+interlocutor_salience_of_other_people.get(entity, 0.0)
-            for entity in all_the_people_we_know_about if entity.type == "person"
+            entity: my_salience+interlocutor_salience for entity, my_salience, interlocutor_salience in zip(
+                all_the_people_we_know_about, self.saliences_of(entities=all_the_people_we_know_about),
+                interlocutor.saliences_of(entities=all_the_people_we_know_about)
+            )
         }
         people_we_will_talk_about = (
             heapq.nlargest(how_many_people_we_talk_about, salience_scores, key=salience_scores.get)
@@ -2251,6 +2132,29 @@ class Person(object):
             max(0.0, self.salience_of_other_people.get(entity, 0.0) + change)
         )
 
+    def update_salience_of_many(self, entities, change):
+        """Increment your salience value for each of the given people by change."""
+        if self.game.salience_matrix:
+            self.game.salience_matrix.update_row(person=self, entities=entities, change=change)
+        else:
+            for entity in entities:
+                self.update_salience_of(entity=entity, change=change)
+
+    def update_salience_of_me(self, people, change):
+        """Increment the salience value that each of the given people has for you by change."""
+        if self.game.salience_matrix:
+            self.game.salience_matrix.update_column(people=people, entity=self, change=change)
+        else:
+            for person in people:
+                person.update_salience_of(entity=self, change=change)
+
+    def saliences_of(self, entities):
+        """Return a list of your salience values for each of the given entities (0.0 for any you have none for)."""
+        if self.game.salience_matrix:
+            return self.game.salience_matrix.values(person=self, entities=entities)
+        salience_of_other_people = self.salience_of_other_people
+        return [salience_of_other_people.get(entity, 0.0) for entity in entities]
+
     def people_i_believe_work_at(self, company):
         """Return a list of people, ordered by their salience, that this person believes works at the given company."""
         if company not in self.mind.mental_models:
@@ -2259,9 +2163,10 @@ class Person(object):
             people_i_believe_work_at_this_company = [
                 mental_model.subject for mental_model in self.mind.mental_models[company].employees
             ]
-            people_i_believe_work_at_this_company.sort(
-                key=lambda p: self.salience_of_other_people.get(p, 0.0), reverse=True
-            )
+            salience_of_those_people = dict(zip(
+                people_i_believe_work_at_this_company, self.saliences_of(entities=people_i_believe_work_at_this_company)
+            ))
+            people_i_believe_work_at_this_company.sort(key=salience_of_those_people.get, reverse=True)
             return people_i_believe_work_at_this_company
 
     def most_salient_person_i_believe_works_at(self, company):
@@ -1,52 +1,103 @@
+import os
 import json
 import random
+import marshal
+import hashlib
+import collections
 
 
-class Productionist(object):
-    """A production system for in-game natural language generation from an Expressionist grammar.
+# The variables that the lambda functions specifying symbol conditions may take as arguments,
+# in the order in which they appear in the state tuples built by Condition.build_state_tuple()
+STATE_VARIABLES = ('conversation', 'speaker', 'interlocutor', 'subject', 'thinker')
 
-    Objects of this class operate over a probabilistic context-free generative grammar exported by
-    Expressionist according to requests originating from a game system. As such, it can be thought of
-    as an interface between the game engine and an Expressionist grammar.
 
-    Subclasses inherit the base functionality of this class, but instantiate their own nuances
-    pertaining to the specific generation tasks that they carry out (e.g., dialogue generation
-    vs. thought generation). Most often, these concerns will bear out in the specific mark-up
-    including in the Expressionist grammars that they operate over.
+def load_json_grammar_specification(path_to_json_grammar_specification, use_cache=True):
+    """Return the dictionary specified by a JSON grammar specification exported by Expressionist.
+
+    If use_cache is True, the parsed specification is stored alongside the JSON file (with a '.cache'
+    suffix) in marshal format, together with a hash of the JSON file's contents; subsequent loads
+    will use the cached specification for as long as that hash still matches, rather than decoding
+    the JSON again. Failing to write the cache (e.g., due to file permissions) is not an error.
+    """
+    raw_json = open(path_to_json_grammar_specification, 'rb').read()
+    if not use_cache:
+        return json.loads(raw_json)
+    json_hash = hashlib.sha1(raw_json).hexdigest()
+    path_to_cache = path_to_json_grammar_specification + '.cache'
+    if os.path.exists(path_to_cache):
+        try:
+            cached_hash, grammar_dictionary = marshal.loads(open(path_to_cache, 'rb').read())
+            if cached_hash == json_hash:
+                return grammar_dictionary
+        except (EOFError, ValueError, TypeError):
+            pass  # The cache is corrupt or from another Python version, so just rebuild it
+    grammar_dictionary = json.loads(raw_json)
+    try:
+        with open(path_to_cache, 'wb') as cache_file:
+            cache_file.write(marshal.dumps((json_hash, grammar_dictionary)))
+    except IOError:
+        pass
+    return grammar_dictionary
+
+
+class Grammar(object):
+    """A grammar exported by Expressionist, comprising nonterminal symbols and their production rules.
+
+    Once it has been loaded, a grammar is never modified, which allows a single Grammar object to be
+    shared by every Productionist (across any number of Game instances or worker threads) that operates
+    over the same grammar specification; Grammar.load() ensures that each specification is only loaded
+    once per process. The state of an ongoing generation request is held by Productionist instead.
     """
 
-    def __init__(self, game, debug=False):
-        """Initialize a Productionist object."""
-        self.game = game
-        self.debug = debug
-        if self.__class__ is DialogueGenerator:
-            path_to_json_grammar_specification = game.config.path_to_dialogue_nlg_json_grammar_specification
-        else:
-            path_to_json_grammar_specification = game.config.path_to_thought_nlg_json_grammar_specification
+    # Maps (path to grammar specification, nonterminal symbol class) pairs to loaded grammars
+    loaded_grammars = {}
+
+    def __init__(self, path_to_json_grammar_specification, nonterminal_symbol_class, use_cache=True):
+        """Initialize a Grammar object."""
+        self.path_to_json_grammar_specification = path_to_json_grammar_specification
         self.nonterminal_symbols = self._init_parse_json_grammar_specification(
-            path_to_json_grammar_specification=path_to_json_grammar_specification
+            path_to_json_grammar_specification=path_to_json_grammar_specification,
+            nonterminal_symbol_class=nonterminal_symbol_class, use_cache=use_cache
         )
+        self.symbols_by_tag = {symbol.tag: symbol for symbol in self.nonterminal_symbols}
         self._init_resolve_symbol_references_in_all_production_rule_bodies()
         self._init_attribute_backward_chaining_and_forward_chaining_rules_to_symbols()
-        # This method is used to collect all the nonterminal symbols that were expanded
-        # in the production of a terminal derivation, which reified LineOfDialogue and
-        # Thought objects will need in order to inherit all the mark-up of these symbols
-        self.symbols_expanded_to_produce_the_terminal_derivation = set()
+        # Maps (tagset, tag) pairs to the symbols annotated with that markup, which lets generation
+        # requests that target specific markup skip scanning the entire grammar
+        self.symbols_by_markup = self._init_index_symbols_by_markup()
+        # Maps signals to lists of (symbol, weight) tuples for the symbols annotated with them, where
+        # the weight is the number of times the symbol is annotated with the signal; this is a sparse
+        # signal-by-symbol weight matrix, which lets a thinker's stimuli be scored against all the
+        # symbols in the grammar at once (see ThoughtGenerator.score_stimuli()); only symbols in
+        # thought grammars are annotated with signals, so this is empty for other grammars
+        self.symbol_weights_by_signal = self._init_build_signal_symbol_weight_matrix()
+
+    @classmethod
+    def load(cls, path_to_json_grammar_specification, nonterminal_symbol_class, use_cache=True):
+        """Return the grammar for this specification, loading it only if it hasn't been loaded already."""
+        key = (path_to_json_grammar_specification, nonterminal_symbol_class)
+        if key not in cls.loaded_grammars:
+            cls.loaded_grammars[key] = cls(
+                path_to_json_grammar_specification=path_to_json_grammar_specification,
+                nonterminal_symbol_class=nonterminal_symbol_class, use_cache=use_cache
+            )
+        return cls.loaded_grammars[key]
 
-    def _init_parse_json_grammar_specification(self, path_to_json_grammar_specification):
+    @staticmethod
+    def _init_parse_json_grammar_specification(path_to_json_grammar_specification, nonterminal_symbol_class,
+                                               use_cache):
         """Parse a JSON grammar specification exported by Expressionist to instantiate symbols and rules."""
         # Parse the JSON specification to build a dictionary data structure
         symbol_objects = []
-        grammar_dictionary = json.loads(open(path_to_json_grammar_specification).read())
+        grammar_dictionary = load_json_grammar_specification(
+            path_to_json_grammar_specification=path_to_json_grammar_specification, use_cache=use_cache
+        )
         nonterminal_symbol_specifications = grammar_dictionary['nonterminals']
         for tag, nonterminal_symbol_specification in nonterminal_symbol_specifications.iteritems():
             top_level = nonterminal_symbol_specification['deep']
             production_rules_specification = nonterminal_symbol_specification['rules']
             raw_markup = nonterminal_symbol_specification['markup']
-            nonterminal_symbol_class_to_use = (
-                DialogueNonterminalSymbol if self.__class__ is DialogueGenerator else ThoughtNonterminalSymbol
-            )
-            symbol_object = nonterminal_symbol_class_to_use(
+            symbol_object = nonterminal_symbol_class(
                 tag=tag, top_level=top_level, raw_markup=raw_markup,
                 production_rules_specification=production_rules_specification
             )
@@ -61,20 +112,18 @@ class Productionist(object):
 
     def _init_resolve_symbol_references_in_a_rule_body(self, production_rule):
         """Resolve all symbol references in the body of this rule to point to actual NonterminalSymbol objects."""
-        rule_body_specification = list(production_rule.body_specification)
         rule_body_with_resolved_symbol_references = []
-        for symbol_reference in rule_body_specification:
+        for symbol_reference in production_rule.body_specification:
             if symbol_reference[:2] == '[[' and symbol_reference[-2:] == ']]':
                 # We've encountered a reference to a nonterminal symbol, so we need to resolve this
                 # reference and append to the list that we're building the nonterminal symbol itself
                 symbol_tag = symbol_reference[2:-2]
-                symbol_object = next(symbol for symbol in self.nonterminal_symbols if symbol.tag == symbol_tag)
-                rule_body_with_resolved_symbol_references.append(symbol_object)
+                rule_body_with_resolved_symbol_references.append(self.symbols_by_tag[symbol_tag])
             else:
                 # We've encountered a terminal symbol, so we can just append this string itself
                 # to the list that we're building
                 rule_body_with_resolved_symbol_references.append(symbol_reference)
-            production_rule.body = rule_body_with_resolved_symbol_references
+        production_rule.body = rule_body_with_resolved_symbol_references
 
     def _init_attribute_backward_chaining_and_forward_chaining_rules_to_symbols(self):
         """Attribute to symbols their backward-chaining rules and forward-chaining rules.
@@ -95,7 +144,97 @@ class Productionist(object):
                 if isinstance(symbol, NonterminalSymbol):
                     symbol.backward_chaining_rules.append(rule)
 
-    def target_markup(self, markup_lambda_expression, symbol_sort_evaluation_function, state, rule_evaluation_metric):
+    def _init_index_symbols_by_markup(self):
+        """Build an inverted index mapping each (tagset, tag) pair to the symbols annotated with it."""
+        symbols_by_markup = {}
+        for symbol in self.nonterminal_symbols:
+            for tagset_and_tag in set(symbol.indexed_markup):
+                symbols_by_markup.setdefault(tagset_and_tag, []).append(symbol)
+        return symbols_by_markup
+
+    def _init_build_signal_symbol_weight_matrix(self):
+        """Build a sparse matrix mapping signals to the weights of their association with each symbol."""
+        symbol_weights_by_signal = {}
+        for symbol in self.nonterminal_symbols:
+            weights = {}
+            for signal, _ in getattr(symbol, 'signals', ()):  # _ stands for symbol_signal_weight (now ignored)
+                weights[signal] = weights.get(signal, 0) + 1
+            for signal, weight in weights.iteritems():
+                symbol_weights_by_signal.setdefault(signal, []).append((symbol, weight))
+        return symbol_weights_by_signal
+
+
+class Productionist(object):
+    """A production system for in-game natural language generation from an Expressionist grammar.
+
+    Objects of this class operate over a probabilistic context-free generative grammar exported by
+    Expressionist according to requests originating from a game system. As such, it can be thought of
+    as an interface between the game engine and an Expressionist grammar.
+
+    Subclasses inherit the base functionality of this class, but instantiate their own nuances
+    pertaining to the specific generation tasks that they carry out (e.g., dialogue generation
+    vs. thought generation). Most often, these concerns will bear out in the specific mark-up
+    including in the Expressionist grammars that they operate over.
+    """
+
+    def __init__(self, game, debug=False):
+        """Initialize a Productionist object."""
+        self.game = game
+        self.debug = debug
+        if self.__class__ is DialogueGenerator:
+            path_to_json_grammar_specification = game.config.path_to_dialogue_nlg_json_grammar_specification
+            nonterminal_symbol_class = DialogueNonterminalSymbol
+        else:
+            path_to_json_grammar_specification = game.config.path_to_thought_nlg_json_grammar_specification
+            nonterminal_symbol_class = ThoughtNonterminalSymbol
+        # The grammar itself is immutable and shared by every Productionist in this process that
+        # operates over the same grammar specification; all the state pertaining to a generation
+        # request is held by this object instead (see below)
+        self.grammar = Grammar.load(
+            path_to_json_grammar_specification=path_to_json_grammar_specification,
+            nonterminal_symbol_class=nonterminal_symbol_class,
+            use_cache=game.config.cache_parsed_grammar_specifications
+        )
+        self.nonterminal_symbols = self.grammar.nonterminal_symbols
+        self.symbols_by_tag = self.grammar.symbols_by_tag
+        self.symbols_by_markup = self.grammar.symbols_by_markup
+        # These attributes are used to perform live generation of a template from the grammar, which is
+        # done using backward-chaining and forward-chaining to check for precondition violations and other
+        # preclusions. The first maps symbols to the terminal expansions that we successfully produced for
+        # them during the current generation request, so as to not reduplicate expansion efforts, which
+        # could happen if two rules have the same symbol in their rule bodies; the second holds the
+        # production rules that successfully fired during the backward-chaining routine of the current
+        # request, which we need to remember in order to construct the final template
+        self.expansions = {}
+        self.viable_rules = set()
+        # This method is used to collect all the nonterminal symbols that were expanded
+        # in the production of a terminal derivation, which reified LineOfDialogue and
+        # Thought objects will need in order to inherit all the mark-up of these symbols
+        self.symbols_expanded_to_produce_the_terminal_derivation = set()
+        # This holds the state tuple that symbol conditions are evaluated against during
+        # a generation request; it gets set by target_markup()
+        self.state_tuple = None
+        # Memoizes the results of condition evaluations during a generation request, since the same
+        # conditions get evaluated again and again as chains are retried
+        self.condition_memo = ConditionMemo()
+
+    def symbols_with_markup(self, tagset, tags):
+        """Return all symbols annotated with any of the given tags from the given tagset, without duplicates.
+
+        Symbols are returned in the order of the given tags, and in the order they were indexed under
+        each tag, so that generation is deterministic for a given random seed.
+        """
+        symbols = []
+        seen = set()
+        for tag in tags:
+            for symbol in self.symbols_by_markup.get((tagset, tag), []):
+                if symbol not in seen:
+                    seen.add(symbol)
+                    symbols.append(symbol)
+        return symbols
+
+    def target_markup(self, markup_lambda_expression, symbol_sort_evaluation_function, state, rule_evaluation_metric,
+                      candidate_symbols=None):
         """Attempt to construct a line of dialogue that would perform the given dialogue move.
 
         This act of dialogue construction is rendered as a search task over the tree specified
@@ -120,10 +259,19 @@ class Productionist(object):
         @param rule_evaluation_metric: A lambda expression that determines the probability of application associated
                                         with each of a symbol's production rules; this allows us to probabilistically
                                         target production rules when we're doing forward- and backward-chaining
+        @param candidate_symbols: Optionally, the only symbols that could possibly satisfy the markup lambda
+                                  expression (typically retrieved by symbols_with_markup()); if this is not
+                                  given, every symbol in the grammar will be checked.
         """
+        # Bind the variables that symbol conditions refer to once for this entire request, rather
+        # than every time a condition is evaluated during forward and backward chaining
+        self.state_tuple = Condition.build_state_tuple(state=state)
+        self.condition_memo.advance_epoch()
         # Collect all satisficing symbols, i.e., ones have the desired markup and
         # thus satisfy the  given markup_lambda_expression
-        satisficing_symbols = [s for s in self.nonterminal_symbols if markup_lambda_expression(s)]
+        if candidate_symbols is None:
+            candidate_symbols = self.nonterminal_symbols
+        satisficing_symbols = [s for s in candidate_symbols if markup_lambda_expression(s)]
         # Randomly shuffle these symbols, which will mean that ties in the sort we are about
         # to do will be ordered differently across different generation instances
         random.shuffle(satisficing_symbols)
@@ -169,7 +317,7 @@ class Productionist(object):
             return None
         if self.debug:
             print "Successfully forward chained from targeted symbol {} all the way to terminal expansion '{}'".format(
-                symbol, symbol.expansion
+                symbol, self.expansions[symbol]
             )
         # Forward chaining was successful, so now attempt backward chaining, unless the
         # targeted symbol is a top-level symbol, in which case we can return the template
@@ -207,13 +355,13 @@ class Productionist(object):
         # First check for whether this symbol's preconditions are satisfied and whether
         # the use of its expansion in a line of dialogue would cause a conversational
         # violation to be incurred
-        if symbol.currently_violated(state=state):
+        if symbol.currently_violated(state=state, state_tuple=self.state_tuple, memo=self.condition_memo):
             return None
         candidate_production_rules = symbol.forward_chaining_rules
         # If one of these production rules is already known to be on a chain, we can just pick
         # that one mindlessly, since we already know that's the route to go
         try:
-            rule_on_our_chain = next(r for r in candidate_production_rules if r.viable)
+            rule_on_our_chain = next(r for r in candidate_production_rules if r in self.viable_rules)
             return self._target_production_rule(
                 rule=rule_on_our_chain, state=state, rule_evaluation_metric=rule_evaluation_metric,
                 n_tabs=n_tabs+1, retracing_chains=retracing_chains
@@ -234,7 +382,7 @@ class Productionist(object):
             if terminal_expansion_yielded_by_firing_that_production_rule:
                 # Save this successful terminal expansion of this symbol, in case we
                 # need it later (so that we don't reduplicate this completed effort)
-                symbol.expansion = terminal_expansion_yielded_by_firing_that_production_rule
+                self.expansions[symbol] = terminal_expansion_yielded_by_firing_that_production_rule
                 # If the symbol we're forward chaining from is a top-level symbol and is
                 # the symbol that we are ultimately targeting, then save the production rule
                 # that allowed us to terminally expand it, since we'll need this information
@@ -244,7 +392,7 @@ class Productionist(object):
                 if symbol.top_level and symbol_is_the_targeted_symbol:
                     if self.debug:
                         print "Added production rule {} to the chain".format(production_rule)
-                    production_rule.viable = True
+                    self.viable_rules.add(production_rule)
                 return terminal_expansion_yielded_by_firing_that_production_rule
         # If we tried every production rule and failed to return a terminal expansion,
         # then we must give up on this symbol by returning None
@@ -265,7 +413,7 @@ class Productionist(object):
         if symbol.top_level:
             # Make sure this symbol doesn't violate any preconditions, since this hasn't
             # been checked yet during backward chaining
-            if not symbol.currently_violated(state=state):
+            if not symbol.currently_violated(state=state, state_tuple=self.state_tuple, memo=self.condition_memo):
                 if self.debug:
                     print "Reached top-level symbol {}, so backward chaining is done".format(symbol)
                 return symbol
@@ -282,7 +430,7 @@ class Productionist(object):
                 )
             )
             if this_production_rule_successfully_fired:
-                production_rule.viable = True
+                self.viable_rules.add(production_rule)
                 # Set breadcrumbs so that we can reconstruct our path if this backward chain
                 # is successful (by 'reconstruct our path', I mean fire all the production rules
                 # along our successful backward chain until we've generated a complete dialogue template)
@@ -310,7 +458,7 @@ class Productionist(object):
         self.symbols_expanded_to_produce_the_terminal_derivation = {start_symbol}
         if self.debug:
             print "Retraversing now from top-level symbol {}".format(start_symbol)
-        first_breadcrumb = next(rule for rule in start_symbol.production_rules if rule.viable)
+        first_breadcrumb = next(rule for rule in start_symbol.production_rules if rule in self.viable_rules)
         return self._target_production_rule(
             rule=first_breadcrumb, state=state, retracing_chains=True, rule_evaluation_metric=rule_evaluation_metric,
             n_tabs=0
@@ -319,7 +467,7 @@ class Productionist(object):
     def _target_production_rule(self, rule, state, rule_evaluation_metric, n_tabs, retracing_chains=False):
         """Attempt to terminally expand this rule's head."""
         if self.debug:
-            if rule.viable:
+            if rule in self.viable_rules:
                 print "{}Retracing our chains via rule {}".format('  '*n_tabs, rule)
             else:
                 print "{}Targeting production rule {}...".format('  '*n_tabs, rule)
@@ -327,9 +475,9 @@ class Productionist(object):
         for symbol in rule.body:
             if type(symbol) == unicode:  # Terminal symbol (no need to expand)
                 terminally_expanded_symbols_in_this_rule_body.append(symbol)
-            elif symbol.expansion and not retracing_chains:
+            elif not retracing_chains and self.expansions.get(symbol):
                 # Nonterminal symbol that we already successfully expanded earlier
-                return symbol.expansion
+                return self.expansions[symbol]
             else:  # Nonterminal symbol that we have not yet successfully expanded
                 terminal_expansion_of_that_symbol = self._forward_chain_from_symbol(
                     symbol=symbol, state=state, retracing_chains=retracing_chains,
@@ -346,7 +494,7 @@ class Productionist(object):
                         print "{}Abandoning production rule {}".format('  '*n_tabs, rule)
                     return None
         # You successfully expanded all the symbols in this rule body
-        rule.viable = True
+        self.viable_rules.add(rule)
         expansion_yielded_by_this_rule = ''.join(terminally_expanded_symbols_in_this_rule_body)
         return expansion_yielded_by_this_rule
 
@@ -435,18 +583,17 @@ class Productionist(object):
         return probability_ranges
 
     def _reset_temporary_attributes(self):
-        """Clear all temporary symbol and rule attributes that we set during this generation session."""
-        for symbol in self.nonterminal_symbols:
-            symbol.expansion = None
-            for rule in symbol.production_rules:
-                rule.viable = False
+        """Clear all temporary search state that we set during this generation session."""
+        self.expansions = {}
+        self.viable_rules = set()
         self.symbols_expanded_to_produce_the_terminal_derivation = set()
+        self.condition_memo.clear()
 
     def find_symbol(self, symbol_name):
         """Return a symbol with the given name."""
         try:
-            return next(s for s in self.nonterminal_symbols if s.tag == symbol_name)
-        except StopIteration:
+            return self.symbols_by_tag[symbol_name]
+        except KeyError:
             print "I could not find a symbol with that name."
 
 
@@ -466,14 +613,9 @@ class NonterminalSymbol(object):
         # These attributes are used to perform live generation of a dialogue template from the
         # grammar specification, which is done using backward-chaining and forward-chaining
         # to check for precondition violations and other preclusions; they get set by
-        # Productionist._init_attribute_backward_chaining_and_forward_chaining_rules_to_symbols()
+        # Grammar._init_attribute_backward_chaining_and_forward_chaining_rules_to_symbols()
         self.backward_chaining_rules = []
         self.forward_chaining_rules = []
-        # This attribute will hold the successful expansion of this symbol during a
-        # generation procedure; we keep track of this so as to not reduplicate expansion
-        # efforts while we are firing production rules during backward- and forward-chaining,
-        # which could happen if two rules have the same symbol in their rule bodies
-        self.expansion = None
         # Parse markup
         self._init_parse_markup(raw_markup=raw_markup)
 
@@ -496,6 +638,14 @@ class NonterminalSymbol(object):
         """This method gets overwritten by subclasses to this class."""
         pass
 
+    @property
+    def indexed_markup(self):
+        """Return the (tagset, tag) pairs under which Productionist should index this symbol.
+
+        This method gets overwritten by subclasses to this class.
+        """
+        return []
+
 
 class ProductionRule(object):
     """A production rule in a production system for in-game dialogue generation."""
@@ -507,15 +657,10 @@ class ProductionRule(object):
         'body' is a sequence of symbols that this rule may be used to expand the head into.
         """
         self.head = head
-        self.body = None  # Gets set by Productionist._init_resolve_symbol_references_in_a_rule_body()
+        self.body = None  # Gets set by Grammar._init_resolve_symbol_references_in_a_rule_body()
         self.body_specification = body_specification
         self.body_specification_str = ''.join(body_specification)
         self.application_rate = application_rate
-        # This attribute will mark whether this production rule successfully fired during the
-        # backward-chaining routine of a generation procedure; we keep track of this because
-        # after we have successfully terminally backward-chained and forward-chained, we need
-        # to remember the rules on those chains in order to construct the final dialogue template
-        self.viable = False
 
     def __str__(self):
         """Return string representation."""
@@ -530,6 +675,9 @@ class Condition(object):
         self.condition = condition
         self.test = eval(condition)  # The condition is literally a lambda function
         self.arguments = self._init_parse_condition_for_its_arguments(condition=condition)
+        # Compile a function that evaluates the test directly against a state tuple, with
+        # each argument already resolved to the index of its variable in such tuples
+        self.compiled_test = self._init_compile_test()
 
     @staticmethod
     def _init_parse_condition_for_its_arguments(condition):
@@ -540,32 +688,114 @@ class Condition(object):
         arguments = arguments.split(', ')
         return arguments
 
-    def evaluate(self, state):
-        """Evaluate this condition given the state of the world at the beginning of a conversation turn."""
+    def _init_compile_test(self):
+        """Return a function that evaluates this condition's test against a state tuple."""
+        for argument in self.arguments:
+            if argument not in STATE_VARIABLES:
+                raise Exception(
+                    "The condition {} takes an unknown argument '{}'".format(self.condition, argument)
+                )
+        test = self.test
+        indices = tuple(STATE_VARIABLES.index(argument) for argument in self.arguments)
+        # Conditions take one or two arguments in practice, so give those cases dedicated
+        # functions that avoid building an argument list on every call
+        if len(indices) == 1:
+            i = indices[0]
+            return lambda state_tuple: test(state_tuple[i])
+        elif len(indices) == 2:
+            i, j = indices
+            return lambda state_tuple: test(state_tuple[i], state_tuple[j])
+        return lambda state_tuple: test(*[state_tuple[i] for i in indices])
+
+    @staticmethod
+    def build_state_tuple(state):
+        """Return a tuple binding the variables that conditions may refer to, given a state capsule.
+
+        The state capsule will be a Conversation object (in the case of dialogue generation) or a
+        Person object (in the case of thought generation); variables that don't pertain to the
+        given kind of state are bound to None. The elements of the tuple are ordered as in
+        STATE_VARIABLES.
+        """
         # Use duck typing to check for whether this state capsule is a Conversation
-        # object (in the case of dialogue generation) or a Person object (in the case
-        # of thought generation)
+        # object or a Person object
         if state.__class__.__name__ is 'Conversation':
+            return state, state.speaker, state.interlocutor, state.subject.matches[state.speaker], None
+        elif state.__class__.__name__ in ('Person', 'PersonExNihilo'):
+            return None, None, None, None, state
+        return None, None, None, None, None
+
+    def evaluate(self, state, state_tuple=None, memo=None):
+        """Evaluate this condition given the state of the world at the beginning of a conversation turn.
+
+        @param state: The state capsule (a Conversation or Person object) that this condition pertains to.
+        @param state_tuple: Optionally, a state tuple already built for this state capsule by
+                            build_state_tuple(), which Productionist passes during generation.
+        @param memo: Optionally, a ConditionMemo holding results for this same state tuple.
+        """
+        if memo is not None and state_tuple is not None:
+            return memo.evaluate(condition=self, state_tuple=state_tuple)
+        if state_tuple is None:
             # If the current speaker is a human player, don't even worry about
             # evaluating preconditions, i.e., let them say whatever
-            if state.speaker.player:
+            if state.__class__.__name__ is 'Conversation' and state.speaker.player:
                 return True
-            # Instantiate all the arguments we might need as local variables
-            conversation = state
-            speaker = state.speaker
-            interlocutor = state.interlocutor
-            subject = state.subject.matches[state.speaker]
-        elif state.__class__.__name__ in ('Person', 'PersonExNihilo'):
-            thinker = state
-        # Prepare the list of arguments by evaluating to bind them to the needed local variables
-        realized_arguments = [eval(argument) for argument in self.arguments]
+            state_tuple = self.build_state_tuple(state=state)
         # Return a boolean indicating whether this precondition is satisfied
         try:
-            return self.test(*realized_arguments)
+            return self.compiled_test(state_tuple)
         except (ValueError, AttributeError):
             raise Exception('Cannot evaluate the precondition {}'.format(self.condition))
 
 
+class ConditionMemo(object):
+    """A memo table of condition results that holds for the duration of a generation request.
+
+    The state that conditions are evaluated against doesn't change while Productionist searches
+    for a derivation, so a condition's result may be reused whenever that condition (or another
+    with the same specification) comes up again. Entries are keyed by the condition specification
+    and the current state epoch, which Productionist advances at the beginning of every request.
+    """
+
+    def __init__(self):
+        """Initialize a ConditionMemo object."""
+        self.results = {}
+        self.epoch = 0
+        # Running counts across all requests, which indicate how much generation time
+        # would otherwise be spent on repeated condition evaluations
+        self.hits = 0
+        self.misses = 0
+
+    def __str__(self):
+        """Return string representation."""
+        return "Condition memo ({} hits, {} misses, hit rate {:.1%})".format(self.hits, self.misses, self.hit_rate)
+
+    @property
+    def hit_rate(self):
+        """Return the share of condition evaluations that were answered by this memo."""
+        lookups = self.hits + self.misses
+        return self.hits/float(lookups) if lookups else 0.0
+
+    def advance_epoch(self):
+        """Begin a new state epoch, rendering all results evaluated against earlier states stale."""
+        self.epoch += 1
+        self.results = {}
+
+    def clear(self):
+        """Clear all results memoized during the current state epoch."""
+        self.results = {}
+
+    def evaluate(self, condition, state_tuple):
+        """Return the result of evaluating the given condition against the given state tuple."""
+        key = (condition.condition, self.epoch)
+        try:
+            result = self.results[key]
+            self.hits += 1
+        except KeyError:
+            result = self.results[key] = condition.evaluate(state=None, state_tuple=state_tuple)
+            self.misses += 1
+        return result
+
+
 class Precondition(Condition):
     """A precondition for expanding a symbol to generate a line of dialogue."""
 
@@ -589,7 +819,7 @@ class StaticElement(object):
         """Return the text of this static element."""
         return self.text
 
-    def realize(self, state):
+    def realize(self, state, state_tuple=None):
         """Realize a StaticElement object simply by returning its text."""
         return self.text
 
@@ -597,6 +827,10 @@ class StaticElement(object):
 class Gap(object):
     """A gap in a templated terminal derivation."""
 
+    # Accessors compiled from gap specifications, keyed by specification; these are shared by
+    # every template that includes the same gap, so that each specification is only compiled once
+    compiled_accessors = {}
+
     def __init__(self, specification):
         """Initialize a Gap object."""
         self.specification = specification
@@ -605,21 +839,28 @@ class Gap(object):
         """Return the specification for filling in this gap."""
         return self.specification
 
-    def realize(self, state):
-        """Fill in this gap according to the world state during a conversation turn."""
-        # Use duck typing to check for whether this state capsule is a ConversationTurn
-        # object (in the case of dialogue generation) or a Person object (in the case
-        # of thought generation); then prepare local variables that will allow us to
-        # fill in this gap
-        if state.__class__.__name__ is 'Conversation':
-            conversation, speaker, interlocutor, subject = (
-                state,
-                state.speaker, state.interlocutor,
-                state.subject.matches[state.speaker]
-            )
-        elif state.__class__.__name__ in ('Person', 'PersonExNihilo'):
-            thinker = state
-        return str(eval(self.specification))
+    @property
+    def accessor(self):
+        """Return a function that fills in this gap, given the elements of a state tuple."""
+        try:
+            return Gap.compiled_accessors[self.specification]
+        except KeyError:
+            accessor = eval('lambda {variables}: {specification}'.format(
+                variables=', '.join(STATE_VARIABLES), specification=self.specification
+            ))
+            Gap.compiled_accessors[self.specification] = accessor
+            return accessor
+
+    def realize(self, state, state_tuple=None):
+        """Fill in this gap according to the world state during a conversation turn.
+
+        @param state: The state capsule (a Conversation or Person object) that this gap pertains to.
+        @param state_tuple: Optionally, a state tuple built by Condition.build_state_tuple(), e.g., the one
+                            recorded when a line of dialogue was delivered, if it is being realized later on.
+        """
+        if state_tuple is None:
+            state_tuple = Condition.build_state_tuple(state=state)
+        return str(self.accessor(*state_tuple))
 
 
 class DialogueGenerator(Productionist):
@@ -632,25 +873,17 @@ class DialogueGenerator(Productionist):
     def __init__(self, game):
         """Initialize a DialogueGenerator object."""
         super(DialogueGenerator, self).__init__(game)
+        # Caches the templates of lines that were successfully generated, so that subsequent requests
+        # targeting the same move or topics under the same conditions may skip the search altogether
+        self.template_cache = TemplateCache(max_size=game.config.dialogue_template_cache_size)
 
     def target_dialogue_move(self, conversation, move_name):
         """Attempt to generate a line of dialogue that performs a dialogue move with the given name."""
-        # Attempt to produce a raw derivation with the desired markup, i.e., that
-        # it performs the given dialogue move
-        raw_derivation_built_by_targeting_this_symbol = self.target_markup(
+        return self._target_line_of_dialogue(
+            conversation=conversation, target=('move', move_name),
             markup_lambda_expression=lambda symbol: move_name in symbol.moves,
-            symbol_sort_evaluation_function=lambda symbol: random.random(),
-            state=conversation, rule_evaluation_metric=lambda rule: rule.application_rate
-        )
-        # Reify the template as a LineOfDialogue object and return that
-        line_of_dialogue_object = LineOfDialogue(
-            raw_template=raw_derivation_built_by_targeting_this_symbol,
-            symbols_expanded_to_produce_this_template=self.symbols_expanded_to_produce_the_terminal_derivation,
-            conversation=conversation
+            candidate_symbols=self.symbols_with_markup(tagset='Moves', tags=(move_name,))
         )
-        # Reset any temporary attributes that we utilized during this generation procedure
-        self._reset_temporary_attributes()
-        return line_of_dialogue_object
 
     def target_topics_of_conversation(self, conversation, topic_names):
         """Attempt to generate a line of dialogue that addresses a topic with the given name.
@@ -659,24 +892,131 @@ class DialogueGenerator(Productionist):
         @param topic_names: A set of names of topics of conversation, at least one which the requested
                             generated line should address.
         """
-        # Attempt to produce a raw derivation with the desired markup, i.e., that
-        # it performs the given dialogue move
-        raw_derivation_built_by_targeting_this_symbol = self.target_markup(
+        return self._target_line_of_dialogue(
+            conversation=conversation, target=('topics', frozenset(topic_names)),
             markup_lambda_expression=lambda symbol: topic_names & symbol.topics_addressed,
-            symbol_sort_evaluation_function=lambda symbol: random.random(),
-            state=conversation, rule_evaluation_metric=lambda rule: rule.application_rate
+            candidate_symbols=self.symbols_with_markup(tagset='AddressTopic', tags=topic_names)
         )
+
+    def _target_line_of_dialogue(self, conversation, target, markup_lambda_expression, candidate_symbols):
+        """Attempt to generate a line of dialogue with the desired markup, reusing a cached template if possible.
+
+        @param target: A hashable specification of what is being targeted (e.g., a dialogue move),
+                       which is used to key the template cache.
+        """
+        # Unless template caching is disabled or the speaker is a player (who may say anything, i.e.,
+        # to whom preconditions don't apply), first check for a cached template whose guarding
+        # conditions still hold
+        cacheable = self.template_cache.max_size > 0 and not conversation.speaker.player
+        cached_template = None
+        if cacheable:
+            cached_template = self.template_cache.look_up(
+                target=target, state_tuple=Condition.build_state_tuple(state=conversation)
+            )
+        if cached_template:
+            raw_derivation_built_by_targeting_this_symbol, symbols_expanded_to_produce_this_template = cached_template
+        else:
+            # Attempt to produce a raw derivation with the desired markup
+            raw_derivation_built_by_targeting_this_symbol = self.target_markup(
+                markup_lambda_expression=markup_lambda_expression,
+                symbol_sort_evaluation_function=lambda symbol: random.random(),
+                state=conversation, rule_evaluation_metric=lambda rule: rule.application_rate,
+                candidate_symbols=candidate_symbols
+            )
+            symbols_expanded_to_produce_this_template = self.symbols_expanded_to_produce_the_terminal_derivation
+            # Reset any temporary attributes that we utilized during this generation procedure
+            self._reset_temporary_attributes()
+            if not raw_derivation_built_by_targeting_this_symbol:
+                # No line could be generated, which the Turn object that made this request will handle
+                return None
+            if cacheable:
+                self.template_cache.store(
+                    target=target, raw_template=raw_derivation_built_by_targeting_this_symbol,
+                    symbols=symbols_expanded_to_produce_this_template
+                )
         # Reify the template as a LineOfDialogue object and return that
         line_of_dialogue_object = LineOfDialogue(
             raw_template=raw_derivation_built_by_targeting_this_symbol,
-            symbols_expanded_to_produce_this_template=self.symbols_expanded_to_produce_the_terminal_derivation,
+            symbols_expanded_to_produce_this_template=symbols_expanded_to_produce_this_template,
             conversation=conversation
         )
-        # Reset any temporary attributes that we utilized during this generation procedure
-        self._reset_temporary_attributes()
         return line_of_dialogue_object
 
 
+class TemplateCache(object):
+    """A least-recently-used cache of raw templates that were successfully generated for a given target.
+
+    A template is valid only so long as none of the symbols that were expanded to produce it are
+    currently violated, so each cached template is keyed by its target and by the outcomes of the
+    conditions that guarded its chains, i.e., the preconditions (which were all satisfied) and the
+    violation conditions (none of which held) of its symbols. On a request for a target, these guard
+    conditions alone are re-evaluated for the cached templates of that target, and the first template
+    whose guards still produce the same outcomes is reused without any search being done.
+    """
+
+    def __init__(self, max_size):
+        """Initialize a TemplateCache object.
+
+        @param max_size: The maximum number of templates to cache; if this is 0, nothing gets cached.
+        """
+        self.max_size = max_size
+        # Maps (target, guards) keys to (raw template, symbols expanded) entries, ordered from
+        # least recently used to most recently used
+        self.entries = collections.OrderedDict()
+        # Maps targets to the keys of their cached entries
+        self.keys_by_target = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __str__(self):
+        """Return string representation."""
+        return "Template cache ({} of {} templates; {} hits, {} misses, hit rate {:.1%})".format(
+            len(self.entries), self.max_size, self.hits, self.misses, self.hit_rate
+        )
+
+    @property
+    def hit_rate(self):
+        """Return the share of look-ups that were answered by this cache."""
+        look_ups = self.hits + self.misses
+        return self.hits/float(look_ups) if look_ups else 0.0
+
+    def look_up(self, target, state_tuple):
+        """Return a (raw template, symbols expanded) entry for this target whose guards hold, if any, else None."""
+        for key in self.keys_by_target.get(target, ()):
+            _, guards = key
+            if all(bool(condition.evaluate(state=None, state_tuple=state_tuple)) is outcome
+                   for condition, outcome in guards):
+                # Mark this entry as the most recently used one
+                entry = self.entries.pop(key)
+                self.entries[key] = entry
+                self.hits += 1
+                return entry
+        self.misses += 1
+        return None
+
+    def store(self, target, raw_template, symbols):
+        """Cache a raw template that was successfully generated for this target by expanding these symbols."""
+        if self.max_size <= 0:
+            return
+        guards = frozenset(
+            [(precondition, True) for symbol in symbols for precondition in symbol.preconditions] +
+            [(violation, False) for symbol in symbols for violation in symbol.conditional_violations]
+        )
+        key = (target, guards)
+        if key in self.entries:
+            del self.entries[key]
+        else:
+            self.keys_by_target.setdefault(target, []).append(key)
+        self.entries[key] = (raw_template, frozenset(symbols))
+        # Evict the least recently used templates, if we've exceeded our capacity
+        while len(self.entries) > self.max_size:
+            evicted_key, _ = self.entries.popitem(last=False)
+            evicted_target = evicted_key[0]
+            self.keys_by_target[evicted_target].remove(evicted_key)
+            if not self.keys_by_target[evicted_target]:
+                del self.keys_by_target[evicted_target]
+
+
 class DialogueNonterminalSymbol(NonterminalSymbol):
     """A subclass of NonterminalSymbol that pertains specifically to dialogue concerns."""
 
@@ -742,13 +1082,25 @@ class DialogueNonterminalSymbol(NonterminalSymbol):
         )
         return list(all_markup)
 
-    def currently_violated(self, state):
+    @property
+    def indexed_markup(self):
+        """Return the (tagset, tag) pairs under which Productionist should index this symbol."""
+        indexed_markup = [('Moves', move) for move in self.moves]
+        indexed_markup += [('AddressTopic', topic) for topic in self.topics_addressed]
+        indexed_markup += [('PushTopic', topic) for topic in self.topics_pushed]
+        indexed_markup += [('PushObligation', obligation) for obligation in self.interlocutor_obligations_pushed]
+        indexed_markup += [('PushSpeakerObligation', obligation) for obligation in self.speaker_obligations_pushed]
+        return indexed_markup
+
+    def currently_violated(self, state, state_tuple=None, memo=None):
         """Return whether this symbol is currently violated, i.e., whether it has an unsatisfied
         precondition or would incur a conversational violation if deployed at this time."""
         if state.speaker.player:  # Let the player say anything currently, i.e., return False
             return False
-        if (self.conversational_violations(conversation=state) or
-                not self.preconditions_satisfied(conversation=state)):
+        if state_tuple is None:
+            state_tuple = Condition.build_state_tuple(state=state)
+        if (self.conversational_violations(conversation=state, state_tuple=state_tuple, memo=memo) or
+                not self.preconditions_satisfied(conversation=state, state_tuple=state_tuple, memo=memo)):
             if state.productionist.debug:
                 # Express why the symbol is currently violated
                 print "Symbol {} is currently violated".format(self)
@@ -764,15 +1116,18 @@ class DialogueNonterminalSymbol(NonterminalSymbol):
         # Symbol is not currently violated, so return False
         return False
 
-    def preconditions_satisfied(self, conversation):
+    def preconditions_satisfied(self, conversation, state_tuple=None, memo=None):
         """Return whether this line's preconditions are satisfied given the state of the world."""
-        return all(precondition.evaluate(state=conversation) for precondition in self.preconditions)
+        return all(
+            precondition.evaluate(state=conversation, state_tuple=state_tuple, memo=memo)
+            for precondition in self.preconditions
+        )
 
-    def conversational_violations(self, conversation):
+    def conversational_violations(self, conversation, state_tuple=None, memo=None):
         """Return a list of names of conversational violations that will be incurred if this line is deployed now."""
         violations_incurred = [
             potential_violation.name for potential_violation in self.conditional_violations if
-            potential_violation.evaluate(state=conversation)
+            potential_violation.evaluate(state=conversation, state_tuple=state_tuple, memo=memo)
             ]
         return violations_incurred
 
@@ -844,9 +1199,30 @@ class LineOfDialogue(object):
             )
             self.context_updates |= symbol.context_updates
 
-    def realize(self, conversation):
-        """Return a filled-in template according to the world state during the current conversation turn."""
-        return ''.join(element.realize(state=conversation) for element in self.template)
+    def bind_gaps(self, conversation):
+        """Return what each gap of this line's template refers to, in order, according to the world
+        state during the current conversation turn, without rendering any of it as text.
+        """
+        state_tuple = Condition.build_state_tuple(state=conversation)
+        return [element.accessor(*state_tuple) for element in self.template if isinstance(element, Gap)]
+
+    def realize(self, conversation, state_tuple=None, gap_bindings=None):
+        """Return a filled-in template according to the world state during the current conversation turn.
+
+        @param state_tuple: Optionally, a state tuple already built for the conversation by
+                            Condition.build_state_tuple().
+        @param gap_bindings: Optionally, what each gap referred to, as returned by bind_gaps() when this
+                             line was delivered, which allows a turn to defer rendering its line until
+                             someone actually asks for the text.
+        """
+        if gap_bindings is not None:
+            gap_bindings = iter(gap_bindings)
+            return ''.join(
+                str(next(gap_bindings)) if isinstance(element, Gap) else element.text for element in self.template
+            )
+        if state_tuple is None:
+            state_tuple = Condition.build_state_tuple(state=conversation)
+        return ''.join(element.realize(state=conversation, state_tuple=state_tuple) for element in self.template)
 
 
 class ConditionalViolation(Condition):
@@ -881,11 +1257,65 @@ class ThoughtGenerator(Productionist):
         # These are set as needed by target_association() to hold temporary information
         self.thinker = None
         self.stimuli = {}
-        self.nonrepeatable_symbols = set()
+        self.symbol_scores = {}
         super(ThoughtGenerator, self).__init__(game)
+        # The sparse signal-by-symbol weight matrix used to score stimuli gets built once, by the
+        # shared grammar (see Grammar.__init__())
+        self.symbol_weights_by_signal = self.grammar.symbol_weights_by_signal
 
-    def target_association(self, thinker, stimuli):
-        """Attempt to generate a line of dialogue that performs a dialogue move with the given name."""
+    def target_association(self, thinker, stimuli, symbol_scores=None):
+        """Attempt to generate a thought that is elicited by the given stimuli.
+
+        @param thinker: The person in whose mind the thought would be elicited.
+        @param stimuli: A dictionary mapping signals to their strengths.
+        @param symbol_scores: Optionally, the scores of symbols for these stimuli, as returned by
+                              score_stimuli(); if this is not given, they will be computed here.
+        """
+        raw_derivation_built_by_targeting_this_symbol = self._target_association(
+            thinker=thinker, stimuli=stimuli, symbol_scores=symbol_scores
+        )
+        # Reify the template as a Thought object and return that
+        thought_object = Thought(
+            raw_template=raw_derivation_built_by_targeting_this_symbol,
+            symbols_expanded_to_produce_this_template=self.symbols_expanded_to_produce_the_terminal_derivation,
+            thinker=thinker
+        )
+        # Reset any temporary attributes that we utilized during this generation procedure
+        self._reset_temporary_attributes()
+        return thought_object
+
+    def target_associations(self, thinkers_and_stimuli):
+        """Attempt to generate a thought for each of many thinkers, e.g., everyone in town on a given day.
+
+        The stimuli of all the thinkers are scored against the grammar in a single call to
+        score_stimuli_of_many_thinkers(), before a thought is targeted for each of them in turn.
+
+        @param thinkers_and_stimuli: A list of (thinker, stimuli) tuples, where stimuli is a
+                                     dictionary mapping signals to their strengths.
+        @return: A list including, for each of the given thinkers, the thought elicited in their
+                 mind, or None if no thought could be generated from their stimuli.
+        """
+        all_symbol_scores = self.score_stimuli_of_many_thinkers(thinkers_and_stimuli=thinkers_and_stimuli)
+        thoughts = []
+        for (thinker, stimuli), symbol_scores in zip(thinkers_and_stimuli, all_symbol_scores):
+            raw_derivation = self._target_association(thinker=thinker, stimuli=stimuli, symbol_scores=symbol_scores)
+            if raw_derivation:
+                thoughts.append(
+                    Thought(
+                        raw_template=raw_derivation,
+                        symbols_expanded_to_produce_this_template=(
+                            self.symbols_expanded_to_produce_the_terminal_derivation
+                        ),
+                        thinker=thinker
+                    )
+                )
+            else:
+                thoughts.append(None)
+            self._reset_temporary_attributes()
+        return thoughts
+
+    def _target_association(self, thinker, stimuli, symbol_scores):
+        """Attempt to produce a raw derivation that is associated with the given stimuli."""
         if self.debug:
             print "Attempting to elicit thought given the stimuli: {stimuli}...".format(
                 stimuli=', '.join("{signal} ({strength})".format(
@@ -894,55 +1324,61 @@ class ThoughtGenerator(Productionist):
             )
         self.thinker = thinker
         self.stimuli = stimuli
-        self.nonrepeatable_symbols = self._collect_nonrepeatable_symbols()
-        markup_lambda_expression = (
-            lambda symbol: {pair[0] for pair in symbol.signals} & {pair[0] for pair in self.stimuli.iteritems()}
-        )
+        if symbol_scores is None:
+            symbol_scores = self.score_stimuli(thinker=thinker, stimuli=stimuli)
+        self.symbol_scores = symbol_scores
         # Attempt to produce a raw derivation with the desired markup, i.e., one that has
         # a good matching between the symbols associated with it and the stimuli (i.e., the
-        # weighted_symbol_set)
-        raw_derivation_built_by_targeting_this_symbol = self.target_markup(
-            markup_lambda_expression=markup_lambda_expression,
+        # weighted_symbol_set); the symbols that were scored are exactly the ones annotated
+        # with at least one of the stimuli signals
+        return self.target_markup(
+            markup_lambda_expression=lambda symbol: symbol in symbol_scores,
             symbol_sort_evaluation_function=self.evaluate_nonterminal_symbol,
             state=thinker,
-            rule_evaluation_metric=self.evaluate_production_rule
-        )
-        # Reify the template as a Thought object and return that
-        thought_object = Thought(
-            raw_template=raw_derivation_built_by_targeting_this_symbol,
-            symbols_expanded_to_produce_this_template=self.symbols_expanded_to_produce_the_terminal_derivation,
-            thinker=thinker
+            rule_evaluation_metric=self.evaluate_production_rule,
+            candidate_symbols=list(symbol_scores)
         )
-        # Reset any temporary attributes that we utilized during this generation procedure
-        self._reset_temporary_attributes()
-        return thought_object
 
-    def _collect_nonrepeatable_symbols(self):
-        """Collect all nonterminal symbols that cannot be expanded during this generation instance (because
-        that would produce awkward repetition.
+    def score_stimuli(self, thinker, stimuli):
+        """Score all the symbols annotated with any of the given stimuli signals for the strength of
+        their association with those stimuli.
+
+        @return: A dictionary mapping each symbol annotated with any of the stimuli signals to its score.
+        """
+        return self.score_stimuli_of_many_thinkers(thinkers_and_stimuli=[(thinker, stimuli)])[0]
+
+    def score_stimuli_of_many_thinkers(self, thinkers_and_stimuli):
+        """Score symbols for the stimuli of each of many thinkers.
+
+        A symbol's score is the dot product of the stimuli with that symbol's column in the
+        signal-by-symbol weight matrix, which is penalized (once) if the symbol is nonrepeatable
+        and its thinker expanded it to produce a recent thought.
+
+        @param thinkers_and_stimuli: A list of (thinker, stimuli) tuples, where stimuli is a
+                                     dictionary mapping signals to their strengths.
+        @return: A list including, for each of the given thinkers, a dictionary mapping each symbol
+                 annotated with any of their stimuli signals to its score.
         """
-        nonrepeatable_symbols_recently_expanded_by_thinker = set()
-        for recent_thought in self.thinker.mind.recent_thoughts:
-            for symbol in recent_thought.nonterminal_symbols:
-                if symbol.nonrepeatable:
-                    nonrepeatable_symbols_recently_expanded_by_thinker.add(symbol)
-        return nonrepeatable_symbols_recently_expanded_by_thinker
+        penalty_multiplier = self.game.config.penalty_multiplier_for_expanding_nonrepeatable_symbol_in_thought
+        symbol_weights_by_signal = self.symbol_weights_by_signal
+        all_symbol_scores = []
+        for thinker, stimuli in thinkers_and_stimuli:
+            symbol_scores = {}
+            for signal, strength in stimuli.iteritems():
+                for symbol, weight in symbol_weights_by_signal.get(signal, ()):
+                    symbol_scores[symbol] = symbol_scores.get(symbol, 0) + weight*strength
+            # Penalize symbols having already been expanded by this person to produce a recent
+            # thought (since expanding them again would produce awkward repetition)
+            recently_expanded_nonrepeatable_symbols = thinker.mind.recently_expanded_nonrepeatable_symbols
+            for symbol in symbol_scores:
+                if symbol in recently_expanded_nonrepeatable_symbols:
+                    symbol_scores[symbol] *= penalty_multiplier
+            all_symbol_scores.append(symbol_scores)
+        return all_symbol_scores
 
     def evaluate_nonterminal_symbol(self, nonterminal_symbol):
-        """Score a nonterminal symbol for the strength of its association with a set of stimuli."""
-        config = self.game.config
-        score = 0
-        for stimulus_signal, stimulus_signal_weight in self.stimuli.iteritems():
-            for symbol_signal, _ in nonterminal_symbol.signals:  # _ stands for symbol_signal_weight (now ignored)
-                # Reward for matching signals (commensurately to the weight for that
-                # signal that is packaged up in the stimuli)
-                if stimulus_signal == symbol_signal:
-                    score += stimulus_signal_weight
-                # Penalize for symbol having already been expanded by this person to
-                # produce a recent thought
-                if nonterminal_symbol in self.nonrepeatable_symbols:
-                    score *= config.penalty_multiplier_for_expanding_nonrepeatable_symbol_in_thought
-        return score
+        """Score a nonterminal symbol for the strength of its association with the current stimuli."""
+        return self.symbol_scores.get(nonterminal_symbol, 0)
 
     def evaluate_production_rule(self, rule):
         """Score a production rule for the strength of its association with a set of stimuli."""
@@ -995,14 +1431,22 @@ class ThoughtNonterminalSymbol(NonterminalSymbol):
         all_markup = self.preconditions | self.signals | self.effects
         return list(all_markup)
 
-    def currently_violated(self, state):
+    @property
+    def indexed_markup(self):
+        """Return the (tagset, tag) pairs under which Productionist should index this symbol."""
+        return [('Signals', signal) for signal, _ in self.signals]
+
+    def currently_violated(self, state, state_tuple=None, memo=None):
         """Return whether this symbol is currently violated, i.e., whether it has an unsatisfied
         precondition or would incur a conversational violation if deployed at this time."""
-        return not self.preconditions_satisfied(thinker=state)
+        return not self.preconditions_satisfied(thinker=state, state_tuple=state_tuple, memo=memo)
 
-    def preconditions_satisfied(self, thinker):
+    def preconditions_satisfied(self, thinker, state_tuple=None, memo=None):
         """Return whether this line's preconditions are satisfied given the state of the world."""
-        return all(precondition.evaluate(state=thinker) for precondition in self.preconditions)
+        return all(
+            precondition.evaluate(state=thinker, state_tuple=state_tuple, memo=memo)
+            for precondition in self.preconditions
+        )
 
 
 class Thought(object):
@@ -1077,7 +1521,10 @@ class Thought(object):
 
     def realize(self):
         """Return a filled-in template according to the world state during the current conversation turn."""
-        raw_realization = ''.join(element.realize(state=self.thinker) for element in self.template)
+        state_tuple = Condition.build_state_tuple(state=self.thinker)
+        raw_realization = ''.join(
+            element.realize(state=self.thinker, state_tuple=state_tuple) for element in self.template
+        )
         return self._postprocess_raw_realization(raw_realization=str(raw_realization))
 
     @staticmethod
@@ -88,16 +88,22 @@ class _Index:
     | y | the y center coordinate of the area that the quadtree should keep track of
     | width | how far from the xcenter that the quadtree should look when keeping track
     | height | how far from the ycenter that the quadtree should look when keeping track
+    | max_items | the number of items a quad may hold before it splits (defaults to MAX)
+    | max_depth | the depth below which quads no longer split (defaults to MAX_DEPTH)
 
     """
     MAX = 1
     MAX_DEPTH = 3
-    def __init__(self, x, y, width, height, depth = 0):
+    def __init__(self, x, y, width, height, depth = 0, max_items = None, max_depth = None):
         self.nodes = []
         self.children = []
         self.center = [x, y]
         self.width,self.height = width,height
         self.depth = depth
+        if max_items is not None:
+            self.MAX = max_items
+        if max_depth is not None:
+            self.MAX_DEPTH = max_depth
     def __iter__(self):
         def loopallchildren(parent):
             for child in parent.children:
@@ -196,19 +202,23 @@ class _Index:
         self.children = [_Index(self.center[0] - quartwidth,
                                   self.center[1] - quartheight,
                                   width=halfwidth, height=halfheight,
-                                  depth=self.depth + 1),
+                                  depth=self.depth + 1,
+                                  max_items=self.MAX, max_depth=self.MAX_DEPTH),
                          _Index(self.center[0] - quartwidth,
                                   self.center[1] + quartheight,
                                   width=halfwidth, height=halfheight,
-                                  depth=self.depth + 1),
+                                  depth=self.depth + 1,
+                                  max_items=self.MAX, max_depth=self.MAX_DEPTH),
                          _Index(self.center[0] + quartwidth,
                                   self.center[1] - quartheight,
                                   width=halfwidth, height=halfheight,
-                                  depth=self.depth + 1),
+                                  depth=self.depth + 1,
+                                  max_items=self.MAX, max_depth=self.MAX_DEPTH),
                          _Index(self.center[0] + quartwidth,
                                   self.center[1] + quartheight,
                                   width=halfwidth, height=halfheight,
-                                  depth=self.depth + 1)]
+                                  depth=self.depth + 1,
+                                  max_items=self.MAX, max_depth=self.MAX_DEPTH)]
         nodes = self.nodes
         self.nodes = []
         for node in nodes:
@@ -226,9 +236,11 @@ class Index(_Index):
     | **option** | **description**
     | --- | --- 
     | bbox | the coordinate system bounding box of the area that the quadtree should keep track of, as a 4-length sequence (xmin,ymin,xmax,ymax)
+    | max_items | the number of items a quad may hold before it splits (defaults to MAX)
+    | max_depth | the depth below which quads no longer split (defaults to MAX_DEPTH)
     
     """
-    def __init__(self, bbox):
+    def __init__(self, bbox, max_items=None, max_depth=None):
         x1,y1,x2,y2 = bbox
         width,height = x2-x1,y2-y1
         midx,midy = x1+width/2.0, y1+height/2.0
@@ -237,6 +249,10 @@ class Index(_Index):
         self.center = [midx, midy]
         self.width,self.height = width,height
         self.depth = 0
+        if max_items is not None:
+            self.MAX = max_items
+        if max_depth is not None:
+            self.MAX_DEPTH = max_depth
 
 #SOME TESTING
 if __name__ == "__main__":
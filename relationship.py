@@ -447,6 +447,7 @@ class Acquaintance(Relationship):
         """
         super(Acquaintance, self).__init__(owner, subject, preceded_by)
         owner.acquaintances.add(subject)
+        owner.social_ties_version += 1
         if self.owner not in self.subject.relationships:
             Acquaintance(owner=self.subject, subject=self.owner, preceded_by=None)
         # Update the salience value owner has for subject (not vice versa, because relationships
@@ -469,6 +470,7 @@ class Enmity(Relationship):
         super(Enmity, self).__init__(owner, subject, preceded_by)
         owner.acquaintances.remove(subject)
         owner.enemies.add(subject)
+        owner.social_ties_version += 1
         # Update the salience value owner has for subject (not vice versa, because relationships
         # are unidirectional)
         owner.update_salience_of(
@@ -489,6 +491,7 @@ class Friendship(Relationship):
         super(Friendship, self).__init__(owner, subject, preceded_by)
         owner.acquaintances.remove(subject)
         owner.friends.add(subject)
+        owner.social_ties_version += 1
         # Update the salience value owner has for subject (not vice versa, because relationships
         # are unidirectional)
         owner.update_salience_of(
@@ -11,6 +11,7 @@ class DwellingPlace(object):
         """
         self.id = owners[0].game.current_place_id
         owners[0].game.current_place_id += 1
+        owners[0].game.places[self.id] = self
         self.type = "residence"
         self.city = lot.city
         self.city.dwelling_places.add(self)
@@ -1,3 +1,4 @@
+import bisect
 import random
 
 
@@ -23,76 +24,102 @@ class Routine(object):
         """Return string representation."""
         return "Daily routine of {}".format(self.person.name)
 
-    def enact(self):
-        """Enact this person's daily routine for a particular timestep."""
-        new_location, occasion = self.decide_where_to_go()
+    def enact(self, step=None):
+        """Enact this person's daily routine for a particular timestep.
+
+        @param step: Optionally, the RoutineStep for the current timestep; RoutineStep.enact_routines()
+                     passes this when enacting many people's routines as a batch.
+        """
+        if step is None:
+            step = RoutineStep(game=self.person.game)
+        new_location, occasion = self.decide_where_to_go(step=step)
+        self._go(new_location=new_location, occasion=occasion)
+
+    def _go(self, new_location, occasion):
+        """Have this person go where they decided to go on this timestep."""
         self.occasion = occasion
         self.working = True if occasion == 'work' else False
         self.person.go_to(destination=new_location, occasion=occasion)
 
-    def decide_where_to_go(self):
+    def decide_where_to_go(self, step=None):
         """Return the location at which this person will spend the next timestep, as well as the
         occasion for them doing so.
         """
-        config = self.person.game.config
+        if step is None:
+            step = RoutineStep(game=self.person.game)
         # If they're a kid, potentially send them to school or daycare -- TODO NO DAYCARE IF PARENT HOME
         if not self.person.adult:
-            if self.person.game.time_of_day == "day":
-                location, occasion = self._go_to_school_or_daycare(), 'school'
-                if location is self.person.home:  # They are very young child and living in a city/time without daycare
-                    occasion = 'home'
-            else:
-                location, occasion = self.person.home, 'home'  # Kids stay home at night
+            return self._decide_where_to_go_as_a_child(step=step)
         # If they have a job...
-        elif self.person.occupation and self.person.occupation.shift == self.person.game.time_of_day:
-            if random.random() < config.chance_someone_doesnt_have_to_work_some_day:
-                if random.random() < config.chance_someone_leaves_home_on_day_off[self.person.game.time_of_day]:
-                    location, occasion = self._go_in_public()
-                else:
-                    location, occasion = self.person.home, 'home'
-            elif random.random() < config.chance_someone_calls_in_sick_to_work:
-                if random.random() < config.chance_someone_leaves_home_on_sick_day:
-                    location, occasion = self._go_in_public()
-                else:
-                    location, occasion = self.person.home, 'home'
-            else:
-                # We specifically note that they are working, because they could be going into
-                # their place of work on an off-day (e.g., restaurant)
-                location, occasion = self.person.occupation.company, 'work'
+        elif self.person.occupation and self.person.occupation.shift == step.time_of_day:
+            return self._decide_where_to_go_on_shift(step=step)
         # If they don't have a job...
         else:
-            chance_of_leaving_home = (
-                (self.person.personality.extroversion + self.person.personality.openness_to_experience) / 2.0
-            )
-            if self.person.kids_at_home:
-                chance_of_leaving_home *= config.chance_someone_leaves_home_multiplier_due_to_kids
-            floor = config.chance_someone_leaves_home_on_day_off_floor[self.person.game.time_of_day]
-            cap = config.chance_someone_leaves_home_on_day_off_cap[self.person.game.time_of_day]
-            if chance_of_leaving_home < floor:
-                chance_of_leaving_home = floor
-            elif chance_of_leaving_home > cap:
-                chance_of_leaving_home = cap
-            if random.random() < chance_of_leaving_home:
-                location, occasion = self._go_in_public()
+            return self._decide_where_to_go_off_work(step=step)
+
+    def _decide_where_to_go_as_a_child(self, step):
+        """Return where this child will spend the next timestep, and the occasion for them doing so."""
+        if step.time_of_day == "day":
+            location, occasion = self._go_to_school_or_daycare(step=step), 'school'
+            if location is self.person.home:  # They are very young child and living in a city/time without daycare
+                occasion = 'home'
+        else:
+            location, occasion = self.person.home, 'home'  # Kids stay home at night
+        return location, occasion
+
+    def _decide_where_to_go_on_shift(self, step):
+        """Return where this person, whose shift it is, will spend the next timestep, and the occasion for
+        them doing so.
+        """
+        if random.random() < step.chance_someone_doesnt_have_to_work_some_day:
+            if random.random() < step.config.chance_someone_leaves_home_on_day_off[step.time_of_day]:
+                location, occasion = self._go_in_public(step=step)
             else:
                 location, occasion = self.person.home, 'home'
+        elif random.random() < step.chance_someone_calls_in_sick_to_work:
+            if random.random() < step.chance_someone_leaves_home_on_sick_day:
+                location, occasion = self._go_in_public(step=step)
+            else:
+                location, occasion = self.person.home, 'home'
+        else:
+            # We specifically note that they are working, because they could be going into
+            # their place of work on an off-day (e.g., restaurant)
+            location, occasion = self.person.occupation.company, 'work'
+        return location, occasion
+
+    def _decide_where_to_go_off_work(self, step):
+        """Return where this person, who isn't working on this timestep, will spend it, and the occasion for
+        them doing so.
+        """
+        chance_of_leaving_home = (
+            (self.person.personality.extroversion + self.person.personality.openness_to_experience) / 2.0
+        )
+        if self.person.kids_at_home:
+            chance_of_leaving_home *= step.chance_someone_leaves_home_multiplier_due_to_kids
+        if chance_of_leaving_home < step.chance_someone_leaves_home_on_day_off_floor:
+            chance_of_leaving_home = step.chance_someone_leaves_home_on_day_off_floor
+        elif chance_of_leaving_home > step.chance_someone_leaves_home_on_day_off_cap:
+            chance_of_leaving_home = step.chance_someone_leaves_home_on_day_off_cap
+        if random.random() < chance_of_leaving_home:
+            location, occasion = self._go_in_public(step=step)
+        else:
+            location, occasion = self.person.home, 'home'
         return location, occasion
 
-    def _go_to_school_or_daycare(self):
+    def _go_to_school_or_daycare(self, step):
         """Return the school or day care that this child attends."""
-        if self.person.age > 5 and self.person.city.school:
-            school_or_day_care = self.person.city.school
-        elif self.person.age <= 5 and self.person.city.businesses_of_type('DayCare'):
-            school_or_day_care = self.person.city.businesses_of_type('DayCare')[0]
+        if self.person.age > 5 and step.school:
+            school_or_day_care = step.school
+        elif self.person.age <= 5 and step.day_care:
+            school_or_day_care = step.day_care
         else:
             school_or_day_care = self.person.home  # They stay home
         return school_or_day_care
 
-    def _go_in_public(self):
+    def _go_in_public(self, step):
         """Return the location in public that this person will go to."""
-        config = self.person.game.config
-        if random.random() < config.chance_someone_goes_on_errand_vs_visits_someone:
-            location, occasion = self._go_on_errand_or_out_for_leisure()
+        if random.random() < step.chance_someone_goes_on_errand_vs_visits_someone:
+            location, occasion = self._go_on_errand_or_out_for_leisure(step=step)
         else:
             person_they_will_visit = self._visit_someone()
             if person_they_will_visit:
@@ -105,33 +132,26 @@ class Routine(object):
             location, occasion = self.person.home, 'home'
         return location, occasion
 
-    def _go_on_errand_or_out_for_leisure(self):
+    def _go_on_errand_or_out_for_leisure(self, step):
         """Return the location associated with some errand this person will go on."""
-        config = self.person.game.config
         # TODO -- if someone goes on one of these errands, have them actually get
         # served by that business, e.g., have them actually get a haircut
         # TODO -- have people become loyal to certain businesses (or maybe not because such small town?)
         # Determine the type of service this errand will be for
-        x = random.random()
-        service_type_probs = config.probabilities_of_errand_for_service_type[self.person.game.time_of_day]
-        service_type_of_errand = next(
-            # See config.py to understand what's going on here
-            e for e in service_type_probs if service_type_probs[e][0] <= x <= service_type_probs[e][1]
-        )
-        businesses_in_town_providing_that_service = [
-            b for b in self.person.city.companies if service_type_of_errand in b.services
-        ]
+        upper_bounds, service_types = step.cumulative_probabilities_of_errand_for_service_type
+        service_type_of_errand = service_types[bisect.bisect_left(upper_bounds, random.random())]
+        businesses_in_town_providing_that_service = step.city.businesses_by_service.get(service_type_of_errand)
         if businesses_in_town_providing_that_service:
-            if random.random() < config.chance_someone_goes_to_closest_business_of_type:
+            if random.random() < step.chance_someone_goes_to_closest_business_of_type:
                 # Choose between the one closest to your house and the one closest to your work
                 closest_to_home = min(
                     businesses_in_town_providing_that_service,
-                    key=lambda business: self.person.city.distance_between(self.person.home.lot, business.lot)
+                    key=lambda business: step.city.distance_between(self.person.home.lot, business.lot)
                 )
                 if self.person.occupation:
                     closest_to_work = min(
                         businesses_in_town_providing_that_service,
-                        key=lambda business: self.person.city.distance_between(
+                        key=lambda business: step.city.distance_between(
                             self.person.occupation.company.lot, business.lot
                         )
                     )
@@ -147,7 +167,7 @@ class Routine(object):
         # simply set occasion to None, since _go_in_public() will end up having the
         # person staying home anyway (and will change occasion to 'home')
         if one_i_will_go_to:
-            occasion = config.business_type_to_occasion_for_visit[one_i_will_go_to.__class__.__name__]
+            occasion = step.business_type_to_occasion_for_visit[one_i_will_go_to.__class__.__name__]
         else:
             occasion = None
         return one_i_will_go_to, occasion
@@ -221,4 +241,66 @@ class Routine(object):
             f for f in self.person.extended_family if f.present and f.home is not self.person.home
         ]
         extended_family_they_will_visit = random.choice(extended_family_person_doesnt_live_with)
-        return extended_family_they_will_visit
\ No newline at end of file
+        return extended_family_they_will_visit
+
+
+class RoutineStep(object):
+    """The context shared by everyone's routines on a single timestep.
+
+    Everything that routines would otherwise look up person by person -- config parameters for
+    this time of day, the town's school and day care -- is resolved once here, which allows
+    enact_routines() to enact everyone's routines as a batch.
+    """
+
+    def __init__(self, game):
+        """Initialize a RoutineStep object."""
+        config = game.config
+        self.game = game
+        self.config = config
+        self.city = game.city
+        self.time_of_day = game.time_of_day
+        self.chance_someone_doesnt_have_to_work_some_day = config.chance_someone_doesnt_have_to_work_some_day
+        self.chance_someone_calls_in_sick_to_work = config.chance_someone_calls_in_sick_to_work
+        self.chance_someone_leaves_home_on_sick_day = config.chance_someone_leaves_home_on_sick_day
+        self.chance_someone_leaves_home_multiplier_due_to_kids = (
+            config.chance_someone_leaves_home_multiplier_due_to_kids
+        )
+        self.chance_someone_leaves_home_on_day_off_floor = (
+            config.chance_someone_leaves_home_on_day_off_floor[self.time_of_day]
+        )
+        self.chance_someone_leaves_home_on_day_off_cap = (
+            config.chance_someone_leaves_home_on_day_off_cap[self.time_of_day]
+        )
+        self.chance_someone_goes_on_errand_vs_visits_someone = config.chance_someone_goes_on_errand_vs_visits_someone
+        self.chance_someone_goes_to_closest_business_of_type = config.chance_someone_goes_to_closest_business_of_type
+        self.cumulative_probabilities_of_errand_for_service_type = (
+            config.cumulative_probabilities_of_errand_for_service_type[self.time_of_day]
+        )
+        self.business_type_to_occasion_for_visit = config.business_type_to_occasion_for_visit
+        self.school = self.city.school
+        day_cares = self.city.businesses_of_type('DayCare')
+        self.day_care = day_cares[0] if day_cares else None
+
+    def enact_routines(self, people):
+        """Enact the daily routines of the given people for this timestep."""
+        # Sort people into buckets according to which branch of a routine pertains to them
+        children, people_on_shift, people_off_work = [], [], []
+        for person in people:
+            if not person.adult:
+                children.append(person)
+            elif person.occupation and person.occupation.shift == self.time_of_day:
+                people_on_shift.append(person)
+            else:
+                people_off_work.append(person)
+        for person in children:
+            routine = person.routine
+            new_location, occasion = routine._decide_where_to_go_as_a_child(step=self)
+            routine._go(new_location=new_location, occasion=occasion)
+        for person in people_on_shift:
+            routine = person.routine
+            new_location, occasion = routine._decide_where_to_go_on_shift(step=self)
+            routine._go(new_location=new_location, occasion=occasion)
+        for person in people_off_work:
+            routine = person.routine
+            new_location, occasion = routine._decide_where_to_go_off_work(step=self)
+            routine._go(new_location=new_location, occasion=occasion)
@@ -0,0 +1,164 @@
+from array import array
+
+
+NAN = float('nan')
+
+
+class SalienceMatrix(object):
+    """A dense people-by-people matrix holding the salience values that everyone has for everyone else.
+
+    This is an optional alternative (see config.dense_salience_matrix) to holding each person's
+    salience values in a dictionary of their own. Row i holds the salience values of the person
+    whose ID is i, and column j the salience values that people have for the person whose ID is
+    j; each row is an array of 32-bit floats, in which NaN marks someone that the row's person
+    has no salience value for (just as that person would be absent from a dictionary). Every
+    row has the same number of columns, which gets doubled whenever someone is born whose
+    ID doesn't fit.
+    """
+
+    def __init__(self, game):
+        """Initialize a SalienceMatrix object."""
+        self.game = game
+        # The number of columns in each row
+        self.capacity = game.config.salience_matrix_initial_capacity
+        # Rows of the matrix and the people they belong to, both indexed by person ID
+        self.rows = []
+        self.people = []
+
+    def __str__(self):
+        """Return string representation."""
+        return "Salience matrix of {} people with room for {}".format(len(self.rows), self.capacity)
+
+    def register(self, person):
+        """Add a row (and column) to the matrix for a newly instantiated person, and return a
+        dictionary-like view of that row.
+        """
+        if person.id >= self.capacity:
+            self._grow(capacity=person.id+1)
+        while len(self.rows) <= person.id:
+            self.rows.append(None)
+            self.people.append(None)
+        self.rows[person.id] = array('f', [NAN]) * self.capacity
+        self.people[person.id] = person
+        return SalienceView(matrix=self, person=person)
+
+    def _grow(self, capacity):
+        """Double the number of columns in each row until there are at least as many as the given capacity."""
+        new_capacity = self.capacity
+        while new_capacity < capacity:
+            new_capacity *= 2
+        padding = array('f', [NAN]) * (new_capacity-self.capacity)
+        for row in self.rows:
+            if row is not None:
+                row.extend(padding)
+        self.capacity = new_capacity
+
+    def values(self, person, entities, default=0.0):
+        """Return a list of the salience values that the given person has for each of the given entities
+        (with the default for any entity they have no value for).
+        """
+        row = self.rows[person.id]
+        values = []
+        for entity in entities:
+            value = row[entity.id] if entity.type == "person" else NAN
+            values.append(default if value != value else value)
+        return values
+
+    def update_row(self, person, entities, change):
+        """Increment the salience value that the given person has for each of the given people by change."""
+        row = self.rows[person.id]
+        for entity in entities:
+            value = row[entity.id]
+            if value != value:
+                value = 0.0
+            # TODO EXPLORE WHY SOME PEOPLE ARE INDEXING OTHERS WITH
+            # NEGATIVE SALIENCE VALUES -- the max() is duct tape right now
+            row[entity.id] = max(0.0, value + change)
+
+    def update_column(self, people, entity, change):
+        """Increment the salience value that each of the given people has for the given person by change."""
+        rows = self.rows
+        column = entity.id
+        for person in people:
+            row = rows[person.id]
+            value = row[column]
+            if value != value:
+                value = 0.0
+            row[column] = max(0.0, value + change)
+
+
+class SalienceView(object):
+    """A dictionary-like view of one person's row of a SalienceMatrix, keyed by person.
+
+    This supports everything that Person.salience_of_other_people is used for when it is a
+    dictionary; entities other than people (e.g., businesses) may be looked up, but never
+    have salience values.
+    """
+
+    def __init__(self, matrix, person):
+        """Initialize a SalienceView object."""
+        self.matrix = matrix
+        self.person = person
+
+    def _value(self, entity):
+        """Return the salience value for the given entity, or NaN if there isn't one."""
+        return self.matrix.rows[self.person.id][entity.id] if entity.type == "person" else NAN
+
+    def __getitem__(self, entity):
+        """Return the salience value for the given entity, raising a KeyError if there isn't one."""
+        value = self._value(entity)
+        if value != value:
+            raise KeyError(entity)
+        return value
+
+    def __setitem__(self, entity, value):
+        """Set the salience value for the given person."""
+        if entity.type != "person":
+            raise TypeError("Only people may have salience values in a SalienceMatrix.")
+        self.matrix.rows[self.person.id][entity.id] = value
+
+    def __contains__(self, entity):
+        """Return whether there is a salience value for the given entity."""
+        value = self._value(entity)
+        return value == value
+
+    def __len__(self):
+        """Return the number of people there are salience values for."""
+        return sum(1 for value in self.matrix.rows[self.person.id] if value == value)
+
+    def __iter__(self):
+        """Iterate over the people there are salience values for, in order of their IDs."""
+        people = self.matrix.people
+        for person_id, value in enumerate(self.matrix.rows[self.person.id]):
+            if value == value:
+                yield people[person_id]
+
+    def keys(self):
+        """Return the people there are salience values for, in order of their IDs."""
+        return list(self)
+
+    def itervalues(self):
+        """Iterate over the salience values in this row, in order of the IDs of the people they are for."""
+        for value in self.matrix.rows[self.person.id]:
+            if value == value:
+                yield value
+
+    def values(self):
+        """Return the salience values in this row, in order of the IDs of the people they are for."""
+        return list(self.itervalues())
+
+    def iteritems(self):
+        """Iterate over (person, salience value) pairs for the salience values in this row."""
+        people = self.matrix.people
+        for person_id, value in enumerate(self.matrix.rows[self.person.id]):
+            if value == value:
+                yield people[person_id], value
+
+    def items(self):
+        """Return (person, salience value) pairs for the salience values in this row."""
+        return list(self.iteritems())
+
+    def get(self, entity, default=None):
+        """Return the salience value for the given entity, or the default if there isn't one."""
+        value = self._value(entity)
+        return default if value != value else value
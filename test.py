@@ -30,8 +30,9 @@ print '\nRandom character: {random_character}\n'.format(
     random_character=p
 )
 # Print out this character's relationships with every other resident in town
+relations_to_p = p.relation_to_me_of_everyone(people=game.city.residents)
 for r in game.city.residents:
-    print p.relation_to_me(r)
+    print relations_to_p[r]
 # Explore this person's mental models
 print "\n{random_character}'s mental models:\n".format(
     random_character=p.name
@@ -1,17 +1,32 @@
-import json
+"""Generate LSTM training data (derivation traces and terminal derivations) from an Expressionist grammar.
+
+Usage: python training_data.py [path_to_json_grammar] [output_dir] [n_derivations] [n_workers] [random_seed]
+                               [top_level_symbols]
+
+Generation is sharded across worker processes, each of which samples its own derivations (with its
+own random seed and exploration-boost state) and streams them to its own pair of gzipped files.
+The top-level symbols to generate from may be given as a comma-separated list of symbol tags,
+or as 'ALL' to expand every top-level symbol in the grammar.
+"""
+
 import itertools
 import os
 import re
+import sys
+import gzip
 import random
 import operator
 import time
 import pickle
+import multiprocessing
+from productionist import load_json_grammar_specification
 
 
 PATH_TO_JSON_GRAMMAR_SPECIFICATION = (
     #'/Users/jamesryan/Desktop/Expressionist0.51/grammars/load/talktown-player-input_hair-queries-probabilistic.json'
     #'/Users/jamesryan/Desktop/IVA2016/talktown-grammar-used-in-iva-study.json'
-    '/Users/jamesryan/Desktop/Expressionist0.51/grammars/load/talktown-aiide-study-2016.json'
+    #'/Users/jamesryan/Desktop/Expressionist0.51/grammars/load/talktown-aiide-study-2016.json'
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'content', 'talktown-dialogue-nlg.json')
 )
 CURRENT_DATE = time.strftime("%d%b%Y")  # In this format: 29Apr2016
 DIRECTORY_TO_WRITE_OUT_TO = os.getcwd()
@@ -22,53 +37,76 @@ ONLY_RUNTIME_VARIABLE_TOKENS_PICKLE_OUT_FILENAME = 'RUNTIME_VAR_TOKENS-PICKLE_{c
 ALL_TOKENS_PICKLE_OUT_FILENAME = 'ALL-TOKENS-PICKLE_{current_date}'.format(current_date=CURRENT_DATE)
 TRACES_OUT_FILENAME = 'PLAYER-INPUT_HAIR_TRACES_{current_date}'.format(current_date=CURRENT_DATE)
 DERIVATIONS_OUT_FILENAME = 'PLAYER-INPUT_HAIR_DERIVATIONS_{current_date}'.format(current_date=CURRENT_DATE)
-# USE THESE HOOKS TO DO CURRICULUM TRAINING
+# Expand *all* top-level symbols to generate training data, since the default grammar (the bundled
+# dialogue grammar) has none of the player-input symbols below
+TOP_LEVEL_SYMBOLS_TO_GENERATE_FROM = 'ALL'
+# USE THESE HOOKS TO DO CURRICULUM TRAINING (with the player-input hair-queries grammar)
 # TOP_LEVEL_SYMBOLS_TO_GENERATE_FROM = ['player appearance query']  # COLLEGE
 # TOP_LEVEL_SYMBOLS_TO_GENERATE_FROM = ['appearance features']  # HIGH SCHOOL
-TOP_LEVEL_SYMBOLS_TO_GENERATE_FROM = ['reasonable amount of appearance features']  # MIDDLE SCHOOL
-# To expand *all* top-level symbols to generate training data, use this line instead:
-# TOP_LEVEL_SYMBOLS_TO_GENERATE_FROM = 'ALL'
+# TOP_LEVEL_SYMBOLS_TO_GENERATE_FROM = ['reasonable amount of appearance features']  # MIDDLE SCHOOL
 TARGETED_NUMBER_OF_TERMINAL_DERIVATIONS = 1000  # 1317888 produces roughly 1GB of training data (of traces)
 BASE_EXPLORATION_BOOST = 1
 EXPLORATION_BOOST_DECAY_RATE = 0.90
 RANDOM_SEED = 0
+N_WORKERS = multiprocessing.cpu_count()
+WRITE_BUFFER_SIZE = 10000  # Number of lines that a writer holds in memory before writing them out
 
 
 class TrainingDataWriter(object):
     """A production system for generating training data from the JSON specifying an Expressionist grammar."""
 
-    def __init__(self):
-        """Initialize a Productionist object."""
+    def __init__(self, path_to_json_grammar_specification=PATH_TO_JSON_GRAMMAR_SPECIFICATION,
+                 directory_to_write_out_to=DIRECTORY_TO_WRITE_OUT_TO, random_seed=RANDOM_SEED, shard=None,
+                 top_level_symbols_to_generate_from=TOP_LEVEL_SYMBOLS_TO_GENERATE_FROM):
+        """Initialize a TrainingDataWriter object.
+
+        @param top_level_symbols_to_generate_from: A list of the tags of the symbols to expand, or 'ALL'
+                                                   to expand every top-level symbol in the grammar.
+        @param shard: If this writer produces one shard of a larger corpus, the index of that shard, which
+                      will be appended to the names of the files that it writes out.
+        """
+        self.directory_to_write_out_to = directory_to_write_out_to
+        self.random_seed = random_seed
+        self.shard = shard
+        # Each writer samples using its own random number generator, so that writers in different
+        # processes can produce independent samples
+        self.random = random.Random(random_seed)
         self.nonterminal_symbols = self._init_parse_json_grammar_specification(
-            path_to_json_grammar_specification=PATH_TO_JSON_GRAMMAR_SPECIFICATION
+            path_to_json_grammar_specification=path_to_json_grammar_specification
         )
+        self.symbols_by_tag = {symbol.tag: symbol for symbol in self.nonterminal_symbols}
         self._init_resolve_symbol_references_in_all_production_rule_bodies()
         self._init_determine_which_production_rules_are_terminal_or_semiterminal()
         # Set top-level symbols, i.e., the symbols that will be expanded to produce
-        # the training data (this is specified above as a global variable)
-        if TOP_LEVEL_SYMBOLS_TO_GENERATE_FROM == 'ALL':
+        # the training data (this defaults to a global variable specified above)
+        if top_level_symbols_to_generate_from == 'ALL':
             self.top_level_symbols = [symbol for symbol in self.nonterminal_symbols if symbol.top_level]
         else:
             self.top_level_symbols = [
-                symbol for symbol in self.nonterminal_symbols if symbol.tag in TOP_LEVEL_SYMBOLS_TO_GENERATE_FROM
+                symbol for symbol in self.nonterminal_symbols if symbol.tag in top_level_symbols_to_generate_from
             ]
-        # This gets set by produce_and_write_out_a_trace() and then reset by
-        # produce_and_write_out_a_derivation()
+        assert self.top_level_symbols, (
+            "None of the top-level symbols to generate from ({}) are in the grammar {}.".format(
+                top_level_symbols_to_generate_from, path_to_json_grammar_specification
+            )
+        )
+        # These get set by produce_and_write_out_traces() and produce_and_write_out_terminal_derivations();
+        # lines are held in the write buffer until WRITE_BUFFER_SIZE of them have accumulated
         self.out_file = None
+        self.write_buffer = []
         # Determine the total number of generable terminal derivations (summed across top-level
         # symbols only)
         self.total_generable_derivations = sum(
             s.total_number_of_generable_terminal_derivations() for s in self.top_level_symbols
         )
-        # Set the random seed, which will ensure that the sampled derivation traces match up exactly
-        # with the sampled derivations themselves
-        random.seed(RANDOM_SEED)
 
     def _init_parse_json_grammar_specification(self, path_to_json_grammar_specification):
         """Parse a JSON grammar specification exported by Expressionist to instantiate symbols and rules."""
         # Parse the JSON specification to build a dictionary data structure
         symbol_objects = []
-        grammar_dictionary = json.loads(open(path_to_json_grammar_specification).read())
+        grammar_dictionary = load_json_grammar_specification(
+            path_to_json_grammar_specification=path_to_json_grammar_specification
+        )
         nonterminal_symbol_specifications = grammar_dictionary['nonterminals']
         for tag, nonterminal_symbol_specification in nonterminal_symbol_specifications.iteritems():
             top_level = nonterminal_symbol_specification['deep']
@@ -88,20 +126,18 @@ class TrainingDataWriter(object):
 
     def _init_resolve_symbol_references_in_a_rule_body(self, production_rule):
         """Resolve all symbol references in the body of the given rule to point to actual NonterminalSymbol objects."""
-        rule_body_specification = list(production_rule.body_specification)
         rule_body_with_resolved_symbol_references = []
-        for symbol_reference in rule_body_specification:
+        for symbol_reference in production_rule.body_specification:
             if symbol_reference[:2] == '[[' and symbol_reference[-2:] == ']]':
                 # We've encountered a reference to a nonterminal symbol, so we need to resolve this
                 # reference and append to the list that we're building the nonterminal symbol itself
                 symbol_tag = symbol_reference[2:-2]
-                symbol_object = next(symbol for symbol in self.nonterminal_symbols if symbol.tag == symbol_tag)
-                rule_body_with_resolved_symbol_references.append(symbol_object)
+                rule_body_with_resolved_symbol_references.append(self.symbols_by_tag[symbol_tag])
             else:
                 # We've encountered a terminal symbol, so we can just append this string itself
                 # to the list that we're building
                 rule_body_with_resolved_symbol_references.append(symbol_reference)
-            production_rule.body = rule_body_with_resolved_symbol_references
+        production_rule.body = rule_body_with_resolved_symbol_references
 
     def _init_determine_which_production_rules_are_terminal_or_semiterminal(self):
         """Determine which production rules are terminal (yield a single string) or semiterminal (expand
@@ -131,7 +167,7 @@ class TrainingDataWriter(object):
             self.nonterminal_symbols[i].tag: i for i in xrange(len(self.nonterminal_symbols))
         }
         path_to_write_symbol_pickle_to = "{dir}/{filename}".format(
-            dir=DIRECTORY_TO_WRITE_OUT_TO, filename=SYMBOLS_PICKLE_OUT_FILENAME
+            dir=self.directory_to_write_out_to, filename=SYMBOLS_PICKLE_OUT_FILENAME
         )
         symbol_pickle_out_file = open(path_to_write_symbol_pickle_to, 'wb')
         pickle.dump(nonterminal_symbol_to_serialization_id, symbol_pickle_out_file)
@@ -144,7 +180,7 @@ class TrainingDataWriter(object):
         # Write out a pickled dictionary mapping all runtime variables to their replacement
         # expressions, e.g., 'PYTHON_EXPRESSION0'
         path_to_write_runtime_variables_pickle_to = "{dir}/{filename}".format(
-            dir=DIRECTORY_TO_WRITE_OUT_TO, filename=ONLY_RUNTIME_VARIABLE_TOKENS_PICKLE_OUT_FILENAME
+            dir=self.directory_to_write_out_to, filename=ONLY_RUNTIME_VARIABLE_TOKENS_PICKLE_OUT_FILENAME
         )
         runtime_variables_pickle_out_file = open(path_to_write_runtime_variables_pickle_to, 'wb')
         pickle.dump(runtime_variable_replacement_expressions, runtime_variables_pickle_out_file)
@@ -152,7 +188,7 @@ class TrainingDataWriter(object):
         # Write out a pickled dictionary mapping all unique tokens (including replacement expressions
         # for runtime variables) to their serialization IDs
         path_to_write_all_tokens_pickle_to = "{dir}/{filename}".format(
-            dir=DIRECTORY_TO_WRITE_OUT_TO, filename=ALL_TOKENS_PICKLE_OUT_FILENAME
+            dir=self.directory_to_write_out_to, filename=ALL_TOKENS_PICKLE_OUT_FILENAME
         )
         tokens_pickle_out_file = open(path_to_write_all_tokens_pickle_to, 'wb')
         pickle.dump(token_to_serialization_id, tokens_pickle_out_file)
@@ -217,17 +253,48 @@ class TrainingDataWriter(object):
                     token_to_serialization_id[token] = len(token_to_serialization_id)
         return runtime_variable_replacement_expressions, token_to_serialization_id
 
-    def produce_lstm_training_data(self):
+    def produce_lstm_training_data(self, n_derivations=TARGETED_NUMBER_OF_TERMINAL_DERIVATIONS, verbose=True):
         """Produce all the files that constitute our training data."""
-        print "Sampling {targeted_n} examples from a space out {generable_n} generable examples...".format(
-            targeted_n=TARGETED_NUMBER_OF_TERMINAL_DERIVATIONS, generable_n=self.total_generable_derivations
-        )
-        self.produce_and_write_out_traces()
-        # Reset the random seed
-        random.seed(RANDOM_SEED)
-        self.produce_and_write_out_terminal_derivations()
-
-    def produce_and_write_out_traces(self):
+        if verbose:
+            print "Sampling {targeted_n} examples from a space out {generable_n} generable examples...".format(
+                targeted_n=n_derivations, generable_n=self.total_generable_derivations
+            )
+        # Reset the random number generator and the exploration-boost state before each pass, which
+        # will ensure that the sampled derivation traces match up exactly with the sampled derivations
+        # themselves
+        self.reset_sampling_state()
+        self.produce_and_write_out_traces(n_derivations=n_derivations, verbose=verbose)
+        self.reset_sampling_state()
+        self.produce_and_write_out_terminal_derivations(n_derivations=n_derivations, verbose=verbose)
+
+    def reset_sampling_state(self):
+        """Reseed the random number generator and restore every symbol's and rule's exploration-boost state."""
+        self.random.seed(self.random_seed)
+        for symbol in self.nonterminal_symbols:
+            symbol.exploration_boost = BASE_EXPLORATION_BOOST
+            for rule in symbol.production_rules:
+                rule.application_likelihood = rule.application_rate
+
+    def path_to_write_out_to(self, filename):
+        """Return the path to the gzipped file that this writer will write out to for the given base filename."""
+        if self.shard is not None:
+            filename = '{filename}_SHARD-{shard}'.format(filename=filename, shard=self.shard)
+        return "{dir}/{filename}.gz".format(dir=self.directory_to_write_out_to, filename=filename)
+
+    def write(self, line):
+        """Buffer a line to be written out, writing out the buffer if it is full."""
+        self.write_buffer.append(line)
+        if len(self.write_buffer) >= WRITE_BUFFER_SIZE:
+            self.flush()
+
+    def flush(self):
+        """Write out all the lines currently held in the write buffer."""
+        if self.write_buffer:
+            self.out_file.write('\n'.join(self.write_buffer).encode('utf-8'))
+            self.out_file.write('\n')
+            self.write_buffer = []
+
+    def produce_and_write_out_traces(self, n_derivations=TARGETED_NUMBER_OF_TERMINAL_DERIVATIONS, verbose=True):
         """Produce and write out traces for terminal derivations of our top-level symbols.
 
         LSTM stands for long short-term memory, which is a variant of deep learning that
@@ -238,34 +305,31 @@ class TrainingDataWriter(object):
         The format we have settled on for LSTM training expresses traces for terminal derivations, e.g.,
         greet{greeting|word{<Hi>},< >,interlocutor|first|name{<[speaker.belief(interlocutor, 'first name')]>}}
         """
-        # Determine the path to write out to (using global variables specified at the top of this file)
-        path_to_write_out_to = "{dir}/{filename}".format(
-            dir=DIRECTORY_TO_WRITE_OUT_TO, filename=TRACES_OUT_FILENAME
+        self._produce_and_write_out(
+            filename=TRACES_OUT_FILENAME, n_derivations=n_derivations, produce_trace=True, verbose=verbose
         )
-        self.out_file = open(path_to_write_out_to, 'w')
-        one_percent_increment = TARGETED_NUMBER_OF_TERMINAL_DERIVATIONS / 100
-        for i in xrange(TARGETED_NUMBER_OF_TERMINAL_DERIVATIONS):
-            if i > 0 and i % one_percent_increment == 0:
-                print "\t{}% complete".format(i/one_percent_increment)
-            for symbol in self.top_level_symbols:
-                symbol.probabilistically_expand(write_out=True, produce_trace=True)
-        self.out_file.close()
-        print "100% complete"
 
-    def produce_and_write_out_terminal_derivations(self):
+    def produce_and_write_out_terminal_derivations(self, n_derivations=TARGETED_NUMBER_OF_TERMINAL_DERIVATIONS,
+                                                   verbose=True):
         """Produce and write out terminal derivations of our top-level symbols."""
-        path_to_write_out_to = "{dir}/{filename}".format(
-            dir=DIRECTORY_TO_WRITE_OUT_TO, filename=DERIVATIONS_OUT_FILENAME
+        self._produce_and_write_out(
+            filename=DERIVATIONS_OUT_FILENAME, n_derivations=n_derivations, produce_trace=False, verbose=verbose
         )
-        self.out_file = open(path_to_write_out_to, 'w')
-        one_percent_increment = TARGETED_NUMBER_OF_TERMINAL_DERIVATIONS/100
-        for i in xrange(TARGETED_NUMBER_OF_TERMINAL_DERIVATIONS):
-            if i > 0 and i % one_percent_increment == 0:
+
+    def _produce_and_write_out(self, filename, n_derivations, produce_trace, verbose):
+        """Produce and write out traces or terminal derivations of our top-level symbols."""
+        self.out_file = gzip.open(self.path_to_write_out_to(filename=filename), 'wb')
+        one_percent_increment = max(n_derivations/100, 1)
+        for i in xrange(n_derivations):
+            if verbose and i > 0 and i % one_percent_increment == 0:
                 print "\t{}% complete".format(i/one_percent_increment)
             for symbol in self.top_level_symbols:
-                symbol.probabilistically_expand(write_out=True, produce_trace=False)
+                symbol.probabilistically_expand(write_out=True, produce_trace=produce_trace)
+        self.flush()
         self.out_file.close()
-        print "100% complete"
+        self.out_file = None
+        if verbose:
+            print "100% complete"
 
 
 class NonterminalSymbol(object):
@@ -355,7 +419,7 @@ class NonterminalSymbol(object):
             probability_ranges[last_rule_to_have_a_range_attributed][0], 1.0
         )
         # Now probabilistically select a rule
-        x = random.random()
+        x = rules[0].training_data_writer.random.random()
         probabilistically_selected_rule = next(
             rule for rule in rules if probability_ranges[rule][0] <= x <= probability_ranges[rule][1]
         )
@@ -438,8 +502,7 @@ class ProductionRule(object):
         if not write_out:
             return expansion_yielded_by_this_rule
         else:
-            self.training_data_writer.out_file.write("{}\n".format(expansion_yielded_by_this_rule))
-            self.training_data_writer.out_file.flush()
+            self.training_data_writer.write(expansion_yielded_by_this_rule)
 
     def produce_and_write_out_a_derivation(self, write_out=False):
         """Exhaustively produce all terminal derivations yielded by this rule for use as LSTM training data."""
@@ -458,11 +521,60 @@ class ProductionRule(object):
         if not write_out:
             return expansion_yielded_by_this_rule
         else:
-            self.training_data_writer.out_file.write("{}\n".format(expansion_yielded_by_this_rule))
-            self.training_data_writer.out_file.flush()
+            self.training_data_writer.write(expansion_yielded_by_this_rule)
+
+
+def produce_shard(shard, path_to_json_grammar_specification, directory_to_write_out_to, n_derivations,
+                  random_seed, top_level_symbols_to_generate_from):
+    """Produce one shard of the training data in a worker process, and return how long that took."""
+    start_time = time.time()
+    writer = TrainingDataWriter(
+        path_to_json_grammar_specification=path_to_json_grammar_specification,
+        directory_to_write_out_to=directory_to_write_out_to, random_seed=random_seed, shard=shard,
+        top_level_symbols_to_generate_from=top_level_symbols_to_generate_from
+    )
+    writer.produce_lstm_training_data(n_derivations=n_derivations, verbose=False)
+    return n_derivations * len(writer.top_level_symbols), time.time() - start_time
+
+
+def produce_shard_from_arguments(arguments):
+    """Unpack the arguments for produce_shard(), which is necessary because Pool.map() passes only one."""
+    return produce_shard(*arguments)
 
 
 if __name__ == "__main__":
-    writer = TrainingDataWriter()
-    # writer.write_out_pickled_symbol_and_token_serialization_dictionaries()
-    writer.produce_lstm_training_data()
+    path_to_json_grammar_specification = sys.argv[1] if len(sys.argv) > 1 else PATH_TO_JSON_GRAMMAR_SPECIFICATION
+    directory_to_write_out_to = sys.argv[2] if len(sys.argv) > 2 else DIRECTORY_TO_WRITE_OUT_TO
+    n_derivations = int(sys.argv[3]) if len(sys.argv) > 3 else TARGETED_NUMBER_OF_TERMINAL_DERIVATIONS
+    n_workers = int(sys.argv[4]) if len(sys.argv) > 4 else N_WORKERS
+    random_seed = int(sys.argv[5]) if len(sys.argv) > 5 else RANDOM_SEED
+    if len(sys.argv) > 6:
+        top_level_symbols_to_generate_from = 'ALL' if sys.argv[6] == 'ALL' else sys.argv[6].split(',')
+    else:
+        top_level_symbols_to_generate_from = TOP_LEVEL_SYMBOLS_TO_GENERATE_FROM
+    if not os.path.isdir(directory_to_write_out_to):
+        os.makedirs(directory_to_write_out_to)
+    # Split the targeted derivations across the shards, giving each shard its own random seed
+    shard_arguments = [
+        (
+            shard, path_to_json_grammar_specification, directory_to_write_out_to,
+            n_derivations/n_workers + (1 if shard < n_derivations % n_workers else 0), random_seed+shard,
+            top_level_symbols_to_generate_from
+        )
+        for shard in xrange(n_workers)
+    ]
+    start_time = time.time()
+    pool = multiprocessing.Pool(processes=n_workers)
+    shard_results = pool.map(produce_shard_from_arguments, shard_arguments)
+    pool.close()
+    pool.join()
+    seconds = time.time() - start_time
+    for shard, (n_shard_derivations, shard_seconds) in enumerate(shard_results):
+        print "Shard {}: {} derivations in {:.2f}s ({:.1f} derivations/s)".format(
+            shard, n_shard_derivations, shard_seconds, n_shard_derivations/max(shard_seconds, 1e-9)
+        )
+    n_derivations_produced = sum(n_shard_derivations for n_shard_derivations, _ in shard_results)
+    print "Wrote {} traces and {} derivations to {} in {:.2f}s ({:.1f} derivations/s)".format(
+        n_derivations_produced, n_derivations_produced, directory_to_write_out_to, seconds,
+        n_derivations_produced/max(seconds, 1e-9)
+    )
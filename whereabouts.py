@@ -1,13 +1,35 @@
+import bisect
+import calendar
+import datetime
+from array import array
+
+
 class Whereabouts(object):
-    """A collection of a character's true whereabouts on each timestep of his or her life."""
+    """A collection of a character's true whereabouts on each timestep of his or her life.
+
+    Since whereabouts get recorded for every resident on every enacted timestep, they are logged
+    compactly in parallel arrays, rather than as one Whereabout object per timestep; Whereabout
+    objects are only materialized when someone looks one up through the 'date' view.
+    """
+
+    # Occasions are logged as codes that index into this list, which gets extended if
+    # some other occasion (e.g., from config.business_type_to_occasion_for_visit) comes up
+    occasions = [None, 'home', 'work', 'school', 'errand', 'leisure']
+    codes_for_occasions = {occasion: code for code, occasion in enumerate(occasions)}
 
     def __init__(self, person):
         """Initialize a Whereabouts object."""
         self.person = person
-        # This dictionary maps individual timesteps to a person's whereabouts then;
-        # keys will be tuples of the form (ordinal_date, day_or_night_bit), where
-        # day_or_night_bit == 0 if a day timestep else 1
-        self.date = {}
+        # These parallel arrays log, for each timestep on which this person was somewhere, the
+        # timestep itself, the ID of the place they were at, and the code for their occasion
+        # for being there; timesteps are logged as ordinal_date*2 + day_or_night_bit, where
+        # day_or_night_bit == 0 if a day timestep else 1, and so they are in ascending order
+        self.timestep_log = array('i')
+        self.location_id_log = array('i')
+        self.occasion_code_log = array('b')
+        # This view maps individual timesteps to a person's whereabouts then; keys will
+        # be tuples of the form (ordinal_date, day_or_night_bit)
+        self.date = WhereaboutsDateView(whereabouts=self)
 
     def __str__(self):
         """Return string representation."""
@@ -16,19 +38,62 @@ class Whereabouts(object):
         )
 
     def record(self, occasion):
-        """Record this character's current whereabouts by instantiating a Whereabout object."""
+        """Record this character's current whereabouts."""
         game = self.person.game
-        ordinal_date = game.ordinal_date
         day_or_night_bit = 0 if game.time_of_day == 'day' else 1
-        timestep_key = (ordinal_date, day_or_night_bit)
-        self.date[timestep_key] = Whereabout(person=self.person, occasion=occasion)
+        timestep = game.ordinal_date*2 + day_or_night_bit
+        try:
+            occasion_code = Whereabouts.codes_for_occasions[occasion]
+        except KeyError:
+            occasion_code = len(Whereabouts.occasions)
+            Whereabouts.occasions.append(occasion)
+            Whereabouts.codes_for_occasions[occasion] = occasion_code
+        location_id = self.person.location.id
+        previous_location_id = None
+        if not self.timestep_log or timestep > self.timestep_log[-1]:
+            self.timestep_log.append(timestep)
+            self.location_id_log.append(location_id)
+            self.occasion_code_log.append(occasion_code)
+        else:
+            # This person has already been recorded somewhere on this timestep (e.g., because they moved
+            # after their routine was enacted), so overwrite that entry
+            index = bisect.bisect_left(self.timestep_log, timestep)
+            if self.timestep_log[index] == timestep:
+                previous_location_id = self.location_id_log[index]
+                self.location_id_log[index] = location_id
+                self.occasion_code_log[index] = occasion_code
+            else:
+                self.timestep_log.insert(index, timestep)
+                self.location_id_log.insert(index, location_id)
+                self.occasion_code_log.insert(index, occasion_code)
+        # Keep the town-wide index of whereabouts in step, if there is one
+        if game.whereabouts_index is not None:
+            game.whereabouts_index.record(
+                person=self.person, timestep=timestep, location_id=location_id,
+                previous_location_id=previous_location_id
+            )
+
+    def index_of(self, ordinal_date, day_or_night_bit):
+        """Return the index into our logs for the given timestep, or None if nothing was recorded then."""
+        timestep = ordinal_date*2 + day_or_night_bit
+        index = bisect.bisect_left(self.timestep_log, timestep)
+        if index < len(self.timestep_log) and self.timestep_log[index] == timestep:
+            return index
+        return None
+
+    def whereabout(self, index):
+        """Materialize a Whereabout object for the entry at the given index into our logs."""
+        ordinal_date, day_or_night_bit = divmod(self.timestep_log[index], 2)
+        return Whereabout(
+            person=self.person, location=self.person.game.places[self.location_id_log[index]],
+            occasion=Whereabouts.occasions[self.occasion_code_log[index]], ordinal_date=ordinal_date,
+            time_of_day='day' if day_or_night_bit == 0 else 'night'
+        )
 
     def recount(self):
         """Pretty-print this person's entire whereabouts."""
-        timesteps = self.date.keys()
-        timesteps.sort(key=lambda step: (step[0], step[1]))
-        for timestep in timesteps:
-            whereabout = self.date[timestep]
+        for index in xrange(len(self.timestep_log)):
+            whereabout = self.whereabout(index=index)
             print '{},\t{}:\t{}\t({})'.format(
                 whereabout.date[7:] if whereabout.time_of_day == 'day' else whereabout.date[9:],
                 whereabout.time_of_day, whereabout.location.name, whereabout.occasion
@@ -40,24 +105,171 @@ class Whereabouts(object):
         game = self.person.game
         ordinal_date = game.ordinal_date
         day_or_night_bit = 0 if game.time_of_day == 'day' else 1
-        timestep_key = (ordinal_date, day_or_night_bit)
-        return self.date[timestep_key].occasion
+        return self.date[(ordinal_date, day_or_night_bit)].occasion
+
+
+class WhereaboutsIndex(object):
+    """A town-wide inverted index of true whereabouts, mapping timesteps and places to the people there.
+
+    This gets built up as people's whereabouts are recorded (i.e., as routines are enacted), and it
+    allows for questions like "who was at the bar the night of X?" to be answered without scanning
+    every person's whereabouts. People's beliefs about one another's whereabouts (which may be false)
+    are indexed as well, which allows for the same question to be answered according to what someone
+    believes without scanning all their mental models. Timesteps are represented as in
+    Whereabouts.timestep_log. This index is only maintained if config.index_whereabouts is True.
+    """
+
+    def __init__(self, game):
+        """Initialize a WhereaboutsIndex object."""
+        self.game = game
+        # Maps timesteps to dictionaries mapping place IDs to lists of the people at that place then
+        self.people_at_timestep = {}
+        # Maps place IDs to the timesteps (in ascending order) on which anyone was there, which
+        # allows for range queries over dates
+        self.timesteps_by_location = {}
+        # Maps (owner ID, timestep, place ID) tuples to the set of people whom that owner believes
+        # were at that place then; this gets maintained by WhereaboutsBelief.adopt_facet()
+        self.believed_people_at = {}
+
+    def __str__(self):
+        """Return string representation."""
+        return "Index of whereabouts over {} timesteps and {} places".format(
+            len(self.people_at_timestep), len(self.timesteps_by_location)
+        )
+
+    def record(self, person, timestep, location_id, previous_location_id=None):
+        """Index a person being at a place on a timestep, replacing where they were previously recorded then."""
+        people_at_places_then = self.people_at_timestep.setdefault(timestep, {})
+        if previous_location_id is not None:
+            people_at_places_then[previous_location_id].remove(person)
+        if location_id not in people_at_places_then:
+            people_at_places_then[location_id] = []
+            timesteps_at_that_place = self.timesteps_by_location.setdefault(location_id, array('i'))
+            if not timesteps_at_that_place or timestep > timesteps_at_that_place[-1]:
+                timesteps_at_that_place.append(timestep)
+            else:
+                index = bisect.bisect_left(timesteps_at_that_place, timestep)
+                if index == len(timesteps_at_that_place) or timesteps_at_that_place[index] != timestep:
+                    timesteps_at_that_place.insert(index, timestep)
+        people_at_places_then[location_id].append(person)
+
+    def record_belief(self, owner, person, timestep, location, previous_location=None):
+        """Index someone's belief that a person was at a place on a timestep, replacing their belief about
+        where that person was previously believed to have been then.
+        """
+        if previous_location is not None:
+            key = (owner.id, timestep, previous_location.id)
+            self.believed_people_at[key].discard(person)
+            if not self.believed_people_at[key]:
+                del self.believed_people_at[key]
+        if location is not None:
+            self.believed_people_at.setdefault((owner.id, timestep, location.id), set()).add(person)
+
+    def people_believed_at(self, owner, location, ordinal_date, day_or_night_bit):
+        """Return the set of people whom the given owner believes were at the given place on the given timestep."""
+        timestep = ordinal_date*2 + day_or_night_bit
+        return set(self.believed_people_at.get((owner.id, timestep, location.id), ()))
+
+    def people_at(self, location, ordinal_date, day_or_night_bit):
+        """Return the set of people who were at the given place on the given timestep."""
+        timestep = ordinal_date*2 + day_or_night_bit
+        return set(self.people_at_timestep.get(timestep, {}).get(location.id, ()))
+
+    def visits(self, location, start_ordinal_date, end_ordinal_date):
+        """Return a list of ((ordinal_date, day_or_night_bit), people) tuples for each timestep between the
+        given dates (inclusive) on which anyone was at the given place.
+        """
+        timesteps_at_that_place = self.timesteps_by_location.get(location.id, ())
+        start_index = bisect.bisect_left(timesteps_at_that_place, start_ordinal_date*2)
+        end_index = bisect.bisect_right(timesteps_at_that_place, end_ordinal_date*2 + 1)
+        visits = []
+        for timestep in timesteps_at_that_place[start_index:end_index]:
+            people_there_then = self.people_at_timestep[timestep][location.id]
+            if people_there_then:
+                visits.append((divmod(timestep, 2), set(people_there_then)))
+        return visits
+
+    def co_present_with(self, person, start_ordinal_date, end_ordinal_date):
+        """Return a dictionary mapping each person who was co-present with the given person between the
+        given dates (inclusive) to a list of the (ordinal_date, day_or_night_bit, location) tuples
+        specifying when and where that was the case.
+        """
+        whereabouts = person.whereabouts
+        start_index = bisect.bisect_left(whereabouts.timestep_log, start_ordinal_date*2)
+        end_index = bisect.bisect_right(whereabouts.timestep_log, end_ordinal_date*2 + 1)
+        co_present = {}
+        for index in xrange(start_index, end_index):
+            timestep, location_id = whereabouts.timestep_log[index], whereabouts.location_id_log[index]
+            people_there_then = self.people_at_timestep[timestep][location_id]
+            if len(people_there_then) > 1:
+                ordinal_date, day_or_night_bit = divmod(timestep, 2)
+                location = self.game.places[location_id]
+                for other_person in people_there_then:
+                    if other_person is not person:
+                        co_present.setdefault(other_person, []).append((ordinal_date, day_or_night_bit, location))
+        return co_present
+
+
+class WhereaboutsDateView(object):
+    """A read-only, dictionary-like view of a character's whereabouts that is keyed by timestep.
+
+    Keys are tuples of the form (ordinal_date, day_or_night_bit), and values are Whereabout
+    objects, which are materialized from the Whereabouts logs as they are looked up.
+    """
+
+    def __init__(self, whereabouts):
+        """Initialize a WhereaboutsDateView object."""
+        self.whereabouts = whereabouts
+
+    def __getitem__(self, timestep_key):
+        """Return the Whereabout for the given timestep, raising a KeyError if there isn't one."""
+        index = self.whereabouts.index_of(*timestep_key)
+        if index is None:
+            raise KeyError(timestep_key)
+        return self.whereabouts.whereabout(index=index)
+
+    def __contains__(self, timestep_key):
+        """Return whether a whereabout was recorded for the given timestep."""
+        return self.whereabouts.index_of(*timestep_key) is not None
+
+    def __len__(self):
+        """Return the number of timesteps for which a whereabout was recorded."""
+        return len(self.whereabouts.timestep_log)
+
+    def __iter__(self):
+        """Iterate over the timesteps for which a whereabout was recorded, in order."""
+        for timestep in self.whereabouts.timestep_log:
+            yield divmod(timestep, 2)
+
+    def keys(self):
+        """Return the timesteps for which a whereabout was recorded, in order."""
+        return list(self)
+
+    def get(self, timestep_key, default=None):
+        """Return the Whereabout for the given timestep, or the default if there isn't one."""
+        index = self.whereabouts.index_of(*timestep_key)
+        if index is None:
+            return default
+        return self.whereabouts.whereabout(index=index)
 
 
 class Whereabout(object):
     """A character's true location on a single timestep, with associated metadata."""
 
-    def __init__(self, person, occasion):
+    def __init__(self, person, location, occasion, ordinal_date, time_of_day):
         """Initialize a Whereabout object."""
         self.person = person
-        self.location = person.location
+        self.location = location
         # Attribute the occasion for this character being at the location on
         # this timestep; will either be 'work', 'school', 'home', 'errand', or 'leisure'
         self.occasion = occasion
         # Attribute metadata about the timestep of this whereabout
-        self.date = person.game.date
-        self.ordinal_date = person.game.ordinal_date
-        self.time_of_day = person.game.time_of_day
+        date = datetime.date.fromordinal(ordinal_date)
+        self.date = "{} of {} {}, {}".format(
+            time_of_day.title(), calendar.month_name[date.month], date.day, date.year
+        )
+        self.ordinal_date = ordinal_date
+        self.time_of_day = time_of_day
 
     def __str__(self):
         """Return string representation."""
@@ -86,6 +298,3 @@ class Whereabout(object):
                 self.location.name, self.location.address,
                 self.date[0].lower()+self.date[1:]
             )
-
-
-